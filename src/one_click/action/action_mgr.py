@@ -16,7 +16,7 @@
 
 from action_utils import ActionUtiles
 from one_click.common.constants import Constants as Const
-from time import clock
+from time import time
 import uuid
 import json
 import os
@@ -85,7 +85,8 @@ class ActionMngr(object):
                 '-o', 'execute',
                 '-t', 'template_name=%s' % template_name,
                 '-f', r"%s" % payload_file_path,
-                '-b']
+                '-b',
+                '--output', 'ndjson']
 
     def _generate_template_cmds(self):
         template_cmds = []
@@ -114,9 +115,9 @@ class ActionMngr(object):
     def run_next_template(self):
         self.current_template_index += 1
         cmd = self.template_cmds[self.current_template_index]
-        start = clock()
+        start = time()
         ret_val, output, error = ActionUtiles.exec_timeout(cmd)
-        end = clock()
+        end = time()
         return ret_val, output, error, end - start
 
     def get_num_of_templates(self):
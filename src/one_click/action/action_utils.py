@@ -14,15 +14,24 @@
 @date:   Dec 30, 2015
 """
 
+import os
 import subprocess
+import sys
 import threading
-import re
 from time import sleep
 
+# The SDK modules import each other as top level modules (as they do when
+# the SDK scripts run), so the SDK directory is added to the module path
+SDK_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "sdk")
+if SDK_PATH not in sys.path:
+    sys.path.append(SDK_PATH)
+
+from infra.neo_connection import NeoConnection
+from neo_get_data import getData
+
 
 class ActionUtiles(object):
 
-    IP_REGEX = "\'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\'"
     SDK_LOCATION = r"src\one_click\sdk"
 
     def __init__(self):
@@ -69,21 +78,19 @@ class ActionUtiles(object):
     def discover_systems(neo_ip, username, password):
 
         num_of_attempts = 0
-        system_ips = []
         while num_of_attempts < 3:
-            commands = [
-                'python', r'%s\neo_get_data.py' % ActionUtiles.SDK_LOCATION,
-                '-s', neo_ip,
-                '-u', username,
-                '-p', password,
-                '-o', 'systems']
-            ret_val, output, error = ActionUtiles.exec_timeout(commands)
-            if ret_val == 0:
-                system_ips = re.findall(ActionUtiles.IP_REGEX, output)
+            try:
+                neo_session = NeoConnection(username, password, neo_ip)
+                system_ips = [system["ip_address"]
+                              for system in getData(neo_session, "systems")
+                              if system.get("ip_address")]
+            except Exception:
+                system_ips = None
+            if system_ips is not None:
                 if len(system_ips) == 0:
                     return 1, "Couldn't find any systems"
                 else:
-                    return 0, map(lambda x: x.strip("'"), system_ips)
+                    return 0, system_ips
             num_of_attempts += 1
             sleep(1)
 
@@ -18,7 +18,7 @@ from one_click.tracker.tracker import Tracker
 from one_click.action.action_mgr import ActionMngr
 import sys
 from os.path import isfile
-from time import clock
+from time import time
 from one_click.common.utils import Utils
 
 SUCCESS = 0
@@ -48,7 +48,7 @@ def prepare_to_execute(tracker, execution_mgr):
 def execute(execution_mgr):
     execution_mgr.analyze_data()
     all_provisioning_results = []
-    start_run = clock()
+    start_run = time()
     while execution_mgr.has_next():
         template_name = execution_mgr.get_latest_template_name()
         print "---> Running template '%s'" % template_name
@@ -83,7 +83,7 @@ def execute(execution_mgr):
             print "ERROR: Couldn't connect to NEO\n"
             execution_mgr.clean()
             sys.exit(1)
-    end_run = clock()
+    end_run = time()
 
     print "*** Status Summary ***\n"
     print "%-15s %s" % ("Template", "Status")
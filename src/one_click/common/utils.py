@@ -14,17 +14,13 @@
 @date:   Dec 30, 2015
 """
 
-import re
+import json
 
 
 class Utils(object):
     """
     """
 
-    PROVISIONING_SUMMARY_REGEX = r'"Summary": "(.*)"'
-    PROVISIONING_STATUS_CODE_REGEX = r"HTTP response status code: (.*)"
-    PROVISIONING_STATUS_REGEX = r'"Status": "(.*)"'
-
     @staticmethod
     def eraseDictValues(dictionary):
         for key, value in dictionary.iteritems():
@@ -33,20 +29,48 @@ class Utils(object):
             else:
                 dictionary[key] = None
 
+    @staticmethod
+    def parse_records(data):
+        """
+        Yields the records of an SDK output in 'ndjson' format
+        """
+        for line in data.splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and "record" in record:
+                yield record
+
+    @classmethod
+    def _parse_jobs(cls, data):
+        """
+        Returns the job a blocking provisioning ran, followed by its sub
+        jobs
+        """
+        jobs = []
+        for record in cls.parse_records(data):
+            if record["record"] == "job":
+                jobs.append(record["data"])
+            elif record["record"] == "sub_jobs" and \
+                    isinstance(record["data"], list):
+                jobs.extend(record["data"])
+        return jobs
+
     @classmethod
     def parse_summary(cls, data):
-        summaries = re.findall(cls.PROVISIONING_SUMMARY_REGEX, data)
-        return [raw_summary.replace("\\n", "\n").replace("\\t", "\t")
-                for raw_summary in summaries]
+        return [job.get("Summary") or "" for job in cls._parse_jobs(data)]
 
     @classmethod
     def parse_status_code(cls, data):
-        match = re.search(cls.PROVISIONING_STATUS_CODE_REGEX, data)
-        return None if match is None else match.group(1).strip()
+        for record in cls.parse_records(data):
+            if record["record"] == "response":
+                return str(record["status"])
+        return None
 
     @classmethod
     def parse_status(cls, data):
-        return re.findall(cls.PROVISIONING_STATUS_REGEX, data)
+        return [job.get("Status") or "" for job in cls._parse_jobs(data)]
 
     @staticmethod
     def camelcase_text(text):
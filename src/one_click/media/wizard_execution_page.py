@@ -17,7 +17,7 @@
 import wx
 import sys
 from wx import richtext as rt
-from time import clock
+from time import time
 from one_click.common.utils import Utils
 from one_click.common.constants import Constants as Const
 
@@ -77,7 +77,7 @@ class WizardExecutionPage(wx.Panel):
         gauge_delta = self.MAX_GAUGE_VALUE / \
             float(execution_mgr.get_num_of_templates())
         self._increment_gauge(self.GAUGE_INIT_VALUE)
-        start_run = clock()
+        start_run = time()
         while execution_mgr.has_next():
             template_name = execution_mgr.get_latest_template_name()
             self._console_output("---> Running template '%s'" % template_name)
@@ -119,7 +119,7 @@ class WizardExecutionPage(wx.Panel):
                                      Const.TEXT_COLOUR_ERROR)
                 execution_mgr.clean()
                 sys.exit(1)
-        end_run = clock()
+        end_run = time()
 
         self._console_output("*** Status Summary ***\n")
         self._console_output("%-15s %s" % ("Template", "Status"))
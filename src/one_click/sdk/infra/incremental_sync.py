@@ -0,0 +1,162 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+import httplib
+from rfc822 import parsedate_tz, mktime_tz
+from url import URL
+from json_stream import JsonStreamDecoder
+from sdk_exceptions import RequestFailed
+
+
+class IncrementalSync(object):
+    """
+    Fetches the records of a NEO collection that are new since the previous
+    run, whose position is kept by a SyncCursor, so a run costs O(new
+    records) instead of O(history). The first run (or a run after the
+    cursor was reset) fetches the whole collection.
+
+    The records are decoded one by one while the response is read. The
+    cursor is saved by commit(), once the caller stored the records, so a
+    run that fails before is repeated by the next one: a record may be
+    handed over twice, but is never lost.
+
+    This is an abstract class; the derived classes define the cursor.
+    """
+
+    def __init__(self, neo_session, url, cursor):
+        self._neo_session = neo_session
+        self._url = url
+        self._cursor = cursor
+        self._next_state = None
+
+    def _requestUrl(self, state):
+        '''
+        Returns the url of the records that are new since the cursor state
+        (None - no previous run)
+        '''
+        raise NotImplementedError()
+
+    def _nextState(self, state, response):
+        '''
+        Returns the initial state of the cursor of this run
+        '''
+        raise NotImplementedError()
+
+    def _isNew(self, record, state, next_state):
+        '''
+        Returns True if the record is new since the cursor state, and moves
+        the cursor of this run past it
+        '''
+        raise NotImplementedError()
+
+    def run(self, on_record):
+        '''
+        Calls 'on_record(record)' with each new record, in the order NEO
+        returned them. Returns the number of new records.
+        '''
+        state = self._cursor.load()
+        response = self._neo_session.get(self._requestUrl(state))
+        if response.status != httplib.OK:
+            raise RequestFailed("NEO returned status %s: %s" %
+                                (response.status, response.read()))
+        next_state = self._nextState(state, response)
+        count = 0
+        for record in JsonStreamDecoder(response).iterItems():
+            if self._isNew(record, state, next_state):
+                on_record(record)
+                count += 1
+        self._next_state = next_state
+        return count
+
+    def commit(self):
+        '''
+        Moves the cursor past the records of the last run
+        '''
+        if self._next_state is not None:
+            self._cursor.save(self._next_state)
+
+
+class IdSync(IncrementalSync):
+    """
+    Syncs a collection whose records are immutable and have increasing
+    ids (e.g. events and logs). The cursor is the highest id fetched so
+    far, sent as 'since_id'. The records are also filtered by it, in case
+    NEO ignores the parameter, whatever order they're returned in.
+    """
+
+    def _requestUrl(self, state):
+        if state is None:
+            return self._url
+        return "%s?since_id=%s" % (self._url, state["last_id"])
+
+    def _nextState(self, state, response):
+        return {"last_id": None if state is None else state["last_id"]}
+
+    def _isNew(self, record, state, next_state):
+        record_id = int(record["ID"])
+        if state is not None and state["last_id"] is not None and \
+                record_id <= state["last_id"]:
+            return False
+        if next_state["last_id"] is None or \
+                record_id > next_state["last_id"]:
+            next_state["last_id"] = record_id
+        return True
+
+
+class ModifiedSinceSync(IncrementalSync):
+    """
+    Syncs a collection whose records change (e.g. jobs, whose status and
+    progress are updated). The cursor is the time of the previous run on
+    the NEO clock (taken from the 'Date' header), sent as
+    'modified_since', and a record is new if its status or progress
+    changed since it was last fetched.
+
+    The 'Date' header has a resolution of one second, so the records
+    modified in the last second of a run are fetched again by the next
+    one. The cursor keeps their (status, progress) so they aren't handed
+    over twice, which also filters the unchanged records if NEO ignores
+    the parameter.
+    """
+
+    MODIFIED_SINCE_MARGIN = 1
+
+    def _requestUrl(self, state):
+        if state is None or state["modified_since"] is None:
+            return self._url
+        return "%s?modified_since=%d" % (self._url, state["modified_since"])
+
+    def _nextState(self, state, response):
+        date = parsedate_tz(response.getheader("Date") or "")
+        if date is not None:
+            modified_since = mktime_tz(date) - self.MODIFIED_SINCE_MARGIN
+        elif state is not None:
+            modified_since = state["modified_since"]
+        else:
+            modified_since = None
+        return {"modified_since": modified_since, "versions": {}}
+
+    def _isNew(self, record, state, next_state):
+        record_id = str(record["ID"])
+        version = [record.get("Status"), record.get("Progress")]
+        next_state["versions"][record_id] = version
+        return state is None or state["versions"].get(record_id) != version
+
+
+# Maps each collection that can be synced to its (url, IncrementalSync
+# class). The urls are relative to the NEO base url.
+SYNC_COLLECTIONS = {
+    "events": (URL.EVENTS_URL, IdSync),
+    "logs": (URL.LOGS_URL, IdSync),
+    "jobs": (URL.JOBS_URL, ModifiedSinceSync),
+}
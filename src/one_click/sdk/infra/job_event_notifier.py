@@ -0,0 +1,217 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+import httplib
+import json
+import threading
+import time
+from url import URL
+from job_future import JobPoller
+from job_poll_policy import JobPollPolicy
+from json_stream import JsonStreamDecoder
+from sdk_exceptions import RequestFailed
+
+
+class JobEventNotifier(JobPoller):
+    """
+    A JobPoller that follows the NEO events instead of polling the jobs.
+
+    Every tick fetches the events that are newer than a cursor (the id of
+    the newest event seen). Only the watched jobs that events were reported
+    for are fetched, to confirm they ended. All the watched jobs are polled
+    only when no event was reported for SILENCE_TIMEOUT seconds, so a
+    missed event delays the end of a job but never loses it. The ticks
+    back off from EVENTS_INTERVAL to MAX_EVENTS_INTERVAL while no watched
+    job is reported.
+
+    The cursor starts at the newest event, which is searched for without
+    downloading the event history, and is sent as 'since_id'. If NEO
+    ignores the parameter, following the events would download the whole
+    history every tick, so the jobs are polled instead.
+    """
+
+    # The times are in seconds
+    EVENTS_INTERVAL = 0.5
+    MAX_EVENTS_INTERVAL = 2
+    SILENCE_TIMEOUT = 10
+
+    JOB_OBJECT_TYPE = "Job"
+
+    def __init__(self, neo_session, base_url="/neo"):
+        super(JobEventNotifier, self).__init__(neo_session, base_url)
+        self._neo_session = neo_session
+        self._events_url = base_url + URL.EVENTS_URL
+        self._cursor = None
+        self._since_id_ignored = False
+
+    @classmethod
+    def _jobId(cls, event):
+        '''
+        Returns the id of the job an event was reported for (or None)
+        '''
+        if event.get("Object Type") != cls.JOB_OBJECT_TYPE or \
+                not str(event.get("Object ID")).isdigit():
+            return None
+        return int(event["Object ID"])
+
+    def _newerEventIds(self, since_id):
+        '''
+        Returns the id of an event newer than the given id (several ids if
+        NEO ignores 'limit'), or an empty list if there is none
+        '''
+        response = self._neo_session.get("%s?since_id=%d&limit=1" %
+                                         (self._events_url, since_id))
+        body = response.read()
+        if response.status != httplib.OK:
+            raise RequestFailed("NEO returned status %s: %s" %
+                                (response.status, body))
+        event_ids = [int(event["ID"]) for event in json.loads(body)]
+        if any(event_id <= since_id for event_id in event_ids):
+            self._since_id_ignored = True
+        return event_ids
+
+    def _seedCursor(self):
+        '''
+        Moves the cursor to the newest event. Its id is searched for with
+        requests of a single event newer than a guess, which doubles until
+        there is none and is then bisected, so it takes O(log(id)) small
+        requests whatever the order NEO returns the events in.
+        '''
+        # 'low' is the id of an event (or 0), and no event is newer than
+        # 'high' once it's known
+        low, high, step = 0, None, 1
+        while high is None or low < high:
+            if high is None:
+                since_id = low + step - 1
+                step *= 2
+            else:
+                since_id = (low + high + 1) // 2 - 1
+            event_ids = self._newerEventIds(since_id)
+            if self._since_id_ignored:
+                return
+            if len(event_ids) > 1:
+                # NEO ignores 'limit', so these are all the newer events
+                low = max(event_ids)
+                break
+            if event_ids:
+                low = event_ids[0]
+            else:
+                high = since_id
+        self._cursor = low
+
+    def _fetchEndedJobIds(self):
+        '''
+        Fetches the events that are newer than the cursor, moves the cursor
+        and returns the ids of the jobs the events were reported for
+        '''
+        response = self._neo_session.get("%s?since_id=%d" %
+                                         (self._events_url, self._cursor))
+        if response.status != httplib.OK:
+            response.read()
+            return set()
+
+        newest = self._cursor
+        job_ids = set()
+        for event in JsonStreamDecoder(response).iterItems():
+            event_id = int(event["ID"])
+            if event_id <= self._cursor:
+                self._since_id_ignored = True
+                response.close()
+                return set()
+            newest = max(newest, event_id)
+            job_id = self._jobId(event)
+            if job_id is not None:
+                job_ids.add(job_id)
+        self._cursor = newest
+        return job_ids
+
+    def _eventsPolicy(self):
+        return JobPollPolicy(deadline=None,
+                             initial_interval=self.EVENTS_INTERVAL,
+                             max_interval=self.MAX_EVENTS_INTERVAL,
+                             use_eta=False)
+
+    def _run(self):
+        while self._cursor is None and not self._since_id_ignored:
+            # The jobs submitted meanwhile are polled by the first tick
+            self._wakeup.clear()
+            try:
+                self._seedCursor()
+                self._poll_errors = 0
+            except Exception as exc:
+                self._pollFailed(exc)
+                if self._stopIfIdle():
+                    return
+                self._wakeup.wait(self._backoff(self.POLL_ERROR_BACKOFF))
+
+        last_poll = 0
+        policy = self._eventsPolicy()
+        while not self._since_id_ignored:
+            try:
+                if self._wakeup.is_set():
+                    # Jobs that were submitted may have ended before the
+                    # cursor, so they are polled once
+                    self._wakeup.clear()
+                    last_poll = 0
+                    policy = self._eventsPolicy()
+                job_ids = self._fetchEndedJobIds()
+                job_ids.intersection_update(self._watcher.pending())
+                if job_ids:
+                    policy = self._eventsPolicy()
+                if time.time() - last_poll >= self.SILENCE_TIMEOUT:
+                    self._watcher.poll()
+                    last_poll = time.time()
+                elif job_ids:
+                    self._watcher.poll(job_ids)
+                    last_poll = time.time()
+                self._poll_errors = 0
+            except Exception as exc:
+                self._pollFailed(exc)
+            if self._stopIfIdle():
+                return
+            self._wakeup.wait(self._backoff(policy.nextInterval()))
+
+        # NEO ignores 'since_id'
+        super(JobEventNotifier, self)._run()
+
+
+class JobPushNotifier(JobEventNotifier):
+    """
+    A JobEventNotifier fed by the events that NEO pushes to a
+    NeoWebhookReceiver, so NEO is only polled when no event of a watched
+    job was pushed for SILENCE_TIMEOUT seconds.
+    """
+
+    # Checking the pushed events costs nothing, so the ticks don't back off
+    EVENTS_INTERVAL = 0.1
+    MAX_EVENTS_INTERVAL = 0.1
+    SILENCE_TIMEOUT = 60
+
+    def __init__(self, neo_session, receiver, base_url="/neo"):
+        super(JobPushNotifier, self).__init__(neo_session, base_url)
+        self._pushed_lock = threading.Lock()
+        self._pushed_job_ids = set()
+        self._cursor = 0
+        receiver.addListener(self._onEvent)
+
+    def _onEvent(self, event):
+        job_id = self._jobId(event)
+        if job_id is not None:
+            with self._pushed_lock:
+                self._pushed_job_ids.add(job_id)
+
+    def _fetchEndedJobIds(self):
+        with self._pushed_lock:
+            job_ids, self._pushed_job_ids = self._pushed_job_ids, set()
+        return job_ids
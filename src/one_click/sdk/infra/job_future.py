@@ -0,0 +1,273 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+import Queue
+import threading
+import time
+from job_watcher import JobWatcher
+from job_poll_policy import JobPollPolicy
+from sdk_exceptions import JobTimeout, JobCancelled
+
+
+class JobFuture(object):
+    """
+    A handle to a NEO job that is running, whose status is tracked by a
+    JobPoller.
+
+    result() blocks until the job ended and returns the job data (a dict as
+    returned by NEO, whatever the final status is). cancel() stops tracking
+    the job: NEO has no REST API to abort a job, so the job itself keeps
+    running on the server.
+    """
+
+    def __init__(self, job_id, poller):
+        self.job_id = int(job_id)
+        self._poller = poller
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._job = None
+        self._exception = None
+        self._cancelled = False
+        self._callbacks = []
+
+    def done(self):
+        return self._done.is_set()
+
+    def cancelled(self):
+        return self._cancelled
+
+    def succeeded(self):
+        return self.done() and self._job is not None and \
+            self._job.get("Status") == "Completed"
+
+    def cancel(self):
+        '''
+        Stops waiting for the job. Returns False if the job already ended.
+        '''
+        if not self._poller.cancel(self):
+            return False
+        self._finish(cancelled=True)
+        return True
+
+    def _wait(self, timeout):
+        # Event.wait() without a timeout can't be interrupted by Ctrl-C
+        deadline = None if timeout is None else time.time() + timeout
+        while not self._done.is_set():
+            remaining = 1 if deadline is None else deadline - time.time()
+            if remaining <= 0:
+                raise JobTimeout("Job %s didn't end within %s seconds" %
+                                 (self.job_id, timeout))
+            self._done.wait(min(remaining, 1))
+
+    def result(self, timeout=None):
+        self._wait(timeout)
+        if self._cancelled:
+            raise JobCancelled("Job %s was cancelled" % self.job_id)
+        if self._exception is not None:
+            raise self._exception
+        return self._job
+
+    def exception(self, timeout=None):
+        self._wait(timeout)
+        return self._exception
+
+    def addDoneCallback(self, callback):
+        '''
+        Calls 'callback(future)' once the job ended (or right away if it
+        already did)
+        '''
+        with self._lock:
+            if not self._done.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def _finish(self, job=None, exception=None, cancelled=False):
+        with self._lock:
+            if self._done.is_set():
+                return
+            self._job = job
+            self._exception = exception
+            self._cancelled = cancelled
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+
+class JobPoller(object):
+    """
+    Tracks the jobs of JobFutures with a single background thread, which
+    polls all of them together with a JobWatcher, and runs only while there
+    are jobs to track.
+
+    A poll that fails (e.g. NEO restarts) is retried with a growing delay,
+    from POLL_ERROR_BACKOFF up to MAX_POLL_ERROR_BACKOFF, and the futures
+    are failed only once MAX_POLL_ERRORS polls in a row failed.
+    """
+
+    # The times are in seconds
+    MAX_POLL_ERRORS = 5
+    POLL_ERROR_BACKOFF = 1
+    MAX_POLL_ERROR_BACKOFF = 8
+
+    def __init__(self, neo_session, base_url="/neo"):
+        self._watcher = JobWatcher(neo_session, base_url)
+        self._lock = threading.Lock()
+        self._futures = {}
+        self._thread = None
+        self._wakeup = threading.Event()
+        self._poll_errors = 0
+
+    def submit(self, job_id):
+        '''
+        Returns a JobFuture of the given job (the same one if the job was
+        already submitted and didn't end yet)
+        '''
+        with self._lock:
+            future = self._futures.get(int(job_id))
+            if future is not None:
+                return future
+            future = JobFuture(job_id, self)
+            self._futures[future.job_id] = future
+            self._watcher.watch(future.job_id, self._jobEnded,
+                                self._jobFailed)
+            # New jobs are polled right away, not after the backed off
+            # interval of the older ones
+            self._wakeup.set()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                                                name="JobPoller")
+                self._thread.daemon = True
+                self._thread.start()
+        return future
+
+    def cancel(self, future):
+        with self._lock:
+            self._futures.pop(future.job_id, None)
+            return self._watcher.unwatch(future.job_id)
+
+    def _jobEnded(self, job):
+        with self._lock:
+            future = self._futures.pop(int(job["ID"]), None)
+        if future is not None:
+            future._finish(job)
+
+    def _jobFailed(self, job_id, exception):
+        # e.g. the job was deleted
+        with self._lock:
+            future = self._futures.pop(job_id, None)
+        if future is not None:
+            future._finish(exception=exception)
+
+    def _failAll(self, exception):
+        with self._lock:
+            futures, self._futures = self._futures.values(), {}
+            for future in futures:
+                self._watcher.unwatch(future.job_id)
+        for future in futures:
+            future._finish(exception=exception)
+
+    def _pollFailed(self, exception):
+        '''
+        Counts a poll that failed, and fails all the futures once
+        MAX_POLL_ERRORS polls in a row failed
+        '''
+        self._poll_errors += 1
+        if self._poll_errors >= self.MAX_POLL_ERRORS:
+            # e.g. NEO is unreachable. The jobs can't be tracked anymore.
+            self._poll_errors = 0
+            self._failAll(exception)
+
+    def _backoff(self, interval):
+        '''
+        Returns the time to wait before the next poll, which is longer
+        while the polls fail
+        '''
+        if not self._poll_errors:
+            return interval
+        return max(interval, min(self.POLL_ERROR_BACKOFF *
+                                 2 ** (self._poll_errors - 1),
+                                 self.MAX_POLL_ERROR_BACKOFF))
+
+    def _run(self):
+        policy = None
+        while True:
+            if policy is None or self._wakeup.is_set():
+                self._wakeup.clear()
+                policy = JobPollPolicy(deadline=None)
+            try:
+                self._watcher.poll()
+                self._poll_errors = 0
+            except Exception as exc:
+                self._pollFailed(exc)
+            if self._stopIfIdle():
+                return
+            self._wakeup.wait(self._backoff(
+                policy.nextInterval(self._watcher.progress())))
+
+    def _stopIfIdle(self):
+        '''
+        Marks the thread as stopped if there are no jobs to track.
+        Returns True if it should stop.
+        '''
+        with self._lock:
+            if self._watcher.pending():
+                return False
+            self._thread = None
+            return True
+
+
+def waitAll(futures, timeout=None):
+    '''
+    Waits until all the given jobs ended, or the timeout (in seconds)
+    passed. Returns a (done, not_done) tuple of sets of futures.
+    '''
+    deadline = None if timeout is None else time.time() + timeout
+    for future in futures:
+        remaining = None if deadline is None else \
+            max(deadline - time.time(), 0)
+        try:
+            future._wait(remaining)
+        except JobTimeout:
+            break
+    done = set(future for future in futures if future.done())
+    return done, set(futures) - done
+
+
+def asCompleted(futures, timeout=None):
+    '''
+    Yields the given futures as their jobs end. Raises JobTimeout if some
+    jobs didn't end within the timeout (in seconds).
+    '''
+    ended = Queue.Queue()
+    pending = set(futures)
+    for future in pending:
+        future.addDoneCallback(ended.put)
+
+    deadline = None if timeout is None else time.time() + timeout
+    while pending:
+        remaining = 1 if deadline is None else deadline - time.time()
+        try:
+            if remaining <= 0:
+                raise Queue.Empty()
+            future = ended.get(timeout=min(remaining, 1))
+        except Queue.Empty:
+            if deadline is not None and time.time() >= deadline:
+                raise JobTimeout("%d jobs didn't end within %s seconds" %
+                                 (len(pending), timeout))
+            continue
+        if future in pending:
+            pending.remove(future)
+            yield future
@@ -0,0 +1,89 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+import time
+
+
+class JobPollPolicy(object):
+    """
+    Decides when to poll the status of a NEO job.
+
+    Polls start at a short interval, so short jobs are noticed as soon as
+    they end, and back off exponentially up to a cap, so long jobs don't
+    flood NEO with requests. When the job reports its progress, the next
+    poll is scheduled at the estimated time of its end instead (still
+    within the same bounds). Polling stops at a wall clock deadline.
+    """
+
+    # The times are in seconds
+    INITIAL_INTERVAL = 0.1
+    MAX_INTERVAL = 5
+    BACKOFF_FACTOR = 1.5
+    DEFAULT_DEADLINE = 300
+
+    def __init__(self, deadline=DEFAULT_DEADLINE,
+                 initial_interval=INITIAL_INTERVAL,
+                 max_interval=MAX_INTERVAL,
+                 backoff_factor=BACKOFF_FACTOR,
+                 use_eta=True):
+        self._deadline = deadline
+        self._initial_interval = initial_interval
+        self._max_interval = max_interval
+        self._backoff_factor = backoff_factor
+        self._use_eta = use_eta
+        self._interval = initial_interval
+        self._start = time.time()
+
+    def elapsed(self):
+        return time.time() - self._start
+
+    def expired(self):
+        return self._deadline is not None and \
+            self.elapsed() >= self._deadline
+
+    def estimateRemaining(self, progress):
+        '''
+        Returns the estimated time left for the job, assuming it progresses
+        at a steady rate, or None if the progress (0-100) is unknown
+        '''
+        try:
+            progress = float(progress)
+        except (TypeError, ValueError):
+            return None
+        if not 0 < progress < 100:
+            return None
+        elapsed = self.elapsed()
+        return elapsed * (100 - progress) / progress
+
+    def nextInterval(self, progress=None):
+        '''
+        Returns the time to wait before the next poll
+        '''
+        interval = self._interval
+        self._interval = min(self._interval * self._backoff_factor,
+                             self._max_interval)
+        if self._use_eta:
+            eta = self.estimateRemaining(progress)
+            if eta is not None:
+                interval = min(max(eta, self._initial_interval),
+                               self._max_interval)
+
+        # Last poll is at the deadline
+        if self._deadline is not None:
+            interval = min(interval,
+                           max(self._deadline - self.elapsed(), 0))
+        return interval
+
+    def wait(self, progress=None):
+        time.sleep(self.nextInterval(progress))
@@ -0,0 +1,189 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+import httplib
+import json
+import threading
+from url import URL
+from job_poll_policy import JobPollPolicy
+from sdk_exceptions import RequestFailed
+
+
+class JobWatcher(object):
+    """
+    Tracks the status of many NEO jobs at once.
+
+    Every poll fetches all the watched jobs together with multi-id
+    '/app/jobs/<id1>,<id2>,...' requests (one per MAX_IDS_PER_REQUEST
+    jobs), instead of one request per job. When a job ends, its callback
+    is called with the job data (a dict as returned by NEO), and the job
+    is no longer polled.
+
+    NEO fails a multi-id request when one of the jobs can't be fetched
+    (e.g. it was deleted), so the jobs of a failed request (or missing
+    from its response) are fetched one by one, and the errback of a job
+    that still fails is called with a RequestFailed, instead of polling
+    it forever.
+    """
+
+    FINAL_STATUSES = ("Completed", "Aborted", "Canceled",
+                      "Completed With Errors")
+
+    # Keeps the url of a poll request reasonably short
+    MAX_IDS_PER_REQUEST = 100
+
+    def __init__(self, neo_session, base_url="/neo"):
+        self._neo_session = neo_session
+        self._jobs_url = base_url + URL.JOBS_URL
+        self._lock = threading.Lock()
+        self._callbacks = {}
+        self._errbacks = {}
+        self._last = {}
+
+    @classmethod
+    def isFinal(cls, job):
+        return job.get("Status") in cls.FINAL_STATUSES
+
+    def watch(self, job_id, callback=None, errback=None):
+        '''
+        Starts tracking the given job. 'callback(job)' is called once the
+        job ended, or 'errback(job_id, exception)' if it can't be fetched.
+        '''
+        job_id = int(job_id)
+        with self._lock:
+            self._callbacks[job_id] = callback
+            self._errbacks[job_id] = errback
+
+    def unwatch(self, job_id):
+        '''
+        Stops tracking the given job. Returns False if it isn't tracked
+        (e.g. it already ended).
+        '''
+        return self._forget(int(job_id)) is not None
+
+    def _forget(self, job_id):
+        '''
+        Stops tracking the given job, and returns its (callback, errback),
+        or None if it isn't tracked
+        '''
+        with self._lock:
+            if job_id not in self._callbacks:
+                return None
+            self._last.pop(job_id, None)
+            return (self._callbacks.pop(job_id),
+                    self._errbacks.pop(job_id))
+
+    def pending(self):
+        with self._lock:
+            return sorted(self._callbacks)
+
+    def last(self, job_id):
+        '''
+        Returns the latest data polled of the given job while it's tracked
+        (or None)
+        '''
+        return self._last.get(int(job_id))
+
+    def _fetch(self, job_ids):
+        '''
+        Returns a (jobs, errors) tuple of the data of the given jobs, and
+        of a dict of the ids of the jobs that couldn't be fetched to their
+        RequestFailed
+        '''
+        url = "%s/%s" % (self._jobs_url, ",".join(str(job_id)
+                                                  for job_id in job_ids))
+        response = self._neo_session.get(url)
+        body = response.read()
+        if response.status == httplib.OK:
+            jobs = json.loads(body)
+            jobs = jobs if isinstance(jobs, list) else [jobs]
+            if len(job_ids) == 1:
+                return jobs, {}
+            # Some servers leave the missing jobs out of the response
+            returned = set(int(job["ID"]) for job in jobs)
+            failed_ids = [job_id for job_id in job_ids
+                          if job_id not in returned]
+        elif len(job_ids) == 1:
+            return [], {job_ids[0]: RequestFailed(
+                "NEO returned status %s for job %s: %s" %
+                (response.status, job_ids[0], body))}
+        else:
+            jobs = []
+            failed_ids = job_ids
+
+        # Finding out which jobs failed the request
+        errors = {}
+        for job_id in failed_ids:
+            job_data, job_errors = self._fetch([job_id])
+            jobs.extend(job_data)
+            errors.update(job_errors)
+        return jobs, errors
+
+    def poll(self, job_ids=None):
+        '''
+        Polls all the watched jobs (or only the given ones) once, calls the
+        callbacks of the jobs that ended (and the errbacks of the jobs that
+        couldn't be fetched), and returns the jobs that ended
+        '''
+        pending = self.pending()
+        job_ids = pending if job_ids is None else \
+            sorted(set(pending).intersection(job_ids))
+        ended = []
+        errors = {}
+        for index in xrange(0, len(job_ids), self.MAX_IDS_PER_REQUEST):
+            jobs, request_errors = self._fetch(
+                job_ids[index:index + self.MAX_IDS_PER_REQUEST])
+            errors.update(request_errors)
+            for job in jobs:
+                job_id = int(job["ID"])
+                with self._lock:
+                    # The job may have been unwatched while it was polled
+                    if job_id in self._callbacks:
+                        self._last[job_id] = job
+                if self.isFinal(job):
+                    ended.append(job)
+
+        for job in ended:
+            callbacks = self._forget(int(job["ID"]))
+            if callbacks is not None and callbacks[0] is not None:
+                callbacks[0](job)
+        for job_id, exception in errors.iteritems():
+            callbacks = self._forget(job_id)
+            if callbacks is not None and callbacks[1] is not None:
+                callbacks[1](job_id, exception)
+        return ended
+
+    def progress(self):
+        # The next poll is timed by the job that is closest to its end
+        progresses = []
+        for job_id in self.pending():
+            try:
+                progresses.append(float(self._last[job_id]["Progress"]))
+            except (KeyError, TypeError, ValueError):
+                pass
+        return max(progresses) if progresses else None
+
+    def wait(self, deadline=JobPollPolicy.DEFAULT_DEADLINE):
+        '''
+        Polls until all the watched jobs ended (or couldn't be fetched) or
+        the deadline (in seconds) passed. Returns True if none is left.
+        '''
+        policy = JobPollPolicy(deadline)
+        while True:
+            self.poll()
+            if not self.pending():
+                return True
+            if policy.expired():
+                return False
+            policy.wait(self.progress())
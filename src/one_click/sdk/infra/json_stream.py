@@ -0,0 +1,150 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+import json
+
+
+class JsonStreamDecoder(object):
+    """
+    Decodes the elements of a top level JSON array one by one, while the
+    document is read chunk by chunk from a file like object (e.g. a
+    NeoResponse). Only the current chunk and the element being decoded are
+    kept in memory, whatever the size of the whole document is.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    WHITESPACE = " \t\n\r"
+    VALUE_TERMINATORS = WHITESPACE + ",]}"
+
+    def __init__(self, stream, chunk_size=CHUNK_SIZE):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size=0):
+        '''
+        Reads the next chunk into the buffer, or more chunks until the
+        buffer holds at least 'size' bytes that weren't decoded, dropping
+        the part of the buffer that was already decoded. Returns False at
+        end of stream.
+        '''
+        if self._eof:
+            return False
+        chunks = [self._buffer[self._pos:]]
+        pending = len(chunks[0])
+        while True:
+            data = self._stream.read(self._chunk_size)
+            if not data:
+                self._eof = True
+                break
+            chunks.append(data)
+            pending += len(data)
+            if pending >= size:
+                break
+        if len(chunks) == 1:
+            return False
+        self._buffer = "".join(chunks)
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        '''
+        Skips whitespace and returns the next character, or None at end
+        of stream.
+        '''
+        while True:
+            while self._pos < len(self._buffer) and \
+                    self._buffer[self._pos] in self.WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return None
+
+    def _decodeValue(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                # The value continues in the next chunks. The data that
+                # wasn't decoded is at least doubled before the value is
+                # decoded again, so a value that spans many chunks isn't
+                # decoded once per chunk.
+                if not self._fill(2 * (len(self._buffer) - self._pos)):
+                    raise
+                continue
+
+            # In a valid document a value is followed by whitespace or by a
+            # delimiter. Otherwise it's a number that was cut at the end of
+            # the chunk (e.g. '12' + '.5'), and it continues in the next one.
+            if (end == len(self._buffer) or
+                    self._buffer[end] not in self.VALUE_TERMINATORS) and \
+                    self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def isArray(self):
+        '''
+        Returns True if the document is a top level JSON array, False if
+        it's another document and None if it's empty
+        '''
+        first = self._peek()
+        return None if first is None else first == "["
+
+    def remainder(self):
+        '''
+        Reads and returns the rest of the document that wasn't decoded
+        (e.g. a document that turned out not to be JSON)
+        '''
+        data = self._buffer[self._pos:]
+        if not self._eof:
+            data += self._stream.read()
+            self._eof = True
+        self._buffer, self._pos = "", 0
+        return data
+
+    def iterItems(self):
+        '''
+        Yields the elements of a top level JSON array as they are decoded.
+        A document that isn't an array is yielded as a single item.
+        '''
+        first = self._peek()
+        if first is None:
+            raise ValueError("No JSON object could be decoded")
+        if first != "[":
+            # The whole document is a single value, so it's decoded once,
+            # when all of it was read
+            while self._fill(2 * (len(self._buffer) - self._pos)):
+                pass
+            yield self._decodeValue()
+            return
+
+        self._pos += 1
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._decodeValue()
+            delimiter = self._peek()
+            self._pos += 1
+            if delimiter == "]":
+                return
+            if delimiter != ",":
+                raise ValueError("Expecting ',' or ']' delimiter, got %r" %
+                                 delimiter)
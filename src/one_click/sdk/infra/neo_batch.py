@@ -0,0 +1,280 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+import json
+import threading
+import time
+from multiprocessing.pool import ThreadPool
+from neo_connection_pool import NeoConnectionPool
+from sdk_exceptions import BadFileFormat
+
+
+class BatchOperation(object):
+    """
+    An SDK action of a batch, e.g. the line
+        {"id": "g1", "sdk": "groups", "option": "add",
+         "payload": {"elementName": "g1"}}
+    'parameters' and 'payload' are as in NeoSdk.request(), 'arguments' are
+    additional SDK arguments (e.g. {"blocking": true}) and 'depends_on' are
+    ids of operations that must succeed before this one starts. The id
+    defaults to the line number.
+    """
+
+    FIELDS = ("id", "sdk", "option", "parameters", "payload", "arguments",
+              "depends_on")
+
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+    def __init__(self, op_id, sdk, option, parameters=None, payload=None,
+                 arguments=None, depends_on=()):
+        self.op_id = op_id
+        self.sdk = sdk
+        self.option = option
+        self.parameters = parameters
+        self.payload = payload
+        self.arguments = arguments or {}
+        self.depends_on = list(depends_on)
+
+    @classmethod
+    def fromJson(cls, line_number, data):
+        if not isinstance(data, dict):
+            raise BadFileFormat("Line %d: an operation must be a JSON "
+                                "object" % line_number)
+        unknown = set(data) - set(cls.FIELDS)
+        if unknown:
+            raise BadFileFormat("Line %d: unknown fields: %s" %
+                                (line_number, ", ".join(sorted(unknown))))
+        for field in ("sdk", "option"):
+            if not data.get(field):
+                raise BadFileFormat("Line %d: missing '%s'" %
+                                    (line_number, field))
+        depends_on = data.get("depends_on") or []
+        if not isinstance(depends_on, list):
+            depends_on = [depends_on]
+        return cls(data.get("id", line_number), data["sdk"], data["option"],
+                   data.get("parameters"), data.get("payload"),
+                   data.get("arguments"), depends_on)
+
+    def result(self, status, result=None, error=None, elapsed=None):
+        '''
+        Returns the result line of the operation
+        '''
+        line = {"id": self.op_id, "sdk": self.sdk, "option": self.option,
+                "status": status}
+        if result is not None:
+            line["result"] = result
+        if error is not None:
+            line["error"] = error
+        if elapsed is not None:
+            line["elapsed_ms"] = round(elapsed * 1000, 1)
+        return line
+
+
+def readOperations(lines, sdk_names=None):
+    '''
+    Parses the lines of a JSONL batch file (empty lines and lines that
+    start with '#' are skipped). Raises BadFileFormat if a line isn't a
+    valid operation, an id is repeated, an operation depends on an unknown
+    id or the dependencies have a cycle.
+    '''
+    operations = []
+    ids = set()
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError as exc:
+            raise BadFileFormat("Line %d: %s" % (line_number, exc))
+        operation = BatchOperation.fromJson(line_number, data)
+        if sdk_names is not None and operation.sdk not in sdk_names:
+            raise BadFileFormat("Line %d: unknown sdk '%s'" %
+                                (line_number, operation.sdk))
+        if operation.op_id in ids:
+            raise BadFileFormat("Line %d: the id '%s' is repeated" %
+                                (line_number, operation.op_id))
+        ids.add(operation.op_id)
+        operations.append(operation)
+
+    for operation in operations:
+        for op_id in operation.depends_on:
+            if op_id not in ids:
+                raise BadFileFormat("Operation '%s' depends on an unknown "
+                                    "id '%s'" % (operation.op_id, op_id))
+    _checkCycles(operations)
+    return operations
+
+
+def _checkCycles(operations):
+    # Repeatedly removes the operations whose dependencies were all removed
+    remaining = dict((operation.op_id, set(operation.depends_on))
+                     for operation in operations)
+    while remaining:
+        ready = [op_id for op_id, depends_on in remaining.iteritems()
+                 if not depends_on]
+        if not ready:
+            raise BadFileFormat("The dependencies of the operations %s "
+                                "have a cycle" %
+                                ", ".join(sorted(map(str, remaining))))
+        for op_id in ready:
+            del remaining[op_id]
+        for depends_on in remaining.itervalues():
+            depends_on.difference_update(ready)
+
+
+class NeoBatch(object):
+    """
+    Runs batch operations concurrently in one process.
+
+    'sdk_factory(operation)' returns the SDK object that runs an operation
+    (typically in library mode, over a NeoConnection that all the
+    operations share). Up to 'concurrency' operations run at once, and an
+    operation starts once all the operations it depends on succeeded. If
+    one of them failed (or was skipped), it's skipped.
+    """
+
+    DEFAULT_CONCURRENCY = NeoConnectionPool.DEFAULT_MAX_CONNECTIONS
+
+    def __init__(self, sdk_factory, concurrency=DEFAULT_CONCURRENCY):
+        self._sdk_factory = sdk_factory
+        self._concurrency = concurrency
+        self._lock = threading.Lock()
+        self._all_done = threading.Event()
+        self._statuses = {}
+        self._waiting = []
+        self._on_result = None
+        self._workers = None
+
+    def _execute(self, operation):
+        start = time.time()
+        sdk = None
+        try:
+            sdk = self._sdk_factory(operation)
+            result = sdk.request(operation.option, operation.parameters,
+                                 operation.payload)
+            return operation.result(BatchOperation.SUCCEEDED, result,
+                                    elapsed=time.time() - start)
+        except Exception as exc:
+            return operation.result(BatchOperation.FAILED, error=str(exc),
+                                    elapsed=time.time() - start)
+        finally:
+            if sdk is not None:
+                sdk.close()
+
+    def _schedule(self):
+        '''
+        Starts the waiting operations whose dependencies ended, and returns
+        the result lines of the operations that are skipped. The caller
+        must hold the lock.
+        '''
+        skipped = []
+        progress = True
+        while progress:
+            progress = False
+            for operation in list(self._waiting):
+                statuses = [self._statuses.get(op_id)
+                            for op_id in operation.depends_on]
+                if None in statuses:
+                    continue
+                self._waiting.remove(operation)
+                progress = True
+                if all(status == BatchOperation.SUCCEEDED
+                       for status in statuses):
+                    self._statuses[operation.op_id] = None
+                    self._workers.apply_async(self._execute, (operation,),
+                                              callback=self._ended)
+                else:
+                    # Skipping an operation may make others skipped too
+                    self._statuses[operation.op_id] = BatchOperation.SKIPPED
+                    skipped.append(operation.result(
+                        BatchOperation.SKIPPED,
+                        error="A dependency didn't succeed"))
+        return skipped
+
+    def _report(self, line):
+        '''
+        Hands over a result line, and returns the status of the operation,
+        which is failed if that fails (e.g. the result can't be written as
+        JSON)
+        '''
+        try:
+            self._on_result(line)
+            return line["status"]
+        except Exception as exc:
+            error = "Couldn't output the result: %s" % exc
+        try:
+            self._on_result({"id": line["id"], "sdk": line["sdk"],
+                             "option": line["option"],
+                             "status": BatchOperation.FAILED,
+                             "error": error})
+        except Exception:
+            # The output itself is broken, the counts still tell
+            pass
+        return BatchOperation.FAILED
+
+    def _ended(self, result):
+        # Runs in the result thread of the pool, which must not die, or
+        # run() would never return. The result is written before the
+        # operations that depend on it are scheduled, so they're skipped if
+        # it can't be.
+        try:
+            lines = [result]
+            while lines:
+                line = lines.pop(0)
+                status = self._report(line)
+                with self._lock:
+                    self._statuses[line["id"]] = status
+                    if line is result:
+                        lines.extend(self._schedule())
+        finally:
+            with self._lock:
+                done = not self._waiting and \
+                    None not in self._statuses.itervalues()
+            if done:
+                self._all_done.set()
+
+    def run(self, operations, on_result):
+        '''
+        Runs the operations and calls 'on_result(result)' with the result
+        line of each one as it ends (always from the same thread).
+        Returns a dict of the number of operations by status.
+        '''
+        self._statuses = {}
+        self._waiting = list(operations)
+        self._on_result = on_result
+        self._all_done.clear()
+        if not self._waiting:
+            return {}
+
+        # The results are handled by the single result thread of the pool
+        self._workers = ThreadPool(self._concurrency)
+        try:
+            with self._lock:
+                # Nothing ended yet, so no operation is skipped here
+                self._schedule()
+            # Event.wait() without a timeout can't be interrupted by Ctrl-C
+            while not self._all_done.wait(1):
+                pass
+        finally:
+            self._workers.close()
+            self._workers.join()
+            self._workers = None
+
+        counts = {}
+        for status in self._statuses.itervalues():
+            counts[status] = counts.get(status, 0) + 1
+        return counts
@@ -0,0 +1,298 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+import atexit
+import base64
+import collections
+import gzip
+import json
+import re
+import threading
+import urllib
+import urlparse
+from time import sleep
+from neo_connection import NeoConnection
+
+
+class CassetteMissError(Exception):
+    pass
+
+
+def _openCassette(path, mode):
+    # Cassettes whose name ends with '.gz' are gzip compressed
+    if path.endswith(".gz"):
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+def _encodeBody(body):
+    '''
+    Returns (text, encoding) of a body to store in a cassette. Bodies that
+    aren't UTF-8 text are stored base64 encoded.
+    '''
+    if body is None:
+        return None, None
+    try:
+        return body.decode("utf-8"), None
+    except UnicodeDecodeError:
+        return base64.b64encode(body), "base64"
+
+
+def _decodeBody(text, encoding):
+    if text is None:
+        return ""
+    if encoding == "base64":
+        return base64.b64decode(text)
+    return text.encode("utf-8")
+
+
+def _replayKey(method, url):
+    # The time zone parameter depends on the machine, not on the request
+    url = re.sub(r"([?&])tz=[^&]*&?", r"\1", url).rstrip("?&")
+    return method, url
+
+
+class CassetteRecorder(object):
+    """
+    A NeoConnection request hook that writes every exchange with NEO
+    (request line, headers, body, response status, headers, body and
+    timing) as a JSON line of a cassette file, to be served back later by
+    a CassetteReplayPool.
+
+    Cookies and logins are not recorded, and the passwords in request
+    bodies (e.g. of new users) are replaced, so a cassette holds no
+    secrets.
+    """
+
+    CAPTURES_BODIES = True
+    REDACTED = "***"
+    # Request body fields whose name contains one of these are redacted
+    SECRET_FIELDS = ("password", "secret", "token")
+    EXCLUDED_REQUEST_HEADERS = ("cookie",)
+    EXCLUDED_RESPONSE_HEADERS = ("set-cookie", "content-encoding",
+                                 "content-length", "transfer-encoding",
+                                 "connection")
+
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        self._file = _openCassette(path, "wb")
+        atexit.register(self.close)
+
+    @classmethod
+    def _isSecret(cls, name):
+        name = name.lower()
+        return any(field in name for field in cls.SECRET_FIELDS)
+
+    @classmethod
+    def _redactObject(cls, obj):
+        if isinstance(obj, dict):
+            return dict((name, cls.REDACTED if cls._isSecret(name)
+                         else cls._redactObject(value))
+                        for name, value in obj.iteritems())
+        if isinstance(obj, list):
+            return [cls._redactObject(item) for item in obj]
+        return obj
+
+    @classmethod
+    def _redactBody(cls, body):
+        '''
+        Returns a request body (JSON or form encoded) without its secrets
+        '''
+        if not body:
+            return body
+        try:
+            return json.dumps(cls._redactObject(json.loads(body)))
+        except ValueError:
+            pass
+        fields = urlparse.parse_qsl(body, keep_blank_values=True)
+        if not any(cls._isSecret(name) for name, _ in fields):
+            return body
+        return urllib.urlencode([
+            (name, cls.REDACTED if cls._isSecret(name) else value)
+            for name, value in fields])
+
+    def __call__(self, record):
+        # Failed requests and logins can't (and shouldn't) be replayed
+        if record.status is None or record.response_body is None or \
+                record.url.startswith(NeoConnection.LOGIN_URL):
+            return
+        request_body, request_encoding = _encodeBody(
+            self._redactBody(record.request_body))
+        response_body, response_encoding = _encodeBody(
+            "".join(record.response_body))
+        entry = {
+            "method": record.method,
+            "url": record.url,
+            "request_headers": dict(
+                (name, value)
+                for name, value in record.request_headers.iteritems()
+                if name.lower() not in self.EXCLUDED_REQUEST_HEADERS),
+            "request_body": request_body,
+            "status": record.status,
+            "response_headers": [
+                (name, value) for name, value in record.response_headers
+                if name.lower() not in self.EXCLUDED_RESPONSE_HEADERS],
+            "response_body": response_body,
+            "ttfb": record.ttfb,
+            "total": record.total}
+        if request_encoding:
+            entry["request_body_encoding"] = request_encoding
+        if response_encoding:
+            entry["response_body_encoding"] = response_encoding
+        line = json.dumps(entry, separators=(",", ":"))
+        with self._lock:
+            if self._file is not None:
+                self._file.write(line + "\n")
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class ReplayResponse(object):
+    """
+    A recorded response, with the interface of httplib.HTTPResponse that
+    NeoResponse uses
+    """
+
+    will_close = False
+
+    def __init__(self, status, headers, body, body_delay=0):
+        self.status = status
+        self.reason = ""
+        self._headers = headers
+        self._body = body
+        self._body_delay = body_delay
+
+    def getheader(self, name, default=None):
+        name = name.lower()
+        for header, value in self._headers:
+            if header.lower() == name:
+                return value
+        return default
+
+    def getheaders(self):
+        return self._headers
+
+    def read(self, amt=None):
+        if self._body_delay:
+            sleep(self._body_delay)
+            self._body_delay = 0
+        if not self._body:
+            return ""
+        if amt is None:
+            data, self._body = self._body, None
+        else:
+            data, self._body = self._body[:amt], self._body[amt:]
+        return data
+
+    def isclosed(self):
+        return not self._body
+
+    def close(self):
+        self._body = None
+
+
+class ReplayConnection(object):
+    """
+    A connection of a CassetteReplayPool, with the interface of
+    httplib.HTTPConnection that NeoConnection uses
+    """
+
+    def __init__(self, pool):
+        self._pool = pool
+        self._response = None
+
+    def request(self, method, url, body=None, headers={}):
+        self._response = self._pool.replay(method, url)
+
+    def getresponse(self):
+        response, ttfb = self._response
+        if ttfb:
+            sleep(ttfb)
+        return response
+
+    def close(self):
+        pass
+
+
+class CassetteReplayPool(object):
+    """
+    Stands in for a NeoConnectionPool and serves the exchanges of a
+    cassette instead of connecting to NEO.
+
+    Requests are matched by method and url (without the time zone).
+    Exchanges of the same request are served in the recorded order, and
+    the last one is served again to any extra request (e.g. more job
+    polls than when recording). Logins are answered with a fake session.
+
+    'speed' scales the recorded timing: 1 replays at the original speed,
+    2 twice as fast, and 0 without any delay.
+    """
+
+    def __init__(self, path, speed=1.0):
+        self._speed = speed
+        self._lock = threading.Lock()
+        self._exchanges = collections.defaultdict(collections.deque)
+        with _openCassette(path, "rb") as cassette:
+            for line in cassette:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                key = _replayKey(entry["method"], entry["url"])
+                self._exchanges[key].append(entry)
+
+    def _delay(self, seconds):
+        if not self._speed or not seconds:
+            return 0
+        return seconds / self._speed
+
+    def replay(self, method, url):
+        '''
+        Returns (response, ttfb) for the next recorded exchange matching
+        the request
+        '''
+        if url.startswith(NeoConnection.LOGIN_URL):
+            return ReplayResponse(200, [("set-cookie", "session=replay")],
+                                  ""), 0
+        key = _replayKey(method, url)
+        with self._lock:
+            exchanges = self._exchanges.get(key)
+            if not exchanges:
+                raise CassetteMissError("No recorded response for %s %s" %
+                                        key)
+            entry = exchanges[0] if len(exchanges) == 1 \
+                else exchanges.popleft()
+        ttfb = entry.get("ttfb") or 0
+        body_time = max((entry.get("total") or 0) - ttfb, 0)
+        response = ReplayResponse(
+            entry["status"],
+            [tuple(header) for header in entry["response_headers"]],
+            _decodeBody(entry["response_body"],
+                        entry.get("response_body_encoding")),
+            self._delay(body_time))
+        return response, self._delay(ttfb)
+
+    def checkout(self, reuse=True):
+        # A replayed connection never goes stale
+        return ReplayConnection(self), True
+
+    def checkin(self, connection, reusable=True):
+        pass
+
+    def close(self):
+        pass
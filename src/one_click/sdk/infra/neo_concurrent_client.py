@@ -0,0 +1,116 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+from multiprocessing.pool import ThreadPool
+from neo_connection import NeoConnection
+from neo_connection_pool import NeoConnectionPool
+
+
+class NeoBufferedResponse(object):
+    """
+    A response whose body was already read, so it doesn't hold a pooled
+    connection and can be handed over between threads.
+    """
+
+    def __init__(self, response):
+        self.status = response.status
+        self.reason = response.reason
+        self._headers = response.getheaders()
+        self._body = response.read()
+
+    def getheader(self, name, default=None):
+        name = name.lower()
+        for header, value in self._headers:
+            if header.lower() == name:
+                return value
+        return default
+
+    def getheaders(self):
+        return self._headers
+
+    def read(self, amt=None):
+        if amt is None:
+            data, self._body = self._body, ""
+        else:
+            data, self._body = self._body[:amt], self._body[amt:]
+        return data
+
+
+class NeoConcurrentClient(object):
+    """
+    Sends requests to a NEO server concurrently from a single process.
+
+    It has the same get/put/post/delete methods as NeoConnection (including
+    the login and the 'tz=' handling, which are done by NeoConnection), but
+    each method returns immediately with an AsyncResult, whose get(timeout)
+    returns a NeoBufferedResponse.
+
+    The number of requests in flight is bounded by 'concurrency', which is
+    both the number of worker threads and the size of the connection pool
+    of the server. The requests can also be sent with an existing
+    NeoConnection ('connection'), e.g. the session of an SDK, instead of a
+    new one. close() stops the worker threads.
+    """
+
+    DEFAULT_CONCURRENCY = NeoConnectionPool.DEFAULT_MAX_CONNECTIONS
+
+    def __init__(self, username=None, password=None, server="localhost",
+                 port=80, protocol="http", concurrency=DEFAULT_CONCURRENCY,
+                 connection=None, **connection_args):
+        if connection is None:
+            connection = NeoConnection(username, password, server,
+                                       port=port, protocol=protocol,
+                                       max_connections=concurrency,
+                                       **connection_args)
+        self._connection = connection
+        self._workers = ThreadPool(concurrency)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _send(self, method, args, callback=None):
+        def send():
+            return NeoBufferedResponse(method(*args))
+        return self._workers.apply_async(send, callback=callback)
+
+    def get(self, url, headers={}, callback=None):
+        return self._send(self._connection.get, (url, headers), callback)
+
+    def put(self, url, data, headers={}, callback=None):
+        return self._send(self._connection.put, (url, data, headers),
+                          callback)
+
+    def delete(self, url, headers={}, callback=None):
+        return self._send(self._connection.delete, (url, headers), callback)
+
+    def post(self, url, data=None, headers={}, callback=None):
+        return self._send(self._connection.post, (url, data, headers),
+                          callback)
+
+    def getMany(self, urls, headers={}):
+        '''
+        Gets all the given urls concurrently. Yields (url, response) tuples
+        in the order the responses arrive.
+        '''
+        def get(url):
+            return url, NeoBufferedResponse(
+                self._connection.get(url, headers))
+        return self._workers.imap_unordered(get, urls)
+
+    def close(self):
+        self._workers.close()
+        self._workers.join()
@@ -14,91 +14,407 @@
 @date:   Dec 6, 2015
 """
 import httplib
+import random
+import socket
+import threading
 import urllib
+import zlib
+from time import sleep
 from infra import localTzname
+from neo_connection_pool import NeoConnectionPool
+from session_cache import SessionCache
+from request_stats import RequestRecord
 
 
 class NeoConnectionError(Exception):
     pass
 
 
+class DeflateDecompressor(object):
+    """
+    Decompressor for 'Content-Encoding: deflate' bodies. The encoding is
+    supposed to be zlib wrapped deflate data, but some servers send raw
+    deflate data, so the format is detected on the first chunk.
+    """
+
+    def __init__(self):
+        self._decompressor = None
+
+    def decompress(self, data):
+        if self._decompressor is None:
+            self._decompressor = zlib.decompressobj(zlib.MAX_WBITS)
+            try:
+                return self._decompressor.decompress(data)
+            except zlib.error:
+                self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._decompressor.decompress(data)
+
+    def flush(self):
+        if self._decompressor is None:
+            return ""
+        return self._decompressor.flush()
+
+
+class NeoResponse(object):
+    """
+    Wraps an httplib response whose connection was checked out of a
+    NeoConnectionPool. The connection is returned to the pool as soon as
+    the response body was fully read, or when the response is closed.
+
+    gzip and deflate encoded bodies are decompressed chunk by chunk as they
+    are read. 'raw_bytes' and 'decoded_bytes' count the bytes read from the
+    network and the bytes returned to the caller so far.
+
+    When the whole body was returned to the caller (or the response is
+    closed), the request record (if any) is completed and passed to
+    'on_done'.
+    """
+
+    # Size of the compressed chunks read from the network
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, response, pool, connection, record=None,
+                 on_done=None):
+        self._response = response
+        self._pool = pool
+        self._connection = connection
+        self._record = record
+        self._on_done = on_done
+        self.status = response.status
+        self.reason = response.reason
+        self.raw_bytes = 0
+        self.decoded_bytes = 0
+        self._decompressor = self._createDecompressor()
+        self._decoded = ""
+        self._eof = False
+
+    def _createDecompressor(self):
+        encoding = (self.getheader("Content-Encoding") or "").strip().lower()
+        if encoding in ("gzip", "x-gzip"):
+            return zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if encoding == "deflate":
+            return DeflateDecompressor()
+        return None
+
+    def getheader(self, name, default=None):
+        return self._response.getheader(name, default)
+
+    def getheaders(self):
+        return self._response.getheaders()
+
+    def _readRaw(self, amt=None):
+        data = self._response.read(amt)
+        self.raw_bytes += len(data)
+        if self._response.isclosed():
+            self._release(reusable=True)
+        return data
+
+    def _decodeChunk(self):
+        '''
+        Reads one compressed chunk and appends its decompressed data to the
+        decoded buffer.
+        '''
+        data = self._readRaw(self.CHUNK_SIZE)
+        if data:
+            self._decoded += self._decompressor.decompress(data)
+        else:
+            self._decoded += self._decompressor.flush()
+            self._eof = True
+
+    def read(self, amt=None):
+        if self._decompressor is None:
+            data = self._readRaw(amt)
+        else:
+            while not self._eof and (amt is None or
+                                     len(self._decoded) < amt):
+                self._decodeChunk()
+            if amt is None:
+                data, self._decoded = self._decoded, ""
+            else:
+                data, self._decoded = \
+                    self._decoded[:amt], self._decoded[amt:]
+        self.decoded_bytes += len(data)
+        if self._record is not None and \
+                self._record.response_body is not None:
+            self._record.response_body.append(data)
+        if self._connection is None and not self._decoded and \
+                (self._decompressor is None or self._eof):
+            self._done()
+        return data
+
+    def close(self):
+        # A response that was not fully read leaves unread data on the
+        # socket, so its connection can't be reused
+        reusable = self._response.isclosed()
+        self._response.close()
+        self._release(reusable)
+        self._done()
+
+    def _release(self, reusable):
+        if self._connection is None:
+            return
+        reusable = reusable and not self._response.will_close
+        self._pool.checkin(self._connection, reusable)
+        self._connection = None
+
+    def _done(self):
+        if self._record is None:
+            return
+        record, self._record = self._record, None
+        record.markDone(self.raw_bytes)
+        self._on_done(record)
+
+    def __del__(self):
+        if self._connection is not None or self._record is not None:
+            self.close()
+
+
 class NeoConnection(object):
     SESSION_PREFIX = "session="
     REST_VERSION = "1.0.2"
+    LOGIN_URL = "/neo/login"
+    COMPRESSION_HEADER = {"Accept-Encoding": "gzip, deflate"}
+    REDIRECT_STATUSES = (httplib.MOVED_PERMANENTLY, httplib.FOUND,
+                         httplib.SEE_OTHER, httplib.TEMPORARY_REDIRECT)
+
+    # Requests that fail because the connection died (e.g. NEO or a load
+    # balancer closed an idle keep-alive connection) are sent again on a new
+    # connection. Idempotent requests that fail on a reused connection,
+    # which the server most likely closed while it was idle, are sent again
+    # right away. Non idempotent requests are sent again only if they
+    # provably never reached the server (the pool drops the idle
+    # connections the server closed before it hands them out).
+    MAX_RETRIES = 3
+    IDEMPOTENT_METHODS = ("GET", "PUT", "DELETE")
+    CONNECTION_ERRORS = (socket.error, httplib.HTTPException)
+
+    # Exponential backoff (in seconds) between retries. The actual delay is
+    # picked at random up to the backoff, so clients that failed together
+    # don't retry together.
+    RETRY_BACKOFF = 0.5
+    MAX_RETRY_BACKOFF = 8
+
+    # Callables that get a RequestRecord for every request sent by any
+    # NeoConnection, once its response was read. Hooks with a true
+    # 'CAPTURES_BODIES' attribute get the headers and bodies as well.
+    _request_hooks = []
 
     def __init__(self, username, password, server="localhost", port=80,
-                 protocol="http"):
-        self._connection = None
+                 protocol="http",
+                 max_connections=NeoConnectionPool.DEFAULT_MAX_CONNECTIONS,
+                 session_cache=True, compress=False, pool=None):
+
+        # The server may include the port (e.g. '127.0.0.1:8080' for a
+        # local stand-in server), which takes precedence over 'port'
+        if server.count(":") == 1:
+            server, port = server.split(":")
+            port = int(port)
+        self._pool = pool
         self._username = username
         self._password = password
         self._server = server
         self._protocol = protocol
         self._port = port
+        self._max_connections = max_connections
+        self._compress = compress
         self._session = None
+        self._login_lock = threading.Lock()
+
+        # Sessions are shared on disk with other SDK processes, so each
+        # process doesn't have to log in again
+        self._session_cache = None
+        if session_cache:
+            self._session_cache = SessionCache(username, password, server,
+                                               port, protocol)
         self._connect()
 
     def _connect(self):
-        if self._protocol == "http":
-            self._connection = httplib.HTTPConnection(self._server, self._port)
-        else:
-            self._connection = httplib.HTTPSConnection(self._server,
-                                                       self._port)
-        self._connection.connect()
+        # A pool may be given explicitly (e.g. a cassette replay pool),
+        # otherwise the pool of the server is shared by the whole process
+        if self._pool is None:
+            self._pool = NeoConnectionPool.getPool(self._server, self._port,
+                                                   self._protocol,
+                                                   self._max_connections)
+
+        # Open the first connection up front, so connectivity problems are
+        # still reported when the connection object is created
+        connection, _ = self._pool.checkout()
+        self._pool.checkin(connection)
+
+    @classmethod
+    def addRequestHook(cls, hook):
+        cls._request_hooks.append(hook)
+
+    @classmethod
+    def removeRequestHook(cls, hook):
+        cls._request_hooks.remove(hook)
+
+    @classmethod
+    def _capturesBodies(cls):
+        return any(getattr(hook, "CAPTURES_BODIES", False)
+                   for hook in cls._request_hooks)
+
+    @classmethod
+    def _notifyRequestHooks(cls, record):
+        for hook in list(cls._request_hooks):
+            hook(record)
+
+    def _backoff(self, attempt):
+        backoff = min(self.MAX_RETRY_BACKOFF,
+                      self.RETRY_BACKOFF * (2 ** (attempt - 1)))
+        sleep(random.uniform(0, backoff))
+
+    def _request(self, method, url, data=None, headers={}):
+        record = RequestRecord(method, url, data, headers,
+                               self._capturesBodies())
+        attempt = 0
+        reuse = True
+        while True:
+            record.retries = attempt
+            try:
+                connection, is_new = self._pool.checkout(reuse)
+            except self.CONNECTION_ERRORS as exc:
+                # Couldn't open a new connection, so nothing was sent
+                # and the request can be retried whatever its method is
+                if attempt >= self.MAX_RETRIES:
+                    record.markDone(error=exc)
+                    self._notifyRequestHooks(record)
+                    raise
+            else:
+                record.markConnected()
+                try:
+                    connection.request(method, url, data, headers)
+                    response = connection.getresponse()
+                    record.markResponse(response.status,
+                                        response.getheaders())
+                    return NeoResponse(response, self._pool, connection,
+                                       record, self._notifyRequestHooks)
+                except self.CONNECTION_ERRORS as exc:
+                    self._pool.checkin(connection, reusable=False)
+                    # The request may have reached the server, so it's sent
+                    # again only if it's idempotent
+                    if not is_new and reuse and \
+                            method in self.IDEMPOTENT_METHODS:
+                        # The next attempt is on a new connection
+                        reuse = False
+                        attempt += 1
+                        continue
+                    if method not in self.IDEMPOTENT_METHODS or\
+                            attempt >= self.MAX_RETRIES:
+                        record.markDone(error=exc)
+                        self._notifyRequestHooks(record)
+                        raise
+            attempt += 1
+            self._backoff(attempt)
 
     def _login(self):
         if self._session:
             return True
-        url = "/neo/login"
+        with self._login_lock:
+            # Another thread may have logged in while we were waiting
+            if self._session:
+                return True
+            return self._authenticate()
+
+    def _authenticate(self):
+        '''
+        Gets a new session, either from the session cache or by logging in
+        to NEO. The caller must hold the login lock.
+        '''
+        if self._session_cache is not None:
+            self._session = self._session_cache.load()
+            if self._session:
+                return True
         data = urllib.urlencode({'username': self._username,
                                  'password': self._password})
         headers = {"Content-type": "application/x-www-form-urlencoded",
                    "Accept": "text/plain"}
-        self._connection.request("POST", url, data, headers)
-        resp = self._connection.getresponse()
-        if not resp or resp.status != httplib.OK:
+        resp = self._request("POST", self.LOGIN_URL, data, headers)
+        resp.read()
+        if resp.status != httplib.OK:
             raise NeoConnectionError(
                 "Failed to connect with NEO on '%s'" % self._server)
-        cookies = resp.getheader("Set-Cookie")
+        cookies = resp.getheader("Set-Cookie", "")
         cookies = cookies.split(";")
         for cookie in cookies:
             cookie = cookie.strip()
             if cookie and cookie.startswith(self.SESSION_PREFIX):
                 self._session = cookie[len(self.SESSION_PREFIX):]
+                self._saveSession(SessionCache.parseExpiry(cookies))
                 return True
         raise NeoConnectionError(
             "Failed to connect with NEO on '%s'" % self._server)
 
-    def _updateHeaders(self, headers):
+    def _saveSession(self, expires):
+        if self._session_cache is None:
+            return
+        try:
+            self._session_cache.save(self._session, expires)
+        except (IOError, OSError):
+            # The cache only saves logins, failing to write it isn't fatal
+            pass
+
+    def _renewSession(self, expired_session):
+        '''
+        Replaces a session that NEO doesn't accept anymore. When several
+        threads find out that the same session expired, only the first one
+        logs in again and the others use its new session.
+        '''
+        with self._login_lock:
+            if self._session != expired_session:
+                return True
+            if self._session_cache is not None and \
+                    self._session_cache.load() == expired_session:
+                self._session_cache.invalidate()
+            self._session = None
+            return self._authenticate()
+
+    def _isSessionExpired(self, response):
+        if response.status == httplib.UNAUTHORIZED:
+            return True
+
+        # NEO may redirect requests of an expired session to the login page
+        if response.status in self.REDIRECT_STATUSES:
+            location = response.getheader("Location") or ""
+            return self.LOGIN_URL in location
+        return False
+
+    def _updateHeaders(self, headers, session=None):
         new_headers = {
-            "Cookie": self.SESSION_PREFIX + self._session,
+            "Cookie": self.SESSION_PREFIX + (session or self._session),
             "Rest-Version": self.REST_VERSION
         }
         new_headers.update(headers)
         return new_headers
 
-    def get(self, url, headers={}):
+    def _sendRequest(self, method, url, data=None, headers={}):
         self._login()
+        session = self._session
+        response = self._request(method, url, data,
+                                 self._updateHeaders(headers, session))
+
+        # The session expired (or NEO was restarted). Log in again, once,
+        # and replay the request with the new session.
+        if self._isSessionExpired(response):
+            response.read()
+            self._renewSession(session)
+            response = self._request(method, url, data,
+                                     self._updateHeaders(headers))
+        return response
+
+    def get(self, url, headers={}):
         if "tz=" not in url:
             url = "%s%stz=%s" % (
                 url, '&' if '?' in url else '?', str(localTzname()))
-        self._connection.request("GET", url,
-                                 headers=self._updateHeaders(headers))
-        return self._connection.getresponse()
+        if self._compress:
+            headers = dict(self.COMPRESSION_HEADER, **headers)
+        return self._sendRequest("GET", url, headers=headers)
 
     def put(self, url, data, headers={}):
-        self._login()
-        self._connection.request("PUT", url, data,
-                                 self._updateHeaders(headers))
-        return self._connection.getresponse()
+        return self._sendRequest("PUT", url, data, headers)
 
     def delete(self, url, headers={}):
-        self._login()
-        self._connection.request("DELETE", url,
-                                 headers=self._updateHeaders(headers))
-        return self._connection.getresponse()
+        return self._sendRequest("DELETE", url, headers=headers)
 
-    def post(self, url, data, headers={}):
-        self._login()
-        self._connection.request("POST", url, data,
-                                 self._updateHeaders(headers))
-        return self._connection.getresponse()
+    def post(self, url, data=None, headers={}):
+        return self._sendRequest("POST", url, data, headers)
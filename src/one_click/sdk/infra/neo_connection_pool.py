@@ -0,0 +1,160 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+import httplib
+import select
+import threading
+import Queue
+
+
+class NeoConnectionPool(object):
+    """
+    A bounded, thread safe pool of persistent HTTP/HTTPS connections to a
+    single NEO server.
+
+    A connection is checked out for one request/response exchange and is
+    checked back in once the response body was consumed, so several
+    requests can be in flight at once while the TCP (and TLS) handshake is
+    paid only once per pooled connection.
+
+    The pool of a server is shared by the whole process, and its limit of
+    connections is the largest one that any of its users asked for.
+    """
+
+    DEFAULT_MAX_CONNECTIONS = 4
+
+    # Pools shared by every NeoConnection in the process,
+    # keyed by (protocol, server, port)
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, server, port=80, protocol="http",
+                 max_connections=DEFAULT_MAX_CONNECTIONS):
+        self._server = server
+        self._port = port
+        self._protocol = protocol
+        self._max_connections = max_connections
+
+        # Most recently used connections are reused first, so idle
+        # connections that NEO may have already dropped stay at the bottom
+        self._idle = Queue.LifoQueue()
+        # Not bounded, as grow() adds slots
+        self._slots = threading.Semaphore(max_connections)
+        self._limit_lock = threading.Lock()
+
+    @classmethod
+    def getPool(cls, server, port=80, protocol="http",
+                max_connections=DEFAULT_MAX_CONNECTIONS):
+        '''
+        Returns the pool shared by the whole process for the given server,
+        creating it on first use. An existing pool grows to
+        'max_connections' if its limit is lower.
+        '''
+        key = (protocol, server, port)
+        with cls._pools_lock:
+            pool = cls._pools.get(key)
+            if pool is None:
+                pool = cls(server, port, protocol, max_connections)
+                cls._pools[key] = pool
+            else:
+                pool.grow(max_connections)
+            return pool
+
+    @property
+    def max_connections(self):
+        return self._max_connections
+
+    def grow(self, max_connections):
+        '''
+        Raises the limit of connections to 'max_connections'. The limit is
+        never lowered, as other users of the pool may rely on it.
+        '''
+        with self._limit_lock:
+            extra = max_connections - self._max_connections
+            if extra <= 0:
+                return
+            self._max_connections = max_connections
+        for _ in xrange(extra):
+            self._slots.release()
+
+    def _newConnection(self):
+        if self._protocol == "http":
+            connection = httplib.HTTPConnection(self._server, self._port)
+        else:
+            connection = httplib.HTTPSConnection(self._server, self._port)
+        connection.connect()
+        return connection
+
+    @staticmethod
+    def _isDropped(connection):
+        '''
+        An idle connection should have nothing to read. If its socket is
+        readable, the server either closed it or sent unexpected data, and
+        either way it can't be used for a new request.
+        '''
+        sock = connection.sock
+        if sock is None:
+            return True
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (select.error, ValueError):
+            return True
+        return bool(readable)
+
+    def _getIdleConnection(self):
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except Queue.Empty:
+                return None
+            if not self._isDropped(connection):
+                return connection
+            connection.close()
+
+    def checkout(self, reuse=True):
+        '''
+        Returns a tuple of (connection, is_new). An idle connection is
+        reused if possible (and 'reuse'), otherwise a new one is opened.
+        Blocks while all the connections of the pool are in use.
+        '''
+        self._slots.acquire()
+        try:
+            connection = self._getIdleConnection() if reuse else None
+            if connection is not None:
+                return connection, False
+            return self._newConnection(), True
+        except:
+            self._slots.release()
+            raise
+
+    def checkin(self, connection, reusable=True):
+        '''
+        Returns a connection to the pool. Connections that are not in a
+        known state (e.g. the response was not fully read) are closed.
+        '''
+        if reusable:
+            self._idle.put(connection)
+        else:
+            connection.close()
+        self._slots.release()
+
+    def close(self):
+        '''
+        Closes all the idle connections of the pool.
+        '''
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except Queue.Empty:
+                return
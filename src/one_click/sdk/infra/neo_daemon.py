@@ -0,0 +1,260 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+import errno
+import json
+import os
+import socket
+import sys
+
+# The protocol is JSON lines. The client sends one request line, either
+# {"argv": [<subcommand>, <arguments>...], "cwd": <dir>} to run a
+# subcommand, or {"control": "ping" | "stop"}. The daemon streams back
+# {"out": <text>} and {"err": <text>} lines while the subcommand runs, and
+# a final {"exit": <exit code>} line.
+DEFAULT_SOCKET_PATH = os.path.join(os.path.expanduser("~"), ".neo_sdk",
+                                   "daemon.sock")
+CONTROL_PING = "ping"
+CONTROL_STOP = "stop"
+
+
+class DaemonUnavailable(Exception):
+    pass
+
+
+class DaemonOutput(object):
+    """
+    A file like object that streams what a subcommand prints to the client
+    """
+
+    def __init__(self, client_file, stream):
+        self._client_file = client_file
+        self._stream = stream
+        self.softspace = 0
+
+    def write(self, data):
+        if not data:
+            return
+        if isinstance(data, str):
+            data = data.decode("utf-8", "replace")
+        self._client_file.write(json.dumps({self._stream: data}) + "\n")
+        self._client_file.flush()
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+
+class NeoDaemon(object):
+    """
+    A long running process that runs SDK subcommands for clients that
+    connect to its Unix domain socket. 'command_runner(argv)' runs a
+    subcommand in the process (argv is [<subcommand>, <arguments>...]).
+
+    The daemon pays for the interpreter start-up and the imports once, and
+    since the connection pools and the sessions of NeoConnection are kept
+    by the process, the subcommands it runs reuse open connections to NEO
+    and logged in sessions instead of connecting and logging in again.
+
+    Subcommands run one at a time, in the working directory of the client,
+    because they print to the process wide sys.stdout and sys.stderr. The
+    daemon exits after 'idle_timeout' seconds without requests (None -
+    never).
+    """
+
+    def __init__(self, command_runner, socket_path=DEFAULT_SOCKET_PATH,
+                 idle_timeout=None):
+        self._command_runner = command_runner
+        self._socket_path = socket_path
+        self._idle_timeout = idle_timeout
+        self._server = None
+        self._running = False
+
+    def _bind(self):
+        socket_dir = os.path.dirname(self._socket_path)
+        if socket_dir and not os.path.isdir(socket_dir):
+            os.makedirs(socket_dir, 0700)
+
+        # A socket file that nobody listens on was left by a daemon that
+        # didn't exit cleanly
+        if os.path.exists(self._socket_path):
+            if ping(self._socket_path):
+                raise DaemonUnavailable("A daemon already listens on '%s'" %
+                                        self._socket_path)
+            os.remove(self._socket_path)
+
+        # Only the owner may connect, as the daemon runs commands with the
+        # credentials of its clients
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0177)
+        try:
+            server.bind(self._socket_path)
+        finally:
+            os.umask(old_umask)
+        server.listen(16)
+        server.settimeout(self._idle_timeout)
+        self._server = server
+
+    def serveForever(self):
+        self._bind()
+        self._running = True
+        try:
+            while self._running:
+                try:
+                    client, _ = self._server.accept()
+                except socket.timeout:
+                    return
+                except socket.error as exc:
+                    if exc.args[0] == errno.EINTR:
+                        continue
+                    raise
+                client.settimeout(None)
+                try:
+                    self._handle(client)
+                finally:
+                    client.close()
+        finally:
+            self._server.close()
+            self._server = None
+            try:
+                os.remove(self._socket_path)
+            except OSError:
+                pass
+
+    def _handle(self, client):
+        client_file = client.makefile("r+b")
+        try:
+            try:
+                request = json.loads(client_file.readline())
+            except ValueError:
+                return
+            if request.get("control") == CONTROL_STOP:
+                self._running = False
+            if "control" in request:
+                exit_code = 0
+            else:
+                exit_code = self._runCommand(request, client_file)
+            client_file.write(json.dumps({"exit": exit_code}) + "\n")
+            client_file.flush()
+        except socket.error:
+            # The client went away (e.g. Ctrl-C)
+            pass
+        finally:
+            client_file.close()
+
+    def _runCommand(self, request, client_file):
+        '''
+        Runs a subcommand with its output streamed to the client.
+        Returns the exit code.
+        '''
+        from neo_connection import NeoConnection
+
+        saved_state = (sys.argv, sys.stdout, sys.stderr, os.getcwd(),
+                       list(NeoConnection._request_hooks))
+        sys.stdout = DaemonOutput(client_file, "out")
+        sys.stderr = DaemonOutput(client_file, "err")
+        argv = [arg.encode("utf-8") for arg in request.get("argv") or []]
+        try:
+            os.chdir(request.get("cwd") or saved_state[3])
+            self._command_runner(argv)
+            return 0
+        except SystemExit as exc:
+            if exc.code is None or isinstance(exc.code, int):
+                return exc.code or 0
+            sys.stderr.write("%s\n" % exc.code)
+            return 1
+        except socket.error:
+            raise
+        except Exception as exc:
+            sys.stderr.write("-E- Got an error while running %s: %s\n" %
+                             (" ".join(argv[:1]), exc))
+            return 1
+        finally:
+            sys.argv, sys.stdout, sys.stderr = saved_state[:3]
+            os.chdir(saved_state[3])
+            # Hooks that the subcommand added (e.g. --stats or --record)
+            # must not apply to the next ones
+            NeoConnection._request_hooks[:] = saved_state[4]
+
+
+def _connect(socket_path):
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+    except socket.error as exc:
+        client.close()
+        raise DaemonUnavailable("Couldn't connect to the daemon on '%s': %s" %
+                                (socket_path, exc))
+    return client
+
+
+def _send(socket_path, request, stdout=None, stderr=None):
+    '''
+    Sends a request to the daemon, writes its output to 'stdout' and
+    'stderr' as it arrives, and returns the exit code.
+    '''
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    client = _connect(socket_path)
+    try:
+        client_file = client.makefile("r+b")
+        client_file.write(json.dumps(request) + "\n")
+        client_file.flush()
+        for line in client_file:
+            message = json.loads(line)
+            if "out" in message:
+                stdout.write(message["out"].encode("utf-8"))
+                stdout.flush()
+            elif "err" in message:
+                stderr.write(message["err"].encode("utf-8"))
+                stderr.flush()
+            elif "exit" in message:
+                return message["exit"]
+    finally:
+        client.close()
+    # The subcommand may have run, so this isn't a DaemonUnavailable
+    raise IOError("The daemon closed the connection")
+
+
+def run(argv, socket_path=DEFAULT_SOCKET_PATH, stdout=None, stderr=None):
+    '''
+    Runs a subcommand (argv is [<subcommand>, <arguments>...]) by the
+    daemon, and returns its exit code. Raises DaemonUnavailable if there is
+    no daemon to run it, in which case nothing was run.
+    '''
+    return _send(socket_path, {"argv": list(argv), "cwd": os.getcwd()},
+                 stdout, stderr)
+
+
+def ping(socket_path=DEFAULT_SOCKET_PATH):
+    '''
+    Returns True if a daemon listens on the socket
+    '''
+    try:
+        return _send(socket_path, {"control": CONTROL_PING}) == 0
+    except (DaemonUnavailable, socket.error, ValueError):
+        return False
+
+
+def stop(socket_path=DEFAULT_SOCKET_PATH):
+    '''
+    Asks the daemon to exit once it's done with the current request
+    '''
+    return _send(socket_path, {"control": CONTROL_STOP}) == 0
@@ -0,0 +1,228 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+import httplib
+import itertools
+import json
+from multiprocessing.pool import ThreadPool
+from sdk_exceptions import RequestFailed
+
+
+class NeoPage(object):
+    """
+    A page of a collection. The response is read when the page is created,
+    so its connection goes back to the pool right away. 'objects' is None
+    if the response isn't a JSON list (e.g. an error).
+    """
+
+    def __init__(self, offset, response):
+        self.offset = offset
+        self.status = response.status
+        self.body = response.read()
+        self.raw_bytes = getattr(response, "raw_bytes", len(self.body))
+        self.objects = None
+        if self.status < httplib.BAD_REQUEST:
+            try:
+                objects = json.loads(self.body)
+            except ValueError:
+                objects = None
+            if isinstance(objects, list):
+                self.objects = objects
+
+
+class NeoPager(object):
+    """
+    Iterates over the objects of a NEO collection page by page, requesting
+    'page_size' objects at a time with the 'offset' and 'limit' query
+    parameters, e.g.
+        for job in NeoPager(neo_session, "/neo/app/jobs", 100):
+            ...
+
+    With 'prefetch', the next page is requested in the background while
+    the objects of the current one are consumed, so the first objects are
+    available once the first page arrived, and the next pages usually
+    arrived by the time they're needed.
+
+    The paging ends at a page with fewer objects than requested. A server
+    that ignores the paging parameters returns the whole collection, which
+    ends the paging too. A server that honors the limit but ignores the
+    offset returns the first page again, and the rest of the collection is
+    then read in one request without the paging parameters.
+    """
+
+    DEFAULT_PAGE_SIZE = 500
+
+    def __init__(self, neo_session, url, page_size=DEFAULT_PAGE_SIZE,
+                 prefetch=True):
+        if page_size < 1:
+            raise ValueError("The page size must be positive")
+        self._neo_session = neo_session
+        self._url = url
+        self._page_size = page_size
+        self._prefetch = prefetch
+
+    def _pageUrl(self, offset):
+        delimiter = "&" if "?" in self._url else "?"
+        return "%s%soffset=%d&limit=%d" % (self._url, delimiter, offset,
+                                            self._page_size)
+
+    def _fetch(self, offset):
+        return NeoPage(offset, self._neo_session.get(self._pageUrl(offset)))
+
+    def _fetchRest(self, first_page, offset):
+        '''
+        Returns the page of the objects from 'offset' on, read in one
+        request without the paging parameters, for a server that ignores
+        the offset
+        '''
+        page = NeoPage(0, self._neo_session.get(self._url))
+        if page.objects is None:
+            return page
+        if page.objects[:self._page_size] != first_page.objects:
+            raise RequestFailed("NEO ignores the offset of %s, and the "
+                                "collection changed while it was read" %
+                                self._url)
+        page.offset = offset
+        page.objects = page.objects[offset:]
+        page.body = json.dumps(page.objects)
+        return page
+
+    def _isLast(self, page):
+        return page.objects is None or len(page.objects) != self._page_size
+
+    def iterPages(self):
+        '''
+        Yields the pages of the collection (NeoPage). A page whose response
+        isn't a list of objects (e.g. an error) is the last one.
+        '''
+        workers = ThreadPool(1) if self._prefetch else None
+        try:
+            page = first_page = self._fetch(0)
+            while True:
+                # A server that ignores the offset returns the first page
+                # again
+                if page is not first_page and page.objects and \
+                        page.objects[0] == first_page.objects[0]:
+                    yield self._fetchRest(first_page, page.offset)
+                    return
+                if self._isLast(page):
+                    yield page
+                    return
+                offset = page.offset + self._page_size
+                if workers is None:
+                    yield page
+                    page = self._fetch(offset)
+                    continue
+                next_page = workers.apply_async(self._fetch, (offset,))
+                yield page
+                # AsyncResult.get() without a timeout can't be interrupted
+                # by Ctrl-C
+                while not next_page.ready():
+                    next_page.wait(1)
+                page = next_page.get()
+        finally:
+            # A page that is still fetched is dropped by the worker
+            if workers is not None:
+                workers.close()
+
+    def __iter__(self):
+        for page in self.iterPages():
+            if page.objects is None:
+                raise RequestFailed("Couldn't read the page at offset %d: "
+                                    "NEO returned status %s: %s" %
+                                    (page.offset, page.status, page.body))
+            for obj in page.objects:
+                yield obj
+
+
+class PagedResponse(object):
+    """
+    A file like response (like the ones of NeoConnection.get()) of a whole
+    collection read by a NeoPager. Its body is the JSON list of the objects
+    of all the pages, which are requested while the body is read. Its
+    status is the status of the first page, and if the first page isn't a
+    list of objects (e.g. an error), so is its body.
+
+    The objects can also be read already decoded with iterObjects(),
+    instead of the body. 'raw_bytes' and 'decoded_bytes' count the bytes
+    of the pages read from the network and the bytes returned to the
+    caller so far.
+    """
+
+    def __init__(self, pager):
+        self._pages = pager.iterPages()
+        first_page = next(self._pages)
+        self.status = first_page.status
+        self.raw_bytes = 0
+        self.decoded_bytes = 0
+        self._buffer = ""
+        self._first_page = first_page
+        self._chunks = self._iterChunks(first_page)
+
+    def _iterOkPages(self, first_page):
+        for page in itertools.chain([first_page], self._pages):
+            self.raw_bytes += page.raw_bytes
+            if page.objects is None:
+                raise RequestFailed("Couldn't read the page at offset %d: "
+                                    "NEO returned status %s: %s" %
+                                    (page.offset, page.status, page.body))
+            yield page
+
+    def _iterChunks(self, first_page):
+        if first_page.objects is None:
+            self.raw_bytes += first_page.raw_bytes
+            yield first_page.body
+            return
+        yield "["
+        separator = ""
+        for page in self._iterOkPages(first_page):
+            # The objects as NEO encoded them, without the list brackets
+            objects = page.body.strip()[1:-1].strip()
+            if objects:
+                yield separator + objects
+                separator = ", "
+        yield "]"
+
+    def iterObjects(self):
+        '''
+        Generator of the objects of all the pages, as the pager decoded
+        them. Returns None if the first page isn't a list of objects, whose
+        body is then read(). The body can't be read once this was called.
+        '''
+        if self._first_page.objects is None:
+            return None
+        self._chunks = iter(())
+        return self._iterObjects()
+
+    def _iterObjects(self):
+        for page in self._iterOkPages(self._first_page):
+            self.decoded_bytes += len(page.body)
+            for obj in page.objects:
+                yield obj
+
+    def getheader(self, name, default=None):
+        return default
+
+    def read(self, amt=None):
+        while amt is None or len(self._buffer) < amt:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if amt is None:
+            data, self._buffer = self._buffer, ""
+        else:
+            data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        self.decoded_bytes += len(data)
+        return data
@@ -15,20 +15,26 @@
 """
 
 import re
-from time import sleep
 import json
+import httplib
 import argparse
 from argparse import FileType
 import textwrap
 import copy
 import sys
+import time
 from os.path import basename
 from url import URL
 from sdk_exceptions import ActionNotSupported, MissingParam, MissingArgument
 from sdk_exceptions import PayloadBadFormat, ParamBadFormat, InvalidParam
-from sdk_exceptions import BadFileFormat
+from sdk_exceptions import BadFileFormat, JobNotCreated, InvalidArgument
+from sdk_exceptions import RequestFailed
 from sdk_print import SDKPrint
+from sdk_output import SdkOutput
 from neo_connection import NeoConnection
+from request_stats import RequestStats
+from job_poll_policy import JobPollPolicy
+from job_watcher import JobWatcher
 
 
 class NeoSdk(object):
@@ -54,23 +60,54 @@ class NeoSdk(object):
     SHOULD_PRINT_RESPONSE = True
     SHOULD_NOT_PRINT_RESPONSE = False
 
-    # Relevant to running tasks - The time (in seconds) between each
-    # measurement of a job status
-    SLEEP_INTERVALS = 1
+    # Relevant to running tasks - The statuses of a job that ended
+    JOB_FINAL_STATUSES = JobWatcher.FINAL_STATUSES
 
-    # Relevant to running tasks - The time (in seconds) we should check
-    # if the job was completed.
-    NUM_OF_SLEEP_INTERVALS = 300
+    # Ways to track the jobs of tasks
+    JOB_TRACKING_POLL = "poll"
+    JOB_TRACKING_EVENTS = "events"
+    JOB_TRACKING_PUSH = "push"
+    JOB_TRACKING_OPTIONS = (JOB_TRACKING_POLL, JOB_TRACKING_EVENTS,
+                            JOB_TRACKING_PUSH)
 
-    def __init__(self, url):
+    def __init__(self, url, connection=None, stdout=None, **arguments):
         """
         Constructor
+
+        Without 'connection' and 'arguments', the arguments are parsed from
+        the command line. Otherwise the SDK is used as a library:
+        'arguments' are the values of the command line options, by their
+        long names (e.g. server="10.0.0.1", job_timeout=60), and
+        'connection' is a NeoConnection that may be shared by several SDK
+        objects, so they log in only once.
+
+        'stdout' is the stream of the text the actions print (e.g. their
+        progress), by default sys.stdout, or sys.stderr with a machine
+        readable output so sys.stdout holds only its records.
         """
 
         self._arguments = None
+        self._request_stats = None
+        self._request_hooks = []
+        self._job_poller = None
+        self._webhook_receiver = None
 
         # Parsing the arguments and inserting them to 'self._arguments'
-        self._parseArgs()
+        if connection is None and not arguments:
+            self._parseArgs()
+        else:
+            self._setArgs(arguments)
+
+        # Text, or a machine readable output
+        self._output = SdkOutput(self._arguments.output)
+        if stdout is None:
+            stdout = sys.stderr if self._output.structured else sys.stdout
+        self._stdout = stdout
+
+        # Collecting the statistics of all the requests sent to NEO
+        if self._arguments.stats:
+            self._request_stats = RequestStats()
+            self._addRequestHook(self._request_stats)
 
         # Setting the base url
 #         self._base_url = URL.getBaseURL(self._arguments.protocol,
@@ -79,18 +116,69 @@ class NeoSdk(object):
 
         self._action_url = self._base_url + url
 
+        # Recording the exchanges with NEO to a cassette, or serving them
+        # back from a cassette instead of connecting to NEO
+        replay_pool = None
+        if self._arguments.replay:
+            from neo_cassette import CassetteReplayPool
+            replay_pool = CassetteReplayPool(self._arguments.replay,
+                                             self._arguments.replay_speed)
+        elif self._arguments.record:
+            from neo_cassette import CassetteRecorder
+            self._addRequestHook(CassetteRecorder(self._arguments.record))
+
         # Login to NEO
-        self._neo_session = NeoConnection(self._arguments.username,
-                                          self._arguments.password,
-                                          self._arguments.server,
-                                          port=80,
-                                          protocol=self._arguments.protocol)
+        if connection is not None:
+            self._neo_session = connection
+        else:
+            self._neo_session = NeoConnection(
+                self._arguments.username,
+                self._arguments.password,
+                self._arguments.server,
+                port=80,
+                protocol=self._arguments.protocol,
+                compress=self._arguments.compress,
+                session_cache=replay_pool is None,
+                pool=replay_pool)
 
         self._action_parameters = self._getActionOptions()
 
+    def _addRequestHook(self, hook):
+        '''
+        Adds a request hook of the SDK object, which close() removes
+        '''
+        self._request_hooks.append(hook)
+        NeoConnection.addRequestHook(hook)
+
+    def _print(self, text=""):
+        print >> self._stdout, text
+
     def _getRequestURL(self, url_path):
         return "/".join((self._action_url, url_path))
 
+    def _getCollection(self, url):
+        '''
+        Gets a collection in one request, or page by page if a page size
+        was given (see _addPagingArgs)
+        '''
+        if not self._arguments.page_size:
+            return self._neo_session.get(url)
+        # Imported here, as the pager's thread pool slows down the start
+        from neo_pager import NeoPager, PagedResponse
+        return PagedResponse(NeoPager(self._neo_session, url,
+                                      self._arguments.page_size))
+
+    def iterCollection(self, page_size=None):
+        '''
+        Generator of the objects of the SDK collection (e.g. all the jobs),
+        read page by page (of NeoPager.DEFAULT_PAGE_SIZE objects by
+        default), with the next page requested while the current one is
+        consumed
+        '''
+        from neo_pager import NeoPager
+        return iter(NeoPager(self._neo_session, self._action_url,
+                             page_size or NeoPager.DEFAULT_PAGE_SIZE))
+
     @classmethod
     def _castAttributes(cls, input_data, attr_conversion_mapping):
         """
@@ -201,6 +289,44 @@ class NeoSdk(object):
         parser.add_argument("-b", "--blocking", action="store_true",
                             required=False, default=False,
                             help="Blocks any action while running a task")
+        parser.add_argument("--progress", action="store_true",
+                            required=False, default=False,
+                            help="Print the sub jobs whose status changed "
+                                 "while blocking")
+        self._addJobTrackingArgs(parser)
+
+    def _addJobTrackingArgs(self, parser):
+        parser.add_argument("--job-timeout", action="store", type=float,
+                            required=False,
+                            default=JobPollPolicy.DEFAULT_DEADLINE,
+                            help="The time (in seconds) to wait for the "
+                                 "jobs to end")
+        parser.add_argument("--job-tracking", action="store",
+                            required=False, default=self.JOB_TRACKING_POLL,
+                            choices=self.JOB_TRACKING_OPTIONS,
+                            help="How to track jobs: poll them, follow the "
+                                 "NEO events, or receive the events NEO "
+                                 "pushes (default: %(default)s)")
+        self._addPushArgs(parser)
+
+    def _addPushArgs(self, parser):
+        parser.add_argument("--push-port", action="store", type=int,
+                            required=False, default=0,
+                            help="Local port that receives the events NEO "
+                                 "pushes (default: any free port)")
+        parser.add_argument("--push-host", action="store", required=False,
+                            default=None,
+                            help="Address NEO pushes the events to "
+                                 "(default: the local address of the "
+                                 "route to NEO)")
+
+    def _addPagingArgs(self, parser):
+        parser.add_argument("--page-size", action="store", type=int,
+                            required=False, default=None,
+                            help="Read the collection in pages of this "
+                                 "number of objects, requesting the next "
+                                 "page while the current one is printed "
+                                 "(default: in one request)")
 
     def _addFileArg(self, parser, file_help):
         parser.add_argument("-f", "--file", action="store",
@@ -276,6 +402,40 @@ class NeoSdk(object):
                                 default="http", required=False,
                                 choices=["http", "https"],
                                 help="Protocol (http or https)")
+        connection.add_argument("-z", "--compress", action="store_true",
+                                required=False, default=False,
+                                help="Request gzip/deflate compressed "
+                                     "responses")
+        connection.add_argument("--stats", action="store_true",
+                                required=False, default=False,
+                                help="Print latency and size statistics "
+                                     "of the requests sent to NEO")
+
+        output = parser.add_argument_group('output')
+        output.add_argument("--output", action="store", required=False,
+                            default=SdkOutput.TEXT, choices=SdkOutput.MODES,
+                            help="Output format: text, a JSON document, or "
+                                 "JSON lines streamed as they're known "
+                                 "(default: %(default)s)")
+
+        cassette = parser.add_argument_group('cassette')
+        cassette_file = cassette.add_mutually_exclusive_group()
+        cassette_file.add_argument("--record", action="store",
+                                   required=False, default=None,
+                                   metavar="CASSETTE",
+                                   help="Record the exchanges with NEO to a "
+                                        "cassette file (gzip compressed if "
+                                        "it ends with .gz)")
+        cassette_file.add_argument("--replay", action="store",
+                                   required=False, default=None,
+                                   metavar="CASSETTE",
+                                   help="Serve the exchanges recorded in a "
+                                        "cassette file instead of "
+                                        "connecting to NEO")
+        cassette.add_argument("--replay-speed", action="store", type=float,
+                              required=False, default=1.0,
+                              help="Replay speed factor (1 - original "
+                                   "speed, 0 - no delays)")
 
     def _addSessionArgs(self, parser):
         '''
@@ -291,12 +451,32 @@ class NeoSdk(object):
         This method parses SDK command line arguments
         '''
 
+        parser = self._createParser()
+        self._arguments = parser.parse_args()
+        self._validateArgs(self._arguments.option)
+
+    def _createParser(self):
         parser = argparse.ArgumentParser(
             formatter_class=argparse.RawTextHelpFormatter)
         self._addDefaultArgs(parser)
         self._addSessionArgs(parser)
-        self._arguments = parser.parse_args()
-        self._validateArgs(self._arguments.option)
+        return parser
+
+    def _setArgs(self, arguments):
+        '''
+        Sets the arguments of library mode: the given values on top of
+        the defaults of the command line options
+        '''
+        parser = self._createParser()
+        values = dict((action.dest, action.default)
+                      for action in parser._actions
+                      if action.dest != argparse.SUPPRESS)
+        unknown = set(arguments) - set(values)
+        if unknown:
+            raise InvalidArgument("Unknown arguments: %s" %
+                                  ", ".join(sorted(unknown)))
+        values.update(arguments)
+        self._arguments = argparse.Namespace(**values)
 
     # =====================================================================
     #                    Parameters Functions
@@ -370,57 +550,143 @@ class NeoSdk(object):
     #                    Execution
     # =====================================================================
 
-    def _validateJob(self, response):
-
-        # Get the id of the job that was created as
-        # a result of running the task
+    def _getJobId(self, response_text):
+        '''
+        Returns the id of the job that was created as a result of running
+        a task
+        '''
         job_id_regex = r"%s/(\d+)" % URL.JOBS_URL
-        job_id = re.search(job_id_regex, response.read()).group(1)
-
-        print("[*] Running job %s" % job_id)
-
-        job_status = "Running"
-        counter = 0
-        while job_status not in ("Completed", "Aborted", "Canceled",
-                                 "Completed With Errors") and\
-                counter < self.NUM_OF_SLEEP_INTERVALS:
-            job_id_res = self._neo_session.get(
-                "%s%s/%s" % (self._base_url,
-                             URL.JOBS_URL,
-                             job_id))
-            job_status = json.loads(job_id_res.read())["Status"]
-            sleep(self.SLEEP_INTERVALS)
-            counter += 1
-
-        job_id_res = self._neo_session.get(
-            "%s%s/%s" % (self._base_url,
-                         URL.JOBS_URL,
-                         job_id))
-                         
-        sub_jobs_id_res = self._neo_session.get(
+        return re.search(job_id_regex, response_text).group(1)
+
+    def _submitJob(self, response):
+        '''
+        Returns a JobFuture of the job that was created as a result of
+        running a task
+        '''
+        response_text = response.read()
+        if response.status != httplib.ACCEPTED:
+            raise JobNotCreated("NEO didn't create a job (status %s): %s" %
+                                (response.status, response_text))
+        return self._getJobPoller().submit(self._getJobId(response_text))
+
+    def _getJobPoller(self):
+        '''
+        Returns the poller that tracks the jobs of this session
+        '''
+        if self._job_poller is None:
+            # The job tracking modules are imported only when they're used,
+            # to keep the start up of the SDK scripts short
+            from job_future import JobPoller
+            from job_event_notifier import JobEventNotifier, JobPushNotifier
+            tracking = self._arguments.job_tracking
+            if tracking == self.JOB_TRACKING_PUSH:
+                self._job_poller = JobPushNotifier(
+                    self._neo_session, self._getWebhookReceiver(),
+                    self._base_url)
+            elif tracking == self.JOB_TRACKING_EVENTS:
+                self._job_poller = JobEventNotifier(self._neo_session,
+                                                    self._base_url)
+            else:
+                self._job_poller = JobPoller(self._neo_session,
+                                             self._base_url)
+        return self._job_poller
+
+    def _getWebhookReceiver(self):
+        '''
+        Returns a webhook receiver that is registered as a notification
+        target of NEO, for the rest of the session
+        '''
+        if self._webhook_receiver is None:
+            from neo_webhook_receiver import NeoWebhookReceiver
+            receiver = NeoWebhookReceiver(
+                port=self._arguments.push_port,
+                advertised_host=self._arguments.push_host,
+                neo_server=self._arguments.server).start()
+            receiver.register(self._neo_session, self._arguments.server,
+                              self._base_url)
+            self._webhook_receiver = receiver
+        return self._webhook_receiver
+
+    def close(self):
+        '''
+        Releases the resources of the session (e.g. removes the webhook
+        notification target from NEO)
+        '''
+        if self._webhook_receiver is not None:
+            self._webhook_receiver.stop()
+            self._webhook_receiver = None
+        # The hooks are process wide, so the requests of the SDK objects
+        # created next (e.g. by a batch) aren't passed to them
+        for hook in self._request_hooks:
+            NeoConnection.removeRequestHook(hook)
+        self._request_hooks = []
+
+    def _printSubJobProgress(self, progress, policy, job):
+        changed = progress.update()
+        if self._output.structured:
+            for sub_job in changed:
+                self._output.record("sub_job", sub_job)
+            return
+        for sub_job in changed:
+            self._print("[*]   %s" % progress.describe(sub_job))
+        if changed:
+            self._print("[*] %s" % progress.summary(
+                policy.elapsed(),
+                policy.estimateRemaining(job.get("Progress"))))
+        self._stdout.flush()
+
+    def _validateJob(self, response):
+        job_id = self._getJobId(response.read())
+
+        if not self._output.structured:
+            self._print("[*] Running job %s" % job_id)
+
+        job_url = "%s%s/%s" % (self._base_url, URL.JOBS_URL, job_id)
+        policy = JobPollPolicy(self._arguments.job_timeout)
+        progress = None
+        if self._arguments.progress:
+            from sub_job_progress import SubJobProgress
+            progress = SubJobProgress(self._neo_session, job_id,
+                                      self._base_url)
+        while True:
+            # The last poll holds the final state of the job
+            job_res = self._neo_session.get(job_url).read()
+            job = json.loads(job_res)
+            job_status = job["Status"]
+            if progress is not None:
+                self._printSubJobProgress(progress, policy, job)
+            if job_status in self.JOB_FINAL_STATUSES or policy.expired():
+                break
+            policy.wait(job.get("Progress"))
+
+        sub_jobs_res = self._neo_session.get(
             "%s%s?parent_id=%s" % (self._base_url,
                                    URL.JOBS_URL,
-                                   job_id))
-
-        job_res = job_id_res.read()
-        sub_jobs_res = sub_jobs_id_res.read()
-                         
-        if job_status == "Completed":
-            print("[*] Job completed successfully")
-            print("[*] Job response:")
-            print(job_res)
-            print("[*] Sub Jobs response:")
-            print(sub_jobs_res)
-        elif counter < self.NUM_OF_SLEEP_INTERVALS:
-            print("[*] Job failed. Current status: %s" % job_status)
-            print("[*] Job response:")
-            print(job_res)
-            print("[*] Sub Jobs response:")
-            print(sub_jobs_res)
+                                   job_id)).read()
+
+        if self._output.structured:
+            self._output.record("job", job)
+            try:
+                self._output.record("sub_jobs", json.loads(sub_jobs_res))
+            except ValueError:
+                self._output.record("sub_jobs", sub_jobs_res)
+        elif job_status == "Completed":
+            self._print("[*] Job completed successfully")
+            self._print("[*] Job response:")
+            self._print(job_res)
+            self._print("[*] Sub Jobs response:")
+            self._print(sub_jobs_res)
+        elif job_status in self.JOB_FINAL_STATUSES:
+            self._print("[*] Job failed. Current status: %s" % job_status)
+            self._print("[*] Job response:")
+            self._print(job_res)
+            self._print("[*] Sub Jobs response:")
+            self._print(sub_jobs_res)
         else:
-            print("[*] Couldn't verify job status. It's taking too long.")
-            print("[*] Please validate manually the job's status")
-            
+            self._print("[*] Couldn't verify job status. "
+                        "It's taking too long.")
+            self._print("[*] Please validate manually the job's status")
+
     def execute(self):
         action = self._arguments.option
 
@@ -430,11 +696,52 @@ class NeoSdk(object):
                                      "Couldn't find it in "
                                      "'_getActionToDescription'" % action)
 
+        if self._output.structured:
+            return self._executeStructured(action)
+
         SDKPrint.printHeader(action_description, self._arguments.server,
-                             self._arguments.username)
+                             self._arguments.username, stream=self._stdout)
+
+        self._print("[*] %s stages:" % action_description)
+        self._print(" -1- Setting Up data...")
+
+        parameters, payload = self._getActionInput(action)
+
+        self._print(" -2- Sending %s request..." % action_description)
+
+        # Send the request to NEO
+        res, show_res = self._getActionFunction(action)(parameters, payload)
+
+        SDKPrint.printResponse(action_description, res.status, res.read(),
+                               show_res, stream=self._stdout)
+
+    def _executeStructured(self, action):
+        '''
+        Executes the action with a machine readable output. What the action
+        prints (e.g. progress messages) goes to the 'stdout' stream of the
+        SDK object (sys.stderr by default), so sys.stdout holds only the
+        output records.
+        '''
+        parameters, payload = self._getActionInput(action)
+        action_function = self._getActionFunction(action)
+
+        start = time.time()
+        res, _ = action_function(parameters, payload)
+        self._output.response(action, res, time.time() - start)
+
+    def _getActionFunction(self, action):
+        action_function = self._getActionToFunction().get(action)
+        if action_function is None:
+            raise ActionNotSupported("Option '%s' is not supported. "
+                                     "Couldn't find it in "
+                                     "'_getActionToFunction'" % action)
+        return action_function
 
-        print("[*] %s stages:" % action_description)
-        print(" -1- Setting Up data...")
+    def _getActionInput(self, action):
+        '''
+        Returns the (parameters, payload) of the action, parsed from the
+        command line arguments
+        '''
 
         param_needed, payload_needed = self._getParamAndPayloadStatus(action)
 
@@ -474,27 +781,88 @@ class NeoSdk(object):
                 payload_format = self._validatePayloadFormat()
                 payload = self._getPayloadAsJson(payload_format)
 
-        print(" -2- Sending %s request..." % action_description)
-
-        action_function = self._getActionToFunction().get(action)
-
-        if action_function is None:
-            raise ActionNotSupported("Option '%s' is not supported. "
-                                     "Couldn't find it in "
-                                     "'_getActionToFunction'" % action)
+        return parameters, payload
 
-        # Send the request to NEO
-        res, show_res = action_function(parameters, payload)
+    def request(self, action, parameters=None, payload=None):
+        '''
+        Runs an action in library mode, and returns the decoded JSON
+        response (the raw response text if it isn't JSON, None if empty).
+        An action that waits for its job (e.g. with blocking=True) returns
+        the records of the job instead: a dict of the final 'job' and its
+        'sub_jobs'.
+
+        'parameters' is a dictionary of the action parameters (list values
+        are joined), and 'payload' is the object sent as JSON.
+        Raises RequestFailed if NEO returned an error status.
+        '''
+        action_function = self._getActionFunction(action)
+
+        action_parameters = {}
+        for name, value in (parameters or {}).iteritems():
+            if isinstance(value, (list, tuple)):
+                value = self.LIST_DELIMITER.join(str(item) for item in value)
+            action_parameters[name] = str(value)
+        expected_params = self._getActionToExpectedParams().get(action, [])
+        self._validateParamExistence(action_parameters, expected_params)
+
+        # The action outputs its records (e.g. the job it waited for)
+        # instead of printing them, and they are collected
+        output, self._output = self._output, SdkOutput(SdkOutput.JSON)
+        try:
+            res, _ = action_function(action_parameters,
+                                     None if payload is None
+                                     else json.dumps(payload))
+            records = self._output.records()
+        finally:
+            self._output = output
+        response_text = res.read()
+        if res.status >= httplib.BAD_REQUEST:
+            raise RequestFailed("NEO returned status %s: %s" %
+                                (res.status, response_text))
+        if records:
+            # The job was read from the response already
+            return dict(records)
+        if not response_text:
+            return None
+        try:
+            return json.loads(response_text)
+        except ValueError:
+            return response_text
 
-        SDKPrint.printResponse(action_description, res.status, res.read(),
-                               show_res)
+    def _printStats(self):
+        '''
+        Prints the statistics of the requests sent to NEO, if collected (to
+        the standard error in a machine readable output)
+        '''
+        if self._request_stats is None:
+            return
+        SDKPrint.printStats(self._request_stats.summary(),
+                            stream=self._stdout)
 
     @classmethod
     def main(cls):
+        # The instance is created before it's initialized, so the errors of
+        # the initialization (e.g. NEO is unreachable) are written in the
+        # output format it parsed
+        neoSdkInstance = cls.__new__(cls)
+        neoSdkInstance._output = SdkOutput()
+        neoSdkInstance._request_stats = None
         try:
-            neoSdkInstance = cls()
-            neoSdkInstance.execute()
+            try:
+                neoSdkInstance.__init__()
+                try:
+                    neoSdkInstance.execute()
+                finally:
+                    neoSdkInstance.close()
+            finally:
+                # The statistics are printed when the command failed too
+                # (e.g. the login), as they often tell why
+                neoSdkInstance._printStats()
         except Exception as exc:
-            print "-E- Got an error while running %s: %s" % (
+            message = "-E- Got an error while running %s: %s" % (
                 basename(sys.argv[0]), str(exc))
+            if neoSdkInstance._output.structured:
+                neoSdkInstance._output.error(message)
+            else:
+                print message
             sys.exit(1)
@@ -0,0 +1,209 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+import BaseHTTPServer
+import SocketServer
+import binascii
+import hmac
+import json
+import os
+import socket
+import threading
+from url import URL
+
+
+class WebhookRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """
+    Accepts the events pushed by NEO (a JSON event, or a list of events) to
+    the secret push path of the receiver
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    # Bigger pushes are refused, so a client can't exhaust the memory
+    MAX_BODY_SIZE = 16 * 1024 * 1024
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        if not self.server.receiver.isPushPath(self.path.split("?")[0]):
+            # The body isn't read, so the connection can't be reused
+            self.close_connection = 1
+            return self._reply(404)
+        length = self.headers.getheader("Content-Length")
+        if length is None:
+            self.close_connection = 1
+            return self._reply(411)
+        try:
+            length = int(length)
+            if length < 0:
+                raise ValueError()
+        except ValueError:
+            self.close_connection = 1
+            return self._reply(400)
+        if length > self.MAX_BODY_SIZE:
+            self.close_connection = 1
+            return self._reply(413)
+        body = self.rfile.read(length)
+        try:
+            events = json.loads(body)
+        except ValueError:
+            return self._reply(400)
+        self._reply(200)
+        if not isinstance(events, list):
+            events = [events]
+        self.server.receiver.dispatch(events)
+
+
+class WebhookServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class NeoWebhookReceiver(object):
+    """
+    An embedded HTTP server that receives the events NEO pushes, and hands
+    them over to its listeners ('listener(event)' callables).
+
+    register() adds the receiver as a webhook notification target of NEO
+    (in '/app/notifications'), and unregister() removes it.
+
+    'host' and 'port' are the local address to listen on (port 0 picks a
+    free port), by default the local address of the route to 'neo_server'
+    (127.0.0.1 when NEO runs locally) rather than all the interfaces.
+    'advertised_host' is the address NEO sends the pushes to, by default
+    the same one.
+
+    The push url holds a random token, which NEO sends back with every
+    push, so only NEO (or whoever can read its notification targets) can
+    push events; requests to any other path are rejected.
+    """
+
+    PUSH_PATH = "/neo/push"
+    TARGET_TYPE = "Webhook"
+    TOKEN_BYTES = 16
+
+    def __init__(self, host=None, port=0, advertised_host=None,
+                 neo_server=None):
+        if host is None:
+            host = self._localAddress(neo_server)
+        self._server = WebhookServer((host, port), WebhookRequestHandler)
+        self._server.receiver = self
+        self._advertised_host = advertised_host
+        self._token = binascii.hexlify(os.urandom(self.TOKEN_BYTES))
+        self._lock = threading.Lock()
+        self._listeners = []
+        self._thread = None
+        self.target_id = None
+        self._neo_session = None
+        self._notifications_url = None
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    def _pushPath(self):
+        return "%s/%s" % (self.PUSH_PATH, self._token)
+
+    def isPushPath(self, path):
+        return hmac.compare_digest(path, self._pushPath())
+
+    def url(self, neo_server=None):
+        '''
+        Returns the url NEO should push the events to
+        '''
+        host = self._advertised_host
+        if host is None:
+            host = self._server.server_address[0]
+        if host in ("", "0.0.0.0"):
+            host = self._localAddress(neo_server)
+        return "http://%s:%d%s" % (host, self.port, self._pushPath())
+
+    @classmethod
+    def _localAddress(cls, neo_server):
+        # Connecting a UDP socket sends nothing, but selects the local
+        # address of the route to the server
+        host = (neo_server or "").split(":")[0] or "localhost"
+        probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            probe.connect((host, 80))
+            return probe.getsockname()[0]
+        except socket.error:
+            return socket.gethostname()
+        finally:
+            probe.close()
+
+    def addListener(self, listener):
+        with self._lock:
+            self._listeners.append(listener)
+
+    def removeListener(self, listener):
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def dispatch(self, events):
+        with self._lock:
+            listeners = list(self._listeners)
+        for event in events:
+            for listener in listeners:
+                listener(event)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever,
+                                            name="NeoWebhookReceiver")
+            self._thread.daemon = True
+            self._thread.start()
+        return self
+
+    def register(self, neo_session, neo_server=None, base_url="/neo"):
+        '''
+        Adds the receiver as a notification target of NEO.
+        Returns the url NEO pushes the events to.
+        '''
+        self._notifications_url = "%s%s" % (base_url, URL.NOTIFICATIONS_URL)
+        url = self.url(neo_server)
+        response = neo_session.post(
+            self._notifications_url,
+            data=json.dumps({"Type": self.TARGET_TYPE, "URL": url}),
+            headers={"Content-Type": "application/json"})
+        body = response.read()
+        if response.status >= 300:
+            raise IOError("Couldn't register the webhook (status %s): %s" %
+                          (response.status, body))
+        self._neo_session = neo_session
+        self.target_id = json.loads(body).get("ID")
+        return url
+
+    def unregister(self):
+        if self.target_id is None:
+            return
+        self._neo_session.delete("%s/%s" % (self._notifications_url,
+                                            self.target_id)).read()
+        self.target_id = None
+
+    def stop(self):
+        self.unregister()
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread = None
+        self._server.server_close()
@@ -0,0 +1,127 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+import re
+from sdk_exceptions import ParamBadFormat
+
+
+class ObjectFilter(object):
+    """
+    Selects the objects of a response that match conditions, and projects
+    them to a subset of their fields, one object at a time while the
+    response is decoded.
+
+    'fields' are paths of fields, with dots between the names of nested
+    fields (e.g. ['ip_address', 'status.health']). The projected object
+    keeps the nesting, and leaves out the fields it doesn't have.
+
+    'conditions' are strings of the form 'path=value' (the field equals
+    the value) or 'path~regex' (the field matches the regular expression
+    somewhere). A field whose value is a list matches if any of its
+    elements matches. An object is selected if it matches all the
+    conditions.
+    """
+
+    CONDITION_REGEX = re.compile(r"^([^=~]+)([=~])(.*)$")
+    EQUALS = "="
+    MATCHES = "~"
+
+    # A field an object doesn't have
+    _MISSING = object()
+
+    def __init__(self, fields=None, conditions=None):
+        self._fields = [field.split(".") for field in fields or []]
+        self._conditions = [self.parseCondition(condition)
+                            for condition in conditions or []]
+
+    @classmethod
+    def parseFields(cls, fields):
+        '''
+        Returns the list of paths of a comma separated string of paths
+        '''
+        return [field.strip() for field in fields.split(",")
+                if field.strip()]
+
+    @classmethod
+    def parseCondition(cls, condition):
+        '''
+        Returns a tuple of (path, operator, value) of a condition.
+        The value of a '~' condition is a compiled regular expression.
+        '''
+        match = cls.CONDITION_REGEX.match(condition)
+        if match is None:
+            raise ParamBadFormat("Bad condition '%s'. Expected "
+                                 "'field=value' or 'field~regex'" %
+                                 condition)
+        path, operator, value = match.groups()
+        if operator == cls.MATCHES:
+            try:
+                value = re.compile(value)
+            except re.error as exc:
+                raise ParamBadFormat("Bad regular expression '%s': %s" %
+                                     (value, exc))
+        return path.strip().split("."), operator, value
+
+    @classmethod
+    def _getField(cls, obj, path):
+        for name in path:
+            if not isinstance(obj, dict) or name not in obj:
+                return cls._MISSING
+            obj = obj[name]
+        return obj
+
+    @classmethod
+    def _valueMatches(cls, value, operator, expected):
+        if isinstance(value, list):
+            return any(cls._valueMatches(element, operator, expected)
+                       for element in value)
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        elif value is None:
+            value = "null"
+        elif not isinstance(value, basestring):
+            value = unicode(value)
+        if operator == cls.EQUALS:
+            return value == expected
+        return expected.search(value) is not None
+
+    def matches(self, obj):
+        for path, operator, expected in self._conditions:
+            value = self._getField(obj, path)
+            if value is self._MISSING or \
+                    not self._valueMatches(value, operator, expected):
+                return False
+        return True
+
+    def project(self, obj):
+        if not self._fields or not isinstance(obj, dict):
+            return obj
+        projected = {}
+        for path in self._fields:
+            value = self._getField(obj, path)
+            if value is self._MISSING:
+                continue
+            target = projected
+            for name in path[:-1]:
+                target = target.setdefault(name, {})
+            target[path[-1]] = value
+        return projected
+
+    def select(self, objects):
+        '''
+        Yields the projections of the objects that match the conditions
+        '''
+        for obj in objects:
+            if self.matches(obj):
+                yield self.project(obj)
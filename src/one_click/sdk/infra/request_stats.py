@@ -0,0 +1,208 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+import re
+import threading
+import time
+
+
+class RequestRecord(object):
+    """
+    Timing and size of a single request sent by NeoConnection.
+
+    All the times are wall clock seconds, measured from the moment the
+    request was issued:
+    - connect_time: until a connection was available (including the pool
+      wait and the TCP/TLS handshake of a new connection).
+    - ttfb: until the response status and headers were received.
+    - total: until the response body was read (or the request failed).
+
+    When 'capture' is set, the request headers and body, and the response
+    headers and (decoded) body are kept as well.
+    """
+
+    # Path segments that hold ids (numbers, IP addresses, lists of ids)
+    ID_SEGMENT_REGEX = re.compile(r"^[^/]*\d[^/]*$")
+
+    def __init__(self, method, url, data=None, headers=None, capture=False):
+        self.method = method
+        self.url = url
+        self.url_template = self.urlTemplate(url)
+        self.request_bytes = len(data or "")
+        self.response_bytes = 0
+        self.status = None
+        self.error = None
+        self.retries = 0
+        self.connect_time = None
+        self.ttfb = None
+        self.total = None
+        self.request_headers = None
+        self.request_body = None
+        self.response_headers = None
+        self.response_body = None
+        if capture:
+            self.request_headers = dict(headers or {})
+            self.request_body = data
+            self.response_body = []
+        self._start = time.time()
+
+    @classmethod
+    def urlTemplate(cls, url):
+        '''
+        Returns the url with its ids and query values replaced by
+        placeholders, so requests of the same kind are grouped together.
+        e.g. '/neo/app/jobs/12?parent_id=3&tz=...' becomes
+        '/neo/app/jobs/{id}?parent_id={}'
+        '''
+        path, _, query = url.partition("?")
+        path = "/".join(
+            "{id}" if cls.ID_SEGMENT_REGEX.match(segment) else segment
+            for segment in path.split("/"))
+        params = [param.partition("=")[0] for param in query.split("&")
+                  if param and not param.startswith("tz=")]
+        if not params:
+            return path
+        return "%s?%s" % (path, "&".join("%s={}" % name for name in params))
+
+    def elapsed(self):
+        return time.time() - self._start
+
+    def markConnected(self):
+        self.connect_time = self.elapsed()
+
+    def markResponse(self, status, headers=None):
+        self.status = status
+        self.ttfb = self.elapsed()
+        if self.response_body is not None:
+            self.response_headers = headers
+
+    def markDone(self, response_bytes=0, error=None):
+        self.response_bytes = response_bytes
+        self.error = error
+        self.total = self.elapsed()
+
+    @property
+    def body_time(self):
+        if self.ttfb is None or self.total is None:
+            return None
+        return self.total - self.ttfb
+
+
+class LatencyHistogram(object):
+    """
+    Histogram of latencies over fixed, roughly logarithmic buckets
+    """
+
+    # Upper bounds of the buckets, in seconds
+    BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5,
+               1, 2, 5, 10, 30, 60, float("inf"))
+
+    def __init__(self):
+        self.counts = [0] * len(self.BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        for index, bound in enumerate(self.BUCKETS):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def percentile(self, percent):
+        '''
+        Returns the upper bound of the bucket holding the given percentile
+        (capped by the largest value seen)
+        '''
+        if not self.count:
+            return 0.0
+        threshold = self.count * percent / 100.0
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= threshold:
+                return min(self.BUCKETS[index], self.max)
+        return self.max
+
+    def mean(self):
+        return self.sum / self.count if self.count else 0.0
+
+
+class RequestStats(object):
+    """
+    In process aggregator of RequestRecords. An instance is a request hook,
+    so it can be registered with NeoConnection.addRequestHook().
+    Records are grouped by method and url template.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def __call__(self, record):
+        key = (record.method, record.url_template)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = {"latency": LatencyHistogram(),
+                         "connect": LatencyHistogram(),
+                         "ttfb": LatencyHistogram(),
+                         "errors": 0, "retries": 0,
+                         "request_bytes": 0, "response_bytes": 0}
+                self._stats[key] = stats
+            stats["latency"].add(record.total or 0.0)
+            if record.connect_time is not None:
+                stats["connect"].add(record.connect_time)
+            if record.ttfb is not None:
+                stats["ttfb"].add(record.ttfb)
+            if record.error is not None or record.status is None or \
+                    record.status >= 400:
+                stats["errors"] += 1
+            stats["retries"] += record.retries
+            stats["request_bytes"] += record.request_bytes
+            stats["response_bytes"] += record.response_bytes
+
+    def summary(self):
+        '''
+        Returns the statistics as a list of text lines: the percentiles of
+        the total, connect and TTFB times, and the bytes sent and received
+        '''
+        line_format = ("%-6s %-40s %6s %6s %8s %8s %8s %8s %8s %8s %8s "
+                       "%10s %10s")
+        lines = [line_format % ("Method", "URL", "Count", "Errors",
+                                "p50(ms)", "p90(ms)", "p99(ms)",
+                                "Con p50", "Con p99", "TTFB p50", "TTFB p99",
+                                "Bytes out", "Bytes in")]
+
+        def milliseconds(histogram, percent):
+            return "%.1f" % (histogram.percentile(percent) * 1000)
+
+        with self._lock:
+            for (method, url), stats in sorted(self._stats.items()):
+                latency = stats["latency"]
+                lines.append(line_format % (
+                    method, url, latency.count, stats["errors"],
+                    milliseconds(latency, 50),
+                    milliseconds(latency, 90),
+                    milliseconds(latency, 99),
+                    milliseconds(stats["connect"], 50),
+                    milliseconds(stats["connect"], 99),
+                    milliseconds(stats["ttfb"], 50),
+                    milliseconds(stats["ttfb"], 99),
+                    stats["request_bytes"],
+                    stats["response_bytes"]))
+        return lines
@@ -39,6 +39,10 @@ class FileNotReadable(Exception):
     pass
 
 
+class RequestFailed(Exception):
+    pass
+
+
 # ===================================================================
 #                Parameter Exceptions
 # ===================================================================
@@ -54,3 +58,20 @@ class InvalidParam(Exception):
 
 class MissingParam(Exception):
     pass
+
+
+# ===================================================================
+#                Job Exceptions
+# ===================================================================
+
+
+class JobNotCreated(Exception):
+    pass
+
+
+class JobTimeout(Exception):
+    pass
+
+
+class JobCancelled(Exception):
+    pass
@@ -0,0 +1,169 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+import json
+import sys
+import time
+from collections import OrderedDict
+from json_stream import JsonStreamDecoder
+
+
+class SdkOutput(object):
+    """
+    Machine readable output of an SDK command, instead of the decorated
+    text of SDKPrint.
+
+    In 'ndjson' mode every record is a JSON line as soon as it's known:
+        {"record": "job", "data": {...}}          (blocking tasks)
+        {"record": "response", "action": "getall", "status": 200,
+         "elapsed_ms": 12.5}
+        {"record": "item", "data": {...}}         (an element of a list)
+        {"record": "body", "data": ...}           (a body that isn't a list)
+        {"record": "end", "status": 200, "items": 3, "total_ms": 15.1,
+         "raw_bytes": 420, "decoded_bytes": 420}
+        {"record": "error", "message": "..."}
+
+    In 'json' mode the command writes a single JSON document with the same
+    data, whose "body" is written element by element too:
+        {"job": {...}, "action": "getall", "status": 200, "elapsed_ms": 12.5,
+         "body": [...], "items": 3, ...}
+
+    Bodies that aren't JSON are returned as strings, and empty bodies as
+    null.
+    """
+
+    TEXT = "text"
+    JSON = "json"
+    NDJSON = "ndjson"
+    MODES = (TEXT, JSON, NDJSON)
+
+    # Records that may repeat, which are collected into a list in 'json'
+    # mode, and progress records, which 'json' mode doesn't keep
+    LIST_RECORDS = ("job_ended", "event")
+    PROGRESS_RECORDS = ("sub_job",)
+
+    def __init__(self, mode=TEXT, stream=None):
+        self.mode = mode
+        self._stream = stream or sys.stdout
+        self._fields = []
+        self._started = False
+
+    @property
+    def structured(self):
+        return self.mode != self.TEXT
+
+    def _write(self, data):
+        self._stream.write(data)
+        self._stream.flush()
+
+    def _writeRecord(self, record, fields):
+        # The record name comes first, to be read before the other fields
+        self._write(json.dumps(OrderedDict([("record", record)] + fields)) +
+                    "\n")
+
+    def record(self, name, data):
+        '''
+        Outputs a record of the command, e.g. the final state of a job
+        '''
+        if self.mode == self.NDJSON:
+            self._writeRecord(name, [("data", data)])
+        elif self.mode == self.JSON and name not in self.PROGRESS_RECORDS:
+            if name in self.LIST_RECORDS:
+                for field_name, values in self._fields:
+                    if field_name == name:
+                        values.append(data)
+                        return
+                data = [data]
+            self._fields.append((name, data))
+
+    def records(self):
+        '''
+        Returns an ordered dict of the records collected in 'json' mode that
+        weren't written yet, by their names
+        '''
+        return OrderedDict(self._fields)
+
+    def _iterBody(self, response, select):
+        '''
+        Returns a tuple of (is_list, items) of a response body
+        '''
+        # A paged response has the objects already decoded
+        objects = getattr(response, "iterObjects", lambda: None)()
+        if objects is not None:
+            return True, select(objects)
+        decoder = JsonStreamDecoder(response)
+        is_array = decoder.isArray()
+        if is_array is None:
+            return False, iter([None])
+        if is_array:
+            return True, select(decoder.iterItems())
+        try:
+            body = next(decoder.iterItems())
+        except ValueError:
+            return False, iter([decoder.remainder()])
+        return False, iter(list(select([body])) or [None])
+
+    def response(self, action, response, elapsed, select=lambda items: items):
+        '''
+        Outputs the status of a response and its body, element by element
+        if it's a list. 'elapsed' is the time in seconds it took to get the
+        response ('elapsed_ms'), and the time until its body was read is
+        'total_ms'. 'select(items)' yields the elements to output (e.g. the
+        ones that match a filter).
+        '''
+        start = time.time()
+        fields = [("action", action), ("status", response.status),
+                  ("elapsed_ms", round(elapsed * 1000, 1))]
+        is_list, items = self._iterBody(response, select)
+
+        count = 0
+        if self.mode == self.NDJSON:
+            self._writeRecord("response", fields)
+            for item in items:
+                self._writeRecord("item" if is_list else "body",
+                                  [("data", item)])
+                count += is_list or item is not None
+        else:
+            self._started = True
+            self._write("{%s, \"body\": %s" % (
+                ", ".join("%s: %s" % (json.dumps(name), json.dumps(value))
+                          for name, value in self._fields + fields),
+                "[" if is_list else ""))
+            for index, item in enumerate(items):
+                self._write("%s%s" % (", " if index else "",
+                                      json.dumps(item)))
+                count += is_list or item is not None
+            if is_list:
+                self._write("]")
+
+        end = [("items", count),
+               ("total_ms", round((elapsed + time.time() - start) * 1000,
+                                  1)),
+               ("raw_bytes", getattr(response, "raw_bytes", None)),
+               ("decoded_bytes", getattr(response, "decoded_bytes", None))]
+        if self.mode == self.NDJSON:
+            self._writeRecord("end", [("status", response.status)] + end)
+        else:
+            self._write(", %s}\n" % ", ".join(
+                "%s: %s" % (json.dumps(name), json.dumps(value))
+                for name, value in end))
+
+    def error(self, message):
+        if self.mode == self.NDJSON:
+            self._writeRecord("error", [("message", message)])
+        elif not self._started:
+            self._write(json.dumps({"error": message}) + "\n")
+        else:
+            # The document was already written, or cut by the error
+            sys.stderr.write("%s\n" % message)
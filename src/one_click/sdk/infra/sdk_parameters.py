@@ -33,6 +33,7 @@ class ParamNames(object):
 
     # Event attributes
     EVENT_ID = "event_id"
+    DURATION = "duration"
 
     # Task attributes
     TASK_ID = "task_id"
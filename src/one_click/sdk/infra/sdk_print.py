@@ -14,6 +14,7 @@
 @author: Shachar Langer
 @date:   Aug 23, 2015
 """
+import sys
 
 
 class headerDesgin(object):
@@ -25,14 +26,16 @@ class headerDesgin(object):
         self.func = func
 
     def __call__(self, *args, **kwargs):
-        print(self.SEPERATOR * self.SEPERATOR_LENGTH)
+        stream = kwargs.get("stream") or sys.stdout
+        print >> stream, self.SEPERATOR * self.SEPERATOR_LENGTH
         self.func(*args, **kwargs)
-        print(self.SEPERATOR * self.SEPERATOR_LENGTH)
+        print >> stream, self.SEPERATOR * self.SEPERATOR_LENGTH
 
 
 class SDKPrint(object):
     """
-    This class contains common SDK printing functions
+    This class contains common SDK printing functions. They print to
+    'stream' (default: sys.stdout).
     """
 
     SEPERATOR_LENGTH = 70
@@ -41,23 +44,36 @@ class SDKPrint(object):
 
     @classmethod
     @headerDesgin
-    def printHeader(cls, action, server, username):
+    def printHeader(cls, action, server, username, stream=None):
+        stream = stream or sys.stdout
 
         # Displaying the action and login details
-        print("<<< NEO - %s SDK >>>" % action)
-        print(cls.SEPERATOR * cls.SEPERATOR_LENGTH)
-        print("[*] Running Settings:")
-        print(" -> NEO server IP address: %s" % server)
-        print(" -> NEO user name: %s" % username)
+        print >> stream, "<<< NEO - %s SDK >>>" % action
+        print >> stream, cls.SEPERATOR * cls.SEPERATOR_LENGTH
+        print >> stream, "[*] Running Settings:"
+        print >> stream, " -> NEO server IP address: %s" % server
+        print >> stream, " -> NEO user name: %s" % username
 
     @classmethod
     @headerDesgin
     def printResponse(cls, action, status_code, text,
-                      should_print_response=False):
+                      should_print_response=False, stream=None):
+        stream = stream or sys.stdout
 
         # Displaying the response to the User
-        print("[*] %s results:" % action)
-        print(">> %s request HTTP response status code: %d"
-              % (action, status_code))
+        print >> stream, "[*] %s results:" % action
+        print >> stream, (">> %s request HTTP response status code: %d"
+                          % (action, status_code))
         if status_code not in cls.SUCCESS_CODES or should_print_response:
-            print(">> %s request HTTP response text:\n%s" % (action, text))
+            print >> stream, (">> %s request HTTP response text:\n%s" %
+                              (action, text))
+
+    @classmethod
+    @headerDesgin
+    def printStats(cls, stats_lines, stream=None):
+        stream = stream or sys.stdout
+
+        # Displaying the statistics of the requests sent to NEO
+        print >> stream, "[*] Request statistics:"
+        print >> stream, cls.SEPERATOR * cls.SEPERATOR_LENGTH
+        print >> stream, "\n".join(stats_lines)
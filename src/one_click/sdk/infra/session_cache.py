@@ -0,0 +1,126 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+import os
+import json
+import time
+import hmac
+import hashlib
+from rfc822 import parsedate_tz, mktime_tz
+
+
+class SessionCache(object):
+    """
+    On disk cache of a NEO session cookie, so SDK processes that run one
+    after the other reuse the same session instead of logging in again.
+
+    There is one cache file per NEO server and user, under the home
+    directory of the local user, and only its owner can read it. The file
+    holds a salted verifier of the password the session was created with,
+    and a session is never handed to someone who doesn't know it. The
+    password isn't part of the file name, so it can't be guessed from a
+    listing of the directory.
+    """
+
+    CACHE_DIR = os.path.join(os.path.expanduser("~"), ".neo_sdk", "sessions")
+
+    # A cached session that expires within this number of seconds is not
+    # used, so it won't expire in the middle of a command
+    EXPIRY_MARGIN = 30
+
+    # Iterations of the password verifier (PBKDF2-HMAC-SHA256)
+    VERIFIER_ITERATIONS = 1000
+
+    def __init__(self, username, password, server, port=80, protocol="http",
+                 cache_dir=None):
+        self._cache_dir = cache_dir or self.CACHE_DIR
+        self._password = password
+        key = "%s://%s@%s:%s" % (protocol, username, server, port)
+        self._path = os.path.join(self._cache_dir,
+                                  hashlib.sha1(key).hexdigest())
+
+    def _verifier(self, salt):
+        return hashlib.pbkdf2_hmac("sha256", self._password, salt,
+                                   self.VERIFIER_ITERATIONS).encode("hex")
+
+    @classmethod
+    def parseExpiry(cls, cookie_attributes):
+        '''
+        Returns the expiry time (seconds since the epoch) of a cookie, given
+        its attributes (e.g. ['Path=/', 'Max-Age=3600']), or None if the
+        cookie doesn't expire.
+        '''
+        expires = None
+        for attribute in cookie_attributes:
+            name, _, value = attribute.strip().partition("=")
+            name = name.lower()
+            if name == "max-age":
+                try:
+                    return time.time() + int(value)
+                except ValueError:
+                    continue
+            elif name == "expires":
+                parsed_date = parsedate_tz(value)
+                if parsed_date is not None:
+                    expires = mktime_tz(parsed_date)
+        return expires
+
+    def load(self):
+        '''
+        Returns the cached session, or None if there is no valid one.
+        '''
+        try:
+            with open(self._path) as cache_file:
+                data = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return None
+
+        # The session was created with another password
+        salt = str(data.get("salt") or "")
+        if not salt or not hmac.compare_digest(
+                str(data.get("verifier") or ""),
+                self._verifier(salt.decode("hex"))):
+            return None
+
+        expires = data.get("expires")
+        if expires is not None and \
+                expires < time.time() + self.EXPIRY_MARGIN:
+            return None
+        return data.get("session")
+
+    def save(self, session, expires=None):
+        if not os.path.isdir(self._cache_dir):
+            os.makedirs(self._cache_dir, 0700)
+
+        # Write to a temporary file first, so concurrent processes never
+        # read a partially written cache
+        tmp_path = "%s.%d.tmp" % (self._path, os.getpid())
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0600)
+        salt = os.urandom(16)
+        with os.fdopen(fd, "w") as cache_file:
+            json.dump({"session": session, "expires": expires,
+                       "salt": salt.encode("hex"),
+                       "verifier": self._verifier(salt)}, cache_file)
+        try:
+            os.rename(tmp_path, self._path)
+        except OSError:
+            # Windows doesn't allow renaming over an existing file
+            self.invalidate()
+            os.rename(tmp_path, self._path)
+
+    def invalidate(self):
+        try:
+            os.remove(self._path)
+        except OSError:
+            pass
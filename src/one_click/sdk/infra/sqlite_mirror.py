@@ -0,0 +1,275 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+import os
+import json
+import httplib
+import sqlite3
+import urllib
+from url import URL
+from json_stream import JsonStreamDecoder
+from neo_connection_pool import NeoConnectionPool
+from neo_concurrent_client import NeoConcurrentClient
+from incremental_sync import IdSync, ModifiedSinceSync
+from sdk_exceptions import RequestFailed
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS systems (
+    ip_address TEXT PRIMARY KEY, hostname TEXT, model TEXT,
+    sw_version TEXT, status TEXT, data TEXT);
+CREATE INDEX IF NOT EXISTS systems_status ON systems (status);
+
+CREATE TABLE IF NOT EXISTS ports (
+    id TEXT PRIMARY KEY, system TEXT, name TEXT, state TEXT, speed TEXT,
+    data TEXT);
+CREATE INDEX IF NOT EXISTS ports_system ON ports (system);
+CREATE INDEX IF NOT EXISTS ports_name ON ports (name);
+CREATE INDEX IF NOT EXISTS ports_state ON ports (state);
+
+CREATE TABLE IF NOT EXISTS groups (
+    name TEXT PRIMARY KEY, description TEXT, data TEXT);
+
+CREATE TABLE IF NOT EXISTS group_members (
+    group_name TEXT, system TEXT, PRIMARY KEY (group_name, system));
+CREATE INDEX IF NOT EXISTS group_members_system ON group_members (system);
+
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY, parent_id INTEGER, status TEXT,
+    progress INTEGER, description TEXT, creation_time TEXT,
+    completed_time TEXT, data TEXT);
+CREATE INDEX IF NOT EXISTS jobs_parent_id ON jobs (parent_id);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status);
+CREATE INDEX IF NOT EXISTS jobs_creation_time ON jobs (creation_time);
+
+CREATE TABLE IF NOT EXISTS job_objects (
+    job_id INTEGER, object_id TEXT, PRIMARY KEY (job_id, object_id));
+CREATE INDEX IF NOT EXISTS job_objects_object_id ON job_objects (object_id);
+
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY, timestamp TEXT, severity TEXT, category TEXT,
+    object_type TEXT, object_id TEXT, description TEXT, data TEXT);
+CREATE INDEX IF NOT EXISTS events_object_id ON events (object_id);
+CREATE INDEX IF NOT EXISTS events_timestamp ON events (timestamp);
+CREATE INDEX IF NOT EXISTS events_severity ON events (severity);
+
+CREATE TABLE IF NOT EXISTS cursors (
+    collection TEXT PRIMARY KEY, state TEXT);
+"""
+
+
+class MirrorCursor(object):
+    """
+    The cursor of an incremental sync (see SyncCursor), kept in the mirror
+    database, so it's saved in the same transaction as the records.
+    """
+
+    def __init__(self, db, collection):
+        self._db = db
+        self._collection = collection
+
+    def load(self):
+        row = self._db.execute("SELECT state FROM cursors "
+                               "WHERE collection = ?",
+                               (self._collection,)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def save(self, state):
+        self._db.execute("INSERT OR REPLACE INTO cursors VALUES (?, ?)",
+                         (self._collection, json.dumps(state)))
+
+    def reset(self):
+        self._db.execute("DELETE FROM cursors WHERE collection = ?",
+                         (self._collection,))
+
+
+class NeoMirror(object):
+    """
+    A local SQLite mirror of the NEO inventory (systems, ports, groups and
+    their members) and of the jobs and events, so queries that join them
+    (e.g. the ports that are down on the systems of a group) run locally
+    in milliseconds, without requests to NEO.
+
+    The main attributes of the objects are columns, with indexes on the
+    system, group, port name, status and time columns, and the whole
+    object is kept as JSON in the 'data' column (see SCHEMA).
+
+    refresh() replaces the inventory, which NEO can't report the changes
+    of, and fetches only the jobs and events that changed since the
+    previous refresh (see IncrementalSync). Every collection is replaced
+    in a transaction of its own, so queries never see a partial refresh.
+    """
+
+    INVENTORY = ("systems", "ports", "groups")
+    HISTORY = ("jobs", "events")
+    COLLECTIONS = INVENTORY + HISTORY
+
+    # The columns of each table and the object attributes they hold
+    COLUMNS = {
+        "systems": (("ip_address", "ip_address"), ("hostname", "hostname"),
+                    ("model", "model"), ("sw_version", "sw_version"),
+                    ("status", "status")),
+        "ports": (("id", "id"), ("system", "system"), ("name", "name"),
+                  ("state", "state"), ("speed", "speed")),
+        "groups": (("name", "elementName"), ("description", "description")),
+        "jobs": (("id", "ID"), ("parent_id", "Parent ID"),
+                 ("status", "Status"), ("progress", "Progress"),
+                 ("description", "Description"),
+                 ("creation_time", "Creation Time"),
+                 ("completed_time", "Completed Time")),
+        "events": (("id", "ID"), ("timestamp", "Timestamp"),
+                   ("severity", "Severity"), ("category", "Category"),
+                   ("object_type", "Object Type"),
+                   ("object_id", "Object ID"),
+                   ("description", "Description")),
+    }
+
+    URLS = {
+        "systems": URL.SYSTEMS_URL,
+        "ports": URL.PORTS_URL,
+        "groups": URL.GROUPS_URL,
+        "jobs": URL.JOBS_URL,
+        "events": URL.EVENTS_URL,
+    }
+
+    # Number of groups whose members are fetched at once
+    MEMBERS_CONCURRENCY = NeoConnectionPool.DEFAULT_MAX_CONNECTIONS
+
+    def __init__(self, path, base_url="/neo"):
+        db_dir = os.path.dirname(path)
+        if db_dir and not os.path.isdir(db_dir):
+            os.makedirs(db_dir, 0700)
+        self._base_url = base_url
+        self._db = sqlite3.connect(path)
+        self._db.executescript(SCHEMA)
+
+    def close(self):
+        self._db.close()
+
+    def _insert(self, table, obj):
+        columns = self.COLUMNS[table]
+        values = [obj.get(field) for _, field in columns]
+        self._db.execute(
+            "INSERT OR REPLACE INTO %s (%s, data) VALUES (%s)" % (
+                table, ", ".join(column for column, _ in columns),
+                ", ".join("?" * (len(columns) + 1))),
+            values + [json.dumps(obj)])
+
+    def _get(self, neo_session, url):
+        response = neo_session.get(url)
+        if response.status != httplib.OK:
+            raise RequestFailed("NEO returned status %s for %s: %s" %
+                                (response.status, url, response.read()))
+        return response
+
+    def _refreshInventory(self, neo_session, table):
+        response = self._get(neo_session, self._base_url + self.URLS[table])
+        count = 0
+        with self._db:
+            self._db.execute("DELETE FROM %s" % table)
+            for obj in JsonStreamDecoder(response).iterItems():
+                self._insert(table, obj)
+                count += 1
+            if table == "groups":
+                self._refreshMembers(neo_session)
+        return count
+
+    def _refreshMembers(self, neo_session):
+        '''
+        Replaces the members of the groups, which are fetched concurrently.
+        The caller holds the transaction.
+        '''
+        group_names = {}
+        for row in self._db.execute("SELECT name FROM groups"):
+            url = "%s%s/%s/members" % (self._base_url, URL.GROUPS_URL,
+                                       urllib.quote(row[0].encode("utf-8"),
+                                                    safe=""))
+            group_names[url] = row[0]
+
+        self._db.execute("DELETE FROM group_members")
+        with NeoConcurrentClient(connection=neo_session,
+                                 concurrency=self.MEMBERS_CONCURRENCY) \
+                as client:
+            for url, response in client.getMany(group_names):
+                if response.status != httplib.OK:
+                    raise RequestFailed("NEO returned status %s for %s: %s"
+                                        % (response.status, url,
+                                           response.read()))
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO group_members VALUES (?, ?)",
+                    [(group_names[url], member.get("ip_address"))
+                     for member in json.loads(response.read())])
+
+    def _refreshHistory(self, neo_session, table):
+        url = self._base_url + self.URLS[table]
+        sync_class = ModifiedSinceSync if table == "jobs" else IdSync
+
+        def storeJob(job):
+            self._insert("jobs", job)
+            self._db.execute("DELETE FROM job_objects WHERE job_id = ?",
+                             (job["ID"],))
+            self._db.executemany("INSERT OR IGNORE INTO job_objects "
+                                 "VALUES (?, ?)",
+                                 [(job["ID"], object_id) for object_id in
+                                  job.get("Related Objects") or []])
+
+        def storeEvent(event):
+            self._insert("events", event)
+
+        with self._db:
+            history_sync = sync_class(neo_session, url,
+                                      MirrorCursor(self._db, table))
+            count = history_sync.run(storeJob if table == "jobs"
+                                     else storeEvent)
+            history_sync.commit()
+        return count
+
+    def refresh(self, neo_session, collections=COLLECTIONS):
+        '''
+        Refreshes the given collections from NEO, and returns a list of
+        (collection, number of objects stored) tuples. The group members
+        are refreshed with the groups.
+        '''
+        counts = []
+        for collection in self.COLLECTIONS:
+            if collection not in collections:
+                continue
+            if collection in self.INVENTORY:
+                count = self._refreshInventory(neo_session, collection)
+            else:
+                count = self._refreshHistory(neo_session, collection)
+            counts.append((collection, count))
+        return counts
+
+    def reset(self, collections=HISTORY):
+        '''
+        Forgets the jobs and events, so the next refresh fetches all of
+        them again
+        '''
+        with self._db:
+            for collection in collections:
+                if collection not in self.HISTORY:
+                    continue
+                self._db.execute("DELETE FROM %s" % collection)
+                if collection == "jobs":
+                    self._db.execute("DELETE FROM job_objects")
+                MirrorCursor(self._db, collection).reset()
+
+    def query(self, sql, parameters=()):
+        '''
+        Runs an SQL query on the mirror, and returns a tuple of (column
+        names, cursor of the rows)
+        '''
+        cursor = self._db.execute(sql, parameters)
+        columns = [column[0] for column in cursor.description or []]
+        return columns, cursor
@@ -0,0 +1,108 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+import httplib
+import json
+from rfc822 import parsedate_tz, mktime_tz
+from url import URL
+from job_watcher import JobWatcher
+
+
+class SubJobProgress(object):
+    """
+    Follows the sub jobs of a running job, and reports the sub jobs whose
+    status or progress changed since the previous update.
+
+    Only the sub jobs that changed are fetched: every update asks for the
+    sub jobs modified since the previous one ('modified_since', in epoch
+    seconds of the NEO clock, taken from the 'Date' header of the previous
+    response). A NEO that ignores the filter returns all the sub jobs, and
+    the unchanged ones are skipped.
+    """
+
+    # The 'Date' header has a resolution of one second
+    MODIFIED_SINCE_MARGIN = 1
+
+    def __init__(self, neo_session, job_id, base_url="/neo"):
+        self._neo_session = neo_session
+        self._url = "%s%s?parent_id=%s" % (base_url, URL.JOBS_URL, job_id)
+        self._modified_since = None
+        self._states = {}
+
+    @classmethod
+    def _serverTime(cls, response):
+        date = parsedate_tz(response.getheader("Date") or "")
+        return None if date is None else mktime_tz(date)
+
+    def update(self):
+        '''
+        Fetches the sub jobs that changed, and returns them
+        '''
+        url = self._url
+        if self._modified_since is not None:
+            url = "%s&modified_since=%d" % (url, self._modified_since)
+        response = self._neo_session.get(url)
+        body = response.read()
+        if response.status != httplib.OK:
+            return []
+        server_time = self._serverTime(response)
+        if server_time is not None:
+            self._modified_since = server_time - self.MODIFIED_SINCE_MARGIN
+
+        changed = []
+        for sub_job in json.loads(body):
+            state = (sub_job.get("Status"), sub_job.get("Progress"))
+            if self._states.get(sub_job["ID"]) != state:
+                self._states[sub_job["ID"]] = state
+                changed.append(sub_job)
+        return changed
+
+    def counts(self):
+        '''
+        Returns the number of (completed, failed, running) sub jobs
+        '''
+        completed = failed = running = 0
+        for status, _ in self._states.itervalues():
+            if status == "Completed":
+                completed += 1
+            elif status in JobWatcher.FINAL_STATUSES:
+                failed += 1
+            else:
+                running += 1
+        return completed, failed, running
+
+    @classmethod
+    def describe(cls, sub_job):
+        '''
+        Returns a status line of a sub job
+        '''
+        objects = ", ".join(sub_job.get("Related Objects") or []) or "-"
+        line = "%s (job %s): %s" % (objects, sub_job["ID"],
+                                    sub_job.get("Status"))
+        if sub_job.get("Status") not in JobWatcher.FINAL_STATUSES and \
+                sub_job.get("Progress") is not None:
+            line += " %s%%" % sub_job["Progress"]
+        return line
+
+    def summary(self, elapsed, remaining=None):
+        '''
+        Returns a line with the sub job counts and the elapsed (and
+        estimated remaining) time in seconds
+        '''
+        completed, failed, running = self.counts()
+        line = "Sub jobs: %d completed, %d failed, %d running. " \
+            "Elapsed %ds" % (completed, failed, running, elapsed)
+        if remaining is not None:
+            line += ", about %ds left" % remaining
+        return line
@@ -0,0 +1,72 @@
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@date:   Oct 18, 2026
+"""
+import os
+import json
+import hashlib
+
+
+class SyncCursor(object):
+    """
+    On disk cursor of an incremental sync of a NEO collection: where the
+    previous run stopped (e.g. the id of the last event it fetched), so
+    the next run fetches only the newer records.
+
+    There is one cursor file per NEO server, user and collection, under
+    the home directory of the local user, and only its owner can read it.
+    """
+
+    CURSOR_DIR = os.path.join(os.path.expanduser("~"), ".neo_sdk", "cursors")
+
+    def __init__(self, username, server, collection, port=80,
+                 protocol="http", cursor_dir=None):
+        self._cursor_dir = cursor_dir or self.CURSOR_DIR
+        self._key = "%s://%s@%s:%s/%s" % (protocol, username, server, port,
+                                          collection)
+        self._path = os.path.join(self._cursor_dir,
+                                  hashlib.sha1(self._key).hexdigest())
+
+    def load(self):
+        '''
+        Returns the state the previous run saved, or None if there is none
+        '''
+        try:
+            with open(self._path) as cursor_file:
+                data = json.load(cursor_file)
+        except (IOError, OSError, ValueError):
+            return None
+        return data.get("state")
+
+    def save(self, state):
+        if not os.path.isdir(self._cursor_dir):
+            os.makedirs(self._cursor_dir, 0700)
+
+        # Write to a temporary file first, so a run that is killed never
+        # leaves a partially written cursor
+        tmp_path = "%s.%d.tmp" % (self._path, os.getpid())
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0600)
+        with os.fdopen(fd, "w") as cursor_file:
+            json.dump({"key": self._key, "state": state}, cursor_file)
+        try:
+            os.rename(tmp_path, self._path)
+        except OSError:
+            # Windows doesn't allow renaming over an existing file
+            self.reset()
+            os.rename(tmp_path, self._path)
+
+    def reset(self):
+        try:
+            os.remove(self._path)
+        except OSError:
+            pass
@@ -25,7 +25,10 @@ class URL(object):
     LOGIN_URL = "/login"
     USERS_URL = "/app/users"
     GROUPS_URL = "/resources/groups"
+    SYSTEMS_URL = "/resources/systems"
+    PORTS_URL = "/resources/ports"
     EVENTS_URL = "/app/events"
+    LOGS_URL = "/app/logs"
     TASKS_URL = "/app/tasks"
     JOBS_URL = "/app/jobs"
     EVENT_POLICY_URL = "/app/event_policy"
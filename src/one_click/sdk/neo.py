@@ -0,0 +1,313 @@
+#! /usr/bin/python -u
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@summary:
+    A Single Entry Point For All The SDK Scripts. Only The Module of The
+    Selected Subcommand Is Imported, So Starting a Subcommand Costs No More
+    Than Starting Its Script.
+
+    Usage:
+        ./neo.py <SUBCOMMAND> [SUBCOMMAND ARGUMENTS]
+        ./neo.py benchmark [--runs <NUM>] [--output <FILE>] [SUBCOMMAND...]
+        ./neo.py daemon [--socket <PATH>] [--idle-timeout <SEC>] [--stop]
+        ./neo.py batch <OPS FILE> -s <SERVER> -u <USER> -p <PASSWORD>
+            [--concurrency <NUM>] [--output <FILE>]
+
+    A batch runs the SDK actions of a JSONL file concurrently, over one
+    session, and writes the result of each action as a JSON line, e.g.
+        {"id": "g1", "sdk": "groups", "option": "add",
+         "payload": {"elementName": "g1"}}
+        {"sdk": "groups", "option": "addsystems", "depends_on": ["g1"],
+         "parameters": {"elementName": "g1"},
+         "payload": {"identifiers": ["10.0.0.1"]}}
+
+    The daemon runs subcommands for neo_client.py, which has the same
+    syntax as this script, so they don't pay for the start-up and the login.
+
+    Example:
+        ./neo.py jobs -s 10.0.0.1 -u admin -p 123456 -o getall
+        ./neo.py get_data -s 10.0.0.1 -u admin -p 123456 -o systems
+
+@date:   Oct 18, 2026
+"""
+import sys
+
+# Maps each subcommand to its (module, SDK class). Subcommands without a
+# class are scripts with parseArgs() and execute() functions.
+SUBCOMMANDS = {
+    "events": ("neo_events", "NeoEventsSdk"),
+    "event_policy": ("neo_events_policy", "NeoEventsPolicySdk"),
+    "groups": ("neo_groups", "NeoGroupsSdk"),
+    "jobs": ("neo_jobs", "NeoJobsSdk"),
+    "monitor": ("neo_monitor", "NeoMonitorSdk"),
+    "notifications": ("neo_notifications", "NeoNotificationsSdk"),
+    "provisioning": ("neo_provisioning", "NeoProvisioningSdk"),
+    "software_upgrade": ("neo_software_upgrade", "NeoSWUpgradeSDK"),
+    "tasks": ("neo_tasks", "NeoTasksSdk"),
+    "users": ("neo_users", "NeoUsersSdk"),
+    "get_data": ("neo_get_data", None),
+    "mirror": ("neo_mirror", None),
+    "sync": ("neo_sync", None),
+    "standin": ("neo_standin_server", None),
+}
+
+BENCHMARK = "benchmark"
+DAEMON = "daemon"
+BATCH = "batch"
+
+# Subcommands that don't end by themselves (e.g. a server), which the
+# daemon doesn't run as they would block it. Its clients run them locally.
+LOCAL_SUBCOMMANDS = ("standin",)
+
+
+def printUsage(stream=sys.stdout):
+    stream.write("usage: %s <subcommand> [arguments]\n\n" % sys.argv[0])
+    stream.write("subcommands:\n")
+    for subcommand in sorted(SUBCOMMANDS) + [BATCH, BENCHMARK, DAEMON]:
+        stream.write("    %s\n" % subcommand)
+    stream.write("\nUse '%s <subcommand> -h' for the arguments of a "
+                 "subcommand\n" % sys.argv[0])
+
+
+def runSubcommand(subcommand, args):
+    '''
+    @summary:
+        Imports the module of the subcommand and runs it, as if its
+        script was run with the given arguments.
+    '''
+    module_name, class_name = SUBCOMMANDS[subcommand]
+    sys.argv = ["%s %s" % (sys.argv[0], subcommand)] + args
+    module = __import__(module_name)
+    if class_name is None:
+        module.execute(module.parseArgs())
+    else:
+        getattr(module, class_name).main()
+
+
+def batch(args):
+    '''
+    @summary:
+        Runs the SDK actions of a JSONL file concurrently, over a single
+        NEO session, and streams their results as JSON lines
+    '''
+    import argparse
+    import json
+    from infra.neo_connection import NeoConnection
+    from infra.neo_batch import NeoBatch, BatchOperation, readOperations
+    from infra.sdk_exceptions import BadFileFormat
+
+    parser = argparse.ArgumentParser(prog="%s %s" % (sys.argv[0], BATCH))
+    parser.add_argument("operations", type=argparse.FileType("r"),
+                        help="JSONL file of SDK actions ('-' for stdin)")
+    parser.add_argument("-s", "--server", action="store", required=True,
+                        help="NEO server IP address")
+    parser.add_argument("-u", "--username", action="store", required=True,
+                        help="NEO user name")
+    parser.add_argument("-p", "--password", action="store", required=True,
+                        help="NEO password")
+    parser.add_argument("-r", "--protocol", action="store", default="http",
+                        choices=["http", "https"],
+                        help="Protocol (http or https)")
+    parser.add_argument("-z", "--compress", action="store_true",
+                        default=False,
+                        help="Request gzip/deflate compressed responses")
+    parser.add_argument("--concurrency", action="store", type=int,
+                        default=NeoBatch.DEFAULT_CONCURRENCY,
+                        help="Number of actions that run at once")
+    parser.add_argument("--output", action="store", type=argparse.FileType(
+                        "w"), default=sys.stdout,
+                        help="File to write the results to (default: "
+                             "stdout)")
+    arguments = parser.parse_args(args)
+
+    sdk_names = set(name for name, (_, class_name) in SUBCOMMANDS.iteritems()
+                    if class_name is not None)
+    try:
+        operations = readOperations(arguments.operations, sdk_names)
+    except BadFileFormat as exc:
+        parser.error(str(exc))
+
+    # The SDK modules are imported up front, not by the worker threads
+    sdk_classes = {}
+    for operation in operations:
+        if operation.sdk not in sdk_classes:
+            module_name, class_name = SUBCOMMANDS[operation.sdk]
+            sdk_classes[operation.sdk] = getattr(__import__(module_name),
+                                                 class_name)
+
+    connection = NeoConnection(arguments.username, arguments.password,
+                               arguments.server, protocol=arguments.protocol,
+                               compress=arguments.compress,
+                               max_connections=arguments.concurrency)
+
+    def createSdk(operation):
+        # What the actions print goes to stderr, stdout holds the results
+        return sdk_classes[operation.sdk](
+            connection, stdout=sys.stderr, server=arguments.server,
+            username=arguments.username, password=arguments.password,
+            protocol=arguments.protocol, **operation.arguments)
+
+    def writeResult(result):
+        arguments.output.write(json.dumps(result) + "\n")
+        arguments.output.flush()
+
+    counts = NeoBatch(createSdk, arguments.concurrency).run(operations,
+                                                            writeResult)
+    sys.stderr.write("[*] %d actions: %d succeeded, %d failed, %d skipped\n"
+                     % (len(operations),
+                        counts.get(BatchOperation.SUCCEEDED, 0),
+                        counts.get(BatchOperation.FAILED, 0),
+                        counts.get(BatchOperation.SKIPPED, 0)))
+    if counts.get(BatchOperation.SUCCEEDED, 0) != len(operations):
+        sys.exit(1)
+
+
+def runDaemonCommand(argv):
+    '''
+    @summary:
+        Runs a subcommand for a client of the daemon
+    '''
+    if not argv or argv[0] not in SUBCOMMANDS:
+        sys.stderr.write("-E- Unknown subcommand '%s'\n" % " ".join(argv[:1]))
+        sys.exit(1)
+    if argv[0] in LOCAL_SUBCOMMANDS:
+        sys.stderr.write("-E- The daemon doesn't run '%s', as it would "
+                         "block it\n" % argv[0])
+        sys.exit(1)
+    runSubcommand(argv[0], argv[1:])
+
+
+def daemon(args):
+    '''
+    @summary:
+        Runs the daemon in the foreground, or stops the running one
+    '''
+    import argparse
+    import signal
+    from infra import neo_daemon
+
+    parser = argparse.ArgumentParser(prog="%s %s" % (sys.argv[0], DAEMON))
+    parser.add_argument("--socket", action="store",
+                        default=neo_daemon.DEFAULT_SOCKET_PATH,
+                        help="Path of the Unix domain socket to listen on")
+    parser.add_argument("--idle-timeout", action="store", type=float,
+                        default=None,
+                        help="Exit after this number of seconds without "
+                             "requests (default: never)")
+    parser.add_argument("--stop", action="store_true", default=False,
+                        help="Stop the daemon that listens on the socket")
+    arguments = parser.parse_args(args)
+
+    if arguments.stop:
+        try:
+            neo_daemon.stop(arguments.socket)
+        except neo_daemon.DaemonUnavailable as exc:
+            sys.stderr.write("-E- %s\n" % exc)
+            sys.exit(1)
+        return
+
+    # Exit cleanly on 'kill', so the socket file is removed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        neo_daemon.NeoDaemon(runDaemonCommand, arguments.socket,
+                             arguments.idle_timeout).serveForever()
+    except neo_daemon.DaemonUnavailable as exc:
+        sys.stderr.write("-E- %s\n" % exc)
+        sys.exit(1)
+
+
+def benchmark(args):
+    '''
+    @summary:
+        Measures the cold start latency of subcommands: the time until
+        their help is printed, through this entry point and through their
+        own script, compared with the start of a bare interpreter.
+    '''
+    import argparse
+    import json
+    import os
+    import subprocess
+    import time
+
+    parser = argparse.ArgumentParser(prog="%s %s" % (sys.argv[0],
+                                                     BENCHMARK))
+    parser.add_argument("subcommands", nargs="*",
+                        help="Subcommands to measure (default: all)")
+    parser.add_argument("--runs", action="store", type=int, default=10,
+                        help="Number of runs of each command")
+    parser.add_argument("--output", action="store", default=None,
+                        help="Append the results as a JSON line to this "
+                             "file, to track them over time")
+    arguments = parser.parse_args(args)
+    for subcommand in arguments.subcommands:
+        if subcommand not in SUBCOMMANDS:
+            parser.error("unknown subcommand '%s'" % subcommand)
+
+    sdk_dir = os.path.dirname(os.path.abspath(__file__))
+    devnull = open(os.devnull, "w")
+
+    def measure(command):
+        # Returns the minimum and median run time, in milliseconds
+        times = []
+        for _ in xrange(arguments.runs):
+            start = time.time()
+            subprocess.call(command, stdout=devnull, stderr=devnull)
+            times.append((time.time() - start) * 1000)
+        times.sort()
+        return times[0], times[len(times) / 2]
+
+    interpreter = measure([sys.executable, "-c", "pass"])
+    line_format = "%-18s %12s %12s %12s %12s"
+    print(line_format % ("Subcommand", "neo.py min", "neo.py p50",
+                         "script min", "script p50"))
+    print(line_format % ("(interpreter)", "%.1f" % interpreter[0],
+                         "%.1f" % interpreter[1], "-", "-"))
+    results = {"time": time.time(), "runs": arguments.runs,
+               "interpreter": interpreter, "subcommands": {}}
+    for subcommand in arguments.subcommands or sorted(SUBCOMMANDS):
+        script = os.path.join(sdk_dir, SUBCOMMANDS[subcommand][0] + ".py")
+        dispatched = measure([sys.executable, os.path.abspath(__file__),
+                              subcommand, "--help"])
+        direct = measure([sys.executable, script, "--help"])
+        results["subcommands"][subcommand] = {"neo": dispatched,
+                                              "script": direct}
+        print(line_format % (subcommand,
+                             "%.1f" % dispatched[0], "%.1f" % dispatched[1],
+                             "%.1f" % direct[0], "%.1f" % direct[1]))
+
+    if arguments.output:
+        with open(arguments.output, "a") as output:
+            output.write(json.dumps(results) + "\n")
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help"):
+        printUsage()
+        return
+    subcommand, args = sys.argv[1], sys.argv[2:]
+    if subcommand == BENCHMARK:
+        benchmark(args)
+    elif subcommand == DAEMON:
+        daemon(args)
+    elif subcommand == BATCH:
+        batch(args)
+    elif subcommand in SUBCOMMANDS:
+        runSubcommand(subcommand, args)
+    else:
+        sys.stderr.write("-E- Unknown subcommand '%s'\n\n" % subcommand)
+        printUsage(sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
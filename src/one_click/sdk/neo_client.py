@@ -0,0 +1,56 @@
+#! /usr/bin/python -u
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@summary:
+    A Client of The SDK Daemon (./neo.py daemon), With The Same Syntax As
+    neo.py. The Subcommand Is Run by The Daemon, Which Keeps Its Imports,
+    Connections And NEO Sessions Warm, And Its Output Is Streamed Back. When
+    No Daemon Is Running, The Subcommand Is Run by This Process.
+
+    The Socket of The Daemon Is Taken From The NEO_SDK_SOCKET Environment
+    Variable, If Set.
+
+    Usage:
+        ./neo_client.py <SUBCOMMAND> [SUBCOMMAND ARGUMENTS]
+
+    Example:
+        ./neo_client.py jobs -s 10.0.0.1 -u admin -p 123456 -o getall
+
+@date:   Oct 18, 2026
+"""
+import os
+import sys
+import neo
+from infra import neo_daemon
+
+
+def main():
+    # The usage, the benchmark, the daemon itself and the subcommands that
+    # would block it (e.g. the stand-in server) are always local
+    if len(sys.argv) < 2 or sys.argv[1] not in neo.SUBCOMMANDS or \
+            sys.argv[1] in neo.LOCAL_SUBCOMMANDS:
+        neo.main()
+        return
+
+    socket_path = os.environ.get("NEO_SDK_SOCKET",
+                                 neo_daemon.DEFAULT_SOCKET_PATH)
+    try:
+        exit_code = neo_daemon.run(sys.argv[1:], socket_path)
+    except neo_daemon.DaemonUnavailable:
+        neo.main()
+        return
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
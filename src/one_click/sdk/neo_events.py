@@ -15,6 +15,8 @@
 """
 
 
+import json
+import time
 from infra.neo_sdk import NeoSdk
 from infra.url import URL
 from infra.sdk_parameters import ParamNames
@@ -29,25 +31,29 @@ class NeoEventsSdk(NeoSdk):
     GET_ALL_EVENTS = "getall"
     GET_EVENT = "get"
     GET_EVENTS_FOR_SYSTEMS = "getforsys"
+    LISTEN_EVENTS = "listen"
 
     # Descriptions of all the possible events actions
     GET_ALL_EVENTS_DESCRIPTION = "Getting all events data"
     GET_EVENT_DESCRIPTION = "Getting event data"
     GET_EVENTS_FOR_SYSTEMS_DESCRIPTION = "Getting events for systems"
+    LISTEN_EVENTS_DESCRIPTION = "Receiving the events pushed by NEO"
 
     # Map each action to its description
     ACTION_TO_DESCRIPTION = {
         GET_ALL_EVENTS: GET_ALL_EVENTS_DESCRIPTION,
         GET_EVENT: GET_EVENT_DESCRIPTION,
-        GET_EVENTS_FOR_SYSTEMS: GET_EVENTS_FOR_SYSTEMS_DESCRIPTION}
+        GET_EVENTS_FOR_SYSTEMS: GET_EVENTS_FOR_SYSTEMS_DESCRIPTION,
+        LISTEN_EVENTS: LISTEN_EVENTS_DESCRIPTION}
 
     # Map each action to a list of expected parameters
     ACTION_TO_EXPECTED_PARAMS = {
         GET_ALL_EVENTS: [],
         GET_EVENT: [ParamNames.EVENT_ID],
-        GET_EVENTS_FOR_SYSTEMS: [ParamNames.SYSTEM_ID]}
+        GET_EVENTS_FOR_SYSTEMS: [ParamNames.SYSTEM_ID],
+        LISTEN_EVENTS: [ParamNames.DURATION]}
 
-    def __init__(self):
+    def __init__(self, connection=None, **arguments):
         """
         Constructor
         """
@@ -55,7 +61,8 @@ class NeoEventsSdk(NeoSdk):
         self.ACTION_TO_FUNCTION = {
             self.GET_ALL_EVENTS: self.__getAllEvents,
             self.GET_EVENT: self.__getEvent,
-            self.GET_EVENTS_FOR_SYSTEMS: self.__getEventsForSystems}
+            self.GET_EVENTS_FOR_SYSTEMS: self.__getEventsForSystems,
+            self.LISTEN_EVENTS: self.__listenEvents}
 
         # Map each action to (should_have_param_arg, should_have_payload_arg)
         self.ACTION_TO_NEEDED_ARGS = {
@@ -64,9 +71,12 @@ class NeoEventsSdk(NeoSdk):
             self.GET_EVENT:
                 (self.PARAM_ARG_NEEDED, self.PAYLOAD_ARG_NOT_NEEDED),
             self.GET_EVENTS_FOR_SYSTEMS:
+                (self.PARAM_ARG_NEEDED, self.PAYLOAD_ARG_NOT_NEEDED),
+            self.LISTEN_EVENTS:
                 (self.PARAM_ARG_NEEDED, self.PAYLOAD_ARG_NOT_NEEDED)}
 
-        super(NeoEventsSdk, self).__init__(URL.EVENTS_URL)
+        super(NeoEventsSdk, self).__init__(URL.EVENTS_URL, connection,
+                                           **arguments)
 
     def _getActionToDescription(self):
         return self.ACTION_TO_DESCRIPTION
@@ -94,15 +104,40 @@ class NeoEventsSdk(NeoSdk):
         return response, self.SHOULD_PRINT_RESPONSE
 
     def __getAllEvents(self, parameters, payload):
-        response = self._neo_session.get(self._action_url)
+        response = self._getCollection(self._action_url)
         return response, self.SHOULD_PRINT_RESPONSE
 
     def __getEventsForSystems(self, parameters, payload):
         systems_ids = parameters[ParamNames.SYSTEM_ID]
         url = "".join([self._action_url, "?object_ids=", systems_ids])
-        response = self._neo_session.get(url)
+        response = self._getCollection(url)
         return response, self.SHOULD_PRINT_RESPONSE
 
+    def __listenEvents(self, parameters, payload):
+        """
+        Print the events NEO pushes for the given duration (in seconds).
+        """
+        duration = float(parameters[ParamNames.DURATION])
+        receiver = self._getWebhookReceiver()
+        self._print("[*] Receiving events at %s" %
+                    receiver.url(self._arguments.server))
+        receiver.addListener(self.__printEvent)
+        time.sleep(duration)
+        receiver.removeListener(self.__printEvent)
+
+        # The notification target the events were pushed to
+        response = self._neo_session.get("%s%s/%s" % (
+            self._base_url, URL.NOTIFICATIONS_URL, receiver.target_id))
+        return response, self.SHOULD_PRINT_RESPONSE
+
+    def __printEvent(self, event):
+        if self._output.structured:
+            self._output.record("event", event)
+            return
+        # Events are pushed from several threads, so each one is printed
+        # with a single write
+        self._stdout.write(json.dumps(event) + "\n")
+
     def _addSessionArgs(self, parser):
         '''
         Adding new possible arguments to the argparse object
@@ -116,10 +151,14 @@ class NeoEventsSdk(NeoSdk):
             2)  getall - get all events
             3)  getforsys - get all events for a specific list of systems.
                 --parameters="system_id=value1,value2"
+            4)  listen - print the events NEO pushes for a while.
+                --parameters="duration=seconds"
             """
 
         self._addOptionArg(parser, option_help, self._getActionOptions())
         self._addParamAndPayloadArgs(parser)
+        self._addPushArgs(parser)
+        self._addPagingArgs(parser)
 
     def _validateArgs(self, action):
         '''
@@ -48,7 +48,7 @@ class NeoEventsPolicySdk(NeoSdk):
         GET_ALL_EVENTS_POLICIES: [],
         UPDATE_EVENT_POLICY: [ParamNames.EVENT_POLICY_ID]}
 
-    def __init__(self):
+    def __init__(self, connection=None, **arguments):
 
         # Map each action to its execute function
         self.ACTION_TO_FUNCTION = {
@@ -65,7 +65,8 @@ class NeoEventsPolicySdk(NeoSdk):
             self.UPDATE_EVENT_POLICY:
                 (self.PARAM_ARG_NEEDED, self.PAYLOAD_ARG_NOT_NEEDED)}
 
-        super(NeoEventsPolicySdk, self).__init__(URL.EVENT_POLICY_URL)
+        super(NeoEventsPolicySdk, self).__init__(
+            URL.EVENT_POLICY_URL, connection, **arguments)
 
     def _getActionToDescription(self):
         return self.ACTION_TO_DESCRIPTION
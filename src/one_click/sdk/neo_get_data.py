@@ -29,18 +29,31 @@
     Usage:
         ./neo_get_data.py --server <NEO SERVER> --username <USER NAME>
         --password <USER PASSWORD> --protocol <http | https>
-        --option <REST API NAME>
+        --option <REST API NAME> [--fields <FIELD,...>]
+        [--where <FIELD=VALUE | FIELD~REGEX>]... [--page-size <NUM>]
 
     Example:
         ./neo_get_data.py -s 10.0.0.1 -u admin -p 123456 -r https -o systems
+        ./neo_get_data.py -s 10.0.0.1 -u admin -p 123456 -o systems
+            --fields ip_address,model --where model~^SN27
+        ./neo_get_data.py -s 10.0.0.1 -u admin -p 123456 -o logs
+            --page-size 500
 
 @author: Muthanna Nairat
 """
 import sys
+import time
 import argparse
 import pprint
 from infra.neo_connection import NeoConnection
-import json
+from infra.json_stream import JsonStreamDecoder
+from infra.sdk_exceptions import ParamBadFormat
+
+# The modes of SdkOutput, which is imported only for a machine readable
+# output, like the cassettes, the object filter and the pager are imported
+# only when they're used (the pager's thread pool slows down the start)
+TEXT_OUTPUT = "text"
+OUTPUT_MODES = (TEXT_OUTPUT, "json", "ndjson")
 
 # ===================== CLASSES SECTION =========================
 
@@ -108,6 +121,9 @@ class Converter(object):
             return self._convertList(self.data)
         elif isinstance(self.data, dict):
             return self._convertDictionary(self.data)
+        elif isinstance(self.data, unicode):
+            return self.data.encode('utf-8')
+        return self.data
 
     def _convertList(self, data):
         '''
@@ -185,6 +201,33 @@ def parseArgs():
     connection.add_argument("-r", "--protocol", action="store", required=False,
                             default="http", choices=['http', 'https'],
                             help="Protocol (http or https)")
+    connection.add_argument("-z", "--compress", action="store_true",
+                            required=False, default=False,
+                            help="Request gzip/deflate compressed responses")
+
+    cassette = parser.add_argument_group('cassette')
+    cassette_file = cassette.add_mutually_exclusive_group()
+    cassette_file.add_argument("--record", action="store", required=False,
+                               default=None, metavar="CASSETTE",
+                               help="Record the exchanges with NEO to a "
+                                    "cassette file (gzip compressed if it "
+                                    "ends with .gz)")
+    cassette_file.add_argument("--replay", action="store", required=False,
+                               default=None, metavar="CASSETTE",
+                               help="Serve the exchanges recorded in a "
+                                    "cassette file instead of connecting "
+                                    "to NEO")
+    cassette.add_argument("--replay-speed", action="store", type=float,
+                          required=False, default=1.0,
+                          help="Replay speed factor (1 - original speed, "
+                               "0 - no delays)")
+
+    output = parser.add_argument_group('output')
+    output.add_argument("--output", action="store", required=False,
+                        default=TEXT_OUTPUT, choices=OUTPUT_MODES,
+                        help="Output format: text, a JSON document, or JSON "
+                             "lines streamed as they're known (default: "
+                             "%(default)s)")
 
     req_arg = parser.add_argument_group('request arguments')
     req_arg.add_argument("-o", "--option", action="store", required=True,
@@ -198,8 +241,33 @@ def parseArgs():
                                   'logs'],
                          default=None,
                          help="Specify which REST API data to retrieve")
+    req_arg.add_argument("--fields", action="store", required=False,
+                         default=None,
+                         help="Comma separated fields to display, with dots "
+                              "between the names of nested fields "
+                              "(e.g. ip_address,status.health)")
+    req_arg.add_argument("--where", action="append", required=False,
+                         default=[], metavar="CONDITION",
+                         help="Display only the objects whose field equals "
+                              "a value (field=value), or matches a regular "
+                              "expression (field~regex). May be repeated.")
+    req_arg.add_argument("--page-size", action="store", type=int,
+                         required=False, default=None,
+                         help="Read the data in pages of this number of "
+                              "objects, requesting the next page while the "
+                              "current one is displayed (default: in one "
+                              "request)")
 
     arguments = parser.parse_args()
+    arguments.object_filter = None
+    if arguments.fields or arguments.where:
+        from infra.object_filter import ObjectFilter
+        try:
+            arguments.object_filter = ObjectFilter(
+                ObjectFilter.parseFields(arguments.fields or ""),
+                arguments.where)
+        except ParamBadFormat as exc:
+            parser.error(str(exc))
 
     # Making Sure User Entered All Required Arguments in Command Line
     if not arguments.server:
@@ -221,10 +289,82 @@ def parseArgs():
     return arguments
 
 
+def startSession(arguments):
+    '''
+    @summary:
+        Returns a NeoConnection to the server in the arguments (or to the
+        cassette it replays)
+    '''
+    replay_pool = None
+    if arguments.replay:
+        from infra.neo_cassette import CassetteReplayPool
+        replay_pool = CassetteReplayPool(arguments.replay,
+                                         arguments.replay_speed)
+    elif arguments.record:
+        from infra.neo_cassette import CassetteRecorder
+        NeoConnection.addRequestHook(CassetteRecorder(arguments.record))
+    return NeoConnection(arguments.username,
+                         arguments.password,
+                         arguments.server,
+                         port=80,
+                         protocol=arguments.protocol,
+                         compress=arguments.compress,
+                         session_cache=replay_pool is None,
+                         pool=replay_pool)
+
+
+def readData(neo_session, option, page_size=None):
+    '''
+    @summary:
+        Returns the response of the specified REST API, read in one request,
+        or page by page with 'page_size' objects per page.
+    '''
+    url = RestAPI.getUrl(option)
+    if not page_size:
+        return neo_session.get(url)
+    from infra.neo_pager import NeoPager, PagedResponse
+    return PagedResponse(NeoPager(neo_session, url, page_size))
+
+
+def getData(neo_session, option, object_filter=None, page_size=None):
+    '''
+    @summary:
+        Generator of the objects of the specified REST API. Objects are
+        decoded and encoded to utf-8 one by one while the response is read.
+
+    @param neo_session:
+        NeoConnection to read the data with.
+
+    @param option:
+        Takes one option from RestAPI.INTERFACE_MAPPER.
+
+    @param object_filter:
+        ObjectFilter that selects and projects the objects (optional).
+
+    @param page_size:
+        Number of objects to request at a time (optional). The next page
+        is requested while the objects of the current one are consumed.
+    '''
+    if page_size:
+        from infra.neo_pager import NeoPager
+        objects = iter(NeoPager(neo_session, RestAPI.getUrl(option),
+                                page_size))
+    else:
+        response = neo_session.get(RestAPI.getUrl(option))
+        objects = JsonStreamDecoder(response).iterItems()
+    if object_filter is not None:
+        objects = object_filter.select(objects)
+    for res_data in objects:
+        yield Converter(res_data).convert()
+
+
 def execute(arguments):
     '''
     @summary: Main Execution Method
     '''
+    if arguments.output != TEXT_OUTPUT:
+        return executeStructured(arguments)
+
     print("-" * 70)
     print("[*] Running settings:")
     print(" -> NEO server: " + arguments.server)
@@ -239,26 +379,59 @@ def execute(arguments):
     print("-" * 70)
     print("[*] Execution Stages:")
     print(" -1- Starting NEO Session...")
-    neo_session = NeoConnection(arguments.username,
-                                arguments.password,
-                                arguments.server,
-                                port=80,
-                                protocol=arguments.protocol)
+    neo_session = startSession(arguments)
 
     # Sending Request to Access Specified NEO Interface
     print(" -2- Reading Data From REST API: " + RestAPI_url)
-    response = neo_session.get(RestAPI_url)
-    res_data = json.loads(response.read())
-    # Encoding Result Data to utf-8
-    data_converter = Converter(res_data)
-    encoded_result = data_converter.convert()
+    response = readData(neo_session, arguments.option, arguments.page_size)
 
-    # Displaying Result Data
+    # Displaying Result Data. Objects Are Decoded, Encoded to utf-8 And
+    # Displayed One By One While The Response Is Read, So Memory Usage
+    # Doesn't Depend On The Response Size
     print("-" * 70)
     print("[*] Output:")
-    pprint.pprint(encoded_result)
+    objects = None
+    if arguments.page_size:
+        # A PagedResponse has the objects already decoded
+        objects = response.iterObjects()
+    if objects is None:
+        objects = JsonStreamDecoder(response).iterItems()
+    if arguments.object_filter is not None:
+        objects = arguments.object_filter.select(objects)
+    for res_data in objects:
+        data_converter = Converter(res_data)
+        pprint.pprint(data_converter.convert())
+    print("-" * 70)
+
+    # Displaying Transfer Size, To Show The Compression Savings
+    print("[*] Received %d bytes (%d bytes decoded)" %
+          (response.raw_bytes, response.decoded_bytes))
     print("-" * 70)
 
+
+def executeStructured(arguments):
+    '''
+    @summary:
+        Execution with a machine readable output (see SdkOutput). The
+        objects are written one by one while the response is read.
+    '''
+    from infra.sdk_output import SdkOutput
+    output = SdkOutput(arguments.output)
+    select = lambda items: items
+    if arguments.object_filter is not None:
+        select = arguments.object_filter.select
+    try:
+        neo_session = startSession(arguments)
+        start = time.time()
+        response = readData(neo_session, arguments.option,
+                            arguments.page_size)
+        output.response(arguments.option, response, time.time() - start,
+                        select)
+    except Exception as exc:
+        output.error("-E- Got an error while reading %s: %s" %
+                     (arguments.option, exc))
+        sys.exit(1)
+
 # =================== END OF FUNCTIONS SECTION ==================
 
 
@@ -82,7 +82,7 @@ class NeoGroupsSdk(NeoSdk):
         DELETE_ALL_SYSTEMS_IN_GROUP: [ParamNames.ELEMENT_NAME],
         GET_GROUPS_BY_SYSTEMS: [ParamNames.SYSTEM_ID]}
 
-    def __init__(self):
+    def __init__(self, connection=None, **arguments):
         """
         Constructor
         """
@@ -127,7 +127,8 @@ class NeoGroupsSdk(NeoSdk):
             self.GET_GROUPS_BY_SYSTEMS:
                 (self.PARAM_ARG_NEEDED, self.PAYLOAD_ARG_NOT_NEEDED)}
 
-        super(NeoGroupsSdk, self).__init__(URL.GROUPS_URL)
+        super(NeoGroupsSdk, self).__init__(URL.GROUPS_URL, connection,
+                                           **arguments)
 
     def _getActionToDescription(self):
         return self.ACTION_TO_DESCRIPTION
@@ -17,6 +17,7 @@
 from infra.url import URL
 from infra.neo_sdk import NeoSdk
 from infra.sdk_parameters import ParamNames
+from infra.sdk_exceptions import JobTimeout
 
 
 class NeoJobsSdk(NeoSdk):
@@ -30,6 +31,7 @@ class NeoJobsSdk(NeoSdk):
     GET_PARENT_JOBS = "getparentjobs"
     GET_SUB_JOBS = "getchildjobs"
     GET_JOBS_FOR_SYSTEM = "getsystemjobs"
+    WAIT_JOBS = "wait"
 
     # Descriptions of all the possible job actions
     GET_JOBS_DESCRIPTION = "Getting job data"
@@ -37,6 +39,7 @@ class NeoJobsSdk(NeoSdk):
     GET_PARENT_JOBS_DESCRIPTION = "Getting all parent jobs"
     GET_SUB_JOBS_DESCRIPTION = "Getting all sub jobs of a specific job"
     GET_JOBS_FOR_SYSTEM_DESCRIPTION = "Getting jobs for system"
+    WAIT_JOBS_DESCRIPTION = "Waiting for jobs to end"
 
     # Map each action to its description
     ACTION_TO_DESCRIPTION = {
@@ -44,7 +47,8 @@ class NeoJobsSdk(NeoSdk):
         GET_ALL_JOBS: GET_ALL_JOBS_DESCRIPTION,
         GET_PARENT_JOBS: GET_PARENT_JOBS_DESCRIPTION,
         GET_SUB_JOBS: GET_SUB_JOBS_DESCRIPTION,
-        GET_JOBS_FOR_SYSTEM: GET_JOBS_FOR_SYSTEM_DESCRIPTION}
+        GET_JOBS_FOR_SYSTEM: GET_JOBS_FOR_SYSTEM_DESCRIPTION,
+        WAIT_JOBS: WAIT_JOBS_DESCRIPTION}
 
     # Map each action to a list of expected parameters
     ACTION_TO_EXPECTED_PARAMS = {
@@ -52,9 +56,10 @@ class NeoJobsSdk(NeoSdk):
         GET_ALL_JOBS: [],
         GET_PARENT_JOBS: [],
         GET_SUB_JOBS: [ParamNames.JOB_ID],
-        GET_JOBS_FOR_SYSTEM: [ParamNames.SYSTEM_ID]}
+        GET_JOBS_FOR_SYSTEM: [ParamNames.SYSTEM_ID],
+        WAIT_JOBS: [ParamNames.JOB_ID]}
 
-    def __init__(self):
+    def __init__(self, connection=None, **arguments):
         """
         Constructor
         """
@@ -65,7 +70,8 @@ class NeoJobsSdk(NeoSdk):
             self.GET_ALL_JOBS: self.__getAllJobs,
             self.GET_PARENT_JOBS: self.__getParentJobs,
             self.GET_SUB_JOBS: self.__getSubJobs,
-            self.GET_JOBS_FOR_SYSTEM: self.__getJobsForSystem}
+            self.GET_JOBS_FOR_SYSTEM: self.__getJobsForSystem,
+            self.WAIT_JOBS: self.__waitJobs}
 
         # Map each action to (should_have_param_arg, should_have_payload_arg)
         self.ACTION_TO_NEEDED_ARGS = {
@@ -78,9 +84,11 @@ class NeoJobsSdk(NeoSdk):
             self.GET_SUB_JOBS:
                 (self.PARAM_ARG_NEEDED, self.PAYLOAD_ARG_NOT_NEEDED),
             self.GET_JOBS_FOR_SYSTEM:
+                (self.PARAM_ARG_NEEDED, self.PAYLOAD_ARG_NOT_NEEDED),
+            self.WAIT_JOBS:
                 (self.PARAM_ARG_NEEDED, self.PAYLOAD_ARG_NOT_NEEDED)}
 
-        super(NeoJobsSdk, self).__init__(URL.JOBS_URL)
+        super(NeoJobsSdk, self).__init__(URL.JOBS_URL, connection, **arguments)
 
     def _getActionToDescription(self):
         return self.ACTION_TO_DESCRIPTION
@@ -108,24 +116,62 @@ class NeoJobsSdk(NeoSdk):
         return response, self.SHOULD_PRINT_RESPONSE
 
     def __getAllJobs(self, parameters, payload):
-        response = self._neo_session.get(self._action_url)
+        response = self._getCollection(self._action_url)
         return response, self.SHOULD_PRINT_RESPONSE
 
     def __getParentJobs(self, parameters, payload):
         url = "".join([self._action_url, "?parent_id=null"])
-        response = self._neo_session.get(url)
+        response = self._getCollection(url)
         return response, self.SHOULD_PRINT_RESPONSE
 
     def __getSubJobs(self, parameters, payload):
         job_id = parameters[ParamNames.JOB_ID]
         url = "".join([self._action_url, "?parent_id=", job_id])
-        response = self._neo_session.get(url)
+        response = self._getCollection(url)
         return response, self.SHOULD_PRINT_RESPONSE
 
     def __getJobsForSystem(self, parameters, payload):
         systems = parameters[ParamNames.SYSTEM_ID]
         url = "".join([self._action_url, "?object_ids=", systems])
-        response = self._neo_session.get(url)
+        response = self._getCollection(url)
+        return response, self.SHOULD_PRINT_RESPONSE
+
+    def __waitJobs(self, parameters, payload):
+        """
+        Wait for a list of jobs to end. All the jobs are tracked together,
+        and each job is reported as soon as it ends.
+        """
+        # Imported here, as most actions don't track jobs
+        from infra.job_future import asCompleted
+        jobs_ids = parameters[ParamNames.JOB_ID]
+        poller = self._getJobPoller()
+        futures = [poller.submit(job_id)
+                   for job_id in jobs_ids.split(self.LIST_DELIMITER)]
+        try:
+            for future in asCompleted(futures, self._arguments.job_timeout):
+                exception = future.exception()
+                if exception is not None:
+                    # e.g. the job was deleted
+                    if self._output.structured:
+                        self._output.record("job_ended", {
+                            "ID": future.job_id, "Error": str(exception)})
+                    else:
+                        self._print("[*] Couldn't get the status of job "
+                                    "%s: %s" % (future.job_id, exception))
+                    continue
+                job = future.result()
+                if self._output.structured:
+                    self._output.record("job_ended", job)
+                else:
+                    self._print("[*] Job %s ended. Status: %s" %
+                                (job["ID"], job["Status"]))
+        except JobTimeout:
+            self._print("[*] Couldn't verify the status of jobs %s. "
+                        "It's taking too long." %
+                        ", ".join(str(future.job_id) for future in futures
+                                  if not future.done()))
+
+        response = self._neo_session.get(self._getRequestURL(jobs_ids))
         return response, self.SHOULD_PRINT_RESPONSE
 
     def _addSessionArgs(self, parser):
@@ -139,10 +185,14 @@ class NeoJobsSdk(NeoSdk):
                 --parameters="job_id=value"
             5) getsystemjobs - get all jobs for a list of systems.
                 --parameters="system_id=value1,value2,value3..."
+            6) wait - wait for a list of jobs to end.
+                --parameters="job_id=value1,value2,value3..."
         """
 
         self._addOptionArg(parser, option_help, self._getActionOptions())
         self._addParamAndPayloadArgs(parser)
+        self._addJobTrackingArgs(parser)
+        self._addPagingArgs(parser)
 
     def _validateArgs(self, action):
         '''
@@ -0,0 +1,219 @@
+#! /usr/bin/python -u
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@summary:
+    A Local SQLite Mirror of The NEO Systems, Ports, Groups (And Their
+    Members), Jobs And Events. 'refresh' Updates The Mirror From NEO (The
+    Jobs And Events Incrementally), And 'query' Runs SQL Queries On It
+    Without Connecting to NEO.
+
+    Tables (The Whole NEO Object Is in The 'data' Column of Each Table):
+        systems (ip_address, hostname, model, sw_version, status)
+        ports (id, system, name, state, speed)
+        groups (name, description)
+        group_members (group_name, system)
+        jobs (id, parent_id, status, progress, description, creation_time,
+              completed_time)
+        job_objects (job_id, object_id)
+        events (id, timestamp, severity, category, object_type, object_id,
+                description)
+
+    Usage:
+        ./neo_mirror.py --server <NEO SERVER> --username <USER NAME>
+        --password <USER PASSWORD> --option refresh
+        [--collections <systems,ports,groups,jobs,events>] [--full]
+
+        ./neo_mirror.py --server <NEO SERVER> --option query --sql <QUERY>
+        [--output <text | json | ndjson>]
+
+    Example:
+        ./neo_mirror.py -s 10.0.0.1 -u admin -p 123456 -o refresh
+        ./neo_mirror.py -s 10.0.0.1 -o query --sql "SELECT p.system, p.name
+            FROM ports p JOIN group_members m ON m.system = p.system
+            WHERE m.group_name = 'rack-1' AND p.state = 'Down'"
+
+@date:   Oct 18, 2026
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from collections import OrderedDict
+from infra.neo_connection import NeoConnection
+from infra.sqlite_mirror import NeoMirror
+from infra.sdk_output import SdkOutput
+
+REFRESH = "refresh"
+QUERY = "query"
+
+MIRROR_DIR = os.path.join(os.path.expanduser("~"), ".neo_sdk", "mirrors")
+
+
+def parseCollections(collections):
+    '''
+    @summary:
+        Returns the list of collections of a comma separated string
+    '''
+    names = [name.strip() for name in collections.split(",") if name.strip()]
+    unknown = set(names) - set(NeoMirror.COLLECTIONS)
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            "unknown collections: %s (choose from %s)" %
+            (", ".join(sorted(unknown)), ", ".join(NeoMirror.COLLECTIONS)))
+    return names
+
+
+def parseArgs():
+    '''
+    @summary:
+        this method parses SDK command line
+        arguments
+    '''
+    parser = argparse.ArgumentParser()
+
+    connection = parser.add_argument_group('connection')
+    connection.add_argument("-s", "--server", action="store",
+                            required=True, default=None,
+                            help="NEO server IP address")
+    connection.add_argument("-u", "--username", action="store",
+                            required=False, default=None,
+                            help="NEO user name (needed by refresh)")
+    connection.add_argument("-p", "--password", action="store",
+                            required=False, default=None,
+                            help="NEO user password (needed by refresh)")
+    connection.add_argument("-r", "--protocol", action="store", required=False,
+                            default="http", choices=['http', 'https'],
+                            help="Protocol (http or https)")
+    connection.add_argument("-z", "--compress", action="store_true",
+                            required=False, default=False,
+                            help="Request gzip/deflate compressed responses")
+
+    mirror = parser.add_argument_group('mirror')
+    mirror.add_argument("-o", "--option", action="store", required=True,
+                        choices=[REFRESH, QUERY], default=None,
+                        help="Refresh the mirror from NEO, or query it")
+    mirror.add_argument("--db", action="store", required=False,
+                        default=None, metavar="FILE",
+                        help="SQLite file of the mirror (default: a file "
+                             "per server under %s)" % MIRROR_DIR)
+    mirror.add_argument("--collections", action="store", required=False,
+                        default=list(NeoMirror.COLLECTIONS),
+                        type=parseCollections,
+                        help="Comma separated collections to refresh "
+                             "(default: all)")
+    mirror.add_argument("--full", action="store_true", required=False,
+                        default=False,
+                        help="Fetch all the jobs and events again, instead "
+                             "of the ones that changed since the last "
+                             "refresh")
+    mirror.add_argument("--sql", action="store", required=False,
+                        default=None,
+                        help="SQL query to run on the mirror")
+
+    output = parser.add_argument_group('output')
+    output.add_argument("--output", action="store", required=False,
+                        default=SdkOutput.TEXT, choices=SdkOutput.MODES,
+                        help="Output format of the query rows: text, a "
+                             "JSON document, or a JSON line per row "
+                             "(default: %(default)s)")
+
+    arguments = parser.parse_args()
+    if arguments.option == REFRESH and \
+            not (arguments.username and arguments.password):
+        parser.error("refresh needs the NEO user name [-u] and password "
+                     "[-p]")
+    if arguments.option == QUERY and not arguments.sql:
+        parser.error("query needs an SQL query [--sql]")
+    if arguments.db is None:
+        # Colons aren't allowed in Windows file names
+        arguments.db = os.path.join(MIRROR_DIR, "%s.db" %
+                                    arguments.server.replace(":", "_"))
+    return arguments
+
+
+def refresh(mirror, arguments):
+    '''
+    @summary:
+        Refreshes the mirror from NEO, and prints the number of objects
+        stored from each collection
+    '''
+    neo_session = NeoConnection(arguments.username,
+                                arguments.password,
+                                arguments.server,
+                                port=80,
+                                protocol=arguments.protocol,
+                                compress=arguments.compress)
+    if arguments.full:
+        mirror.reset(arguments.collections)
+    start = time.time()
+    for collection, count in mirror.refresh(neo_session,
+                                            arguments.collections):
+        print("[*] %s: %d stored" % (collection, count))
+    print("[*] Refreshed %s in %.1f ms" % (arguments.db,
+                                           (time.time() - start) * 1000))
+
+
+def query(mirror, arguments):
+    '''
+    @summary:
+        Runs a query on the mirror, and prints its rows
+    '''
+    start = time.time()
+    columns, rows = mirror.query(arguments.sql)
+    if arguments.output == SdkOutput.NDJSON:
+        for row in rows:
+            print(json.dumps(OrderedDict(zip(columns, row))))
+        return
+    if arguments.output == SdkOutput.JSON:
+        print(json.dumps([OrderedDict(zip(columns, row)) for row in rows]))
+        return
+
+    # The rows are read first, to align the columns
+    rows = [["NULL" if value is None else unicode(value) for value in row]
+            for row in rows]
+    elapsed = time.time() - start
+    widths = [max([len(column)] + [len(row[index]) for row in rows])
+              for index, column in enumerate(columns)]
+    line_format = "  ".join("%%-%ds" % width for width in widths)
+    if columns:
+        print((line_format % tuple(columns)).rstrip())
+        print(line_format % tuple("-" * width for width in widths))
+    for row in rows:
+        print((line_format % tuple(row)).rstrip().encode("utf-8"))
+    print("[*] %d rows in %.1f ms" % (len(rows), elapsed * 1000))
+
+
+def execute(arguments):
+    '''
+    @summary: Main Execution Method
+    '''
+    mirror = None
+    try:
+        mirror = NeoMirror(arguments.db)
+        if arguments.option == REFRESH:
+            refresh(mirror, arguments)
+        else:
+            query(mirror, arguments)
+    except Exception as exc:
+        sys.stderr.write("-E- Got an error while running %s: %s\n" %
+                         (arguments.option, exc))
+        sys.exit(1)
+    finally:
+        if mirror is not None:
+            mirror.close()
+
+
+if __name__ == "__main__":
+    args = parseArgs()
+    execute(args)
@@ -45,7 +45,7 @@ class NeoMonitorSdk(NeoSdk):
                               ParamNames.UNTIL],
         GET_ALL_MONITORING_DATA: []}
 
-    def __init__(self):
+    def __init__(self, connection=None, **arguments):
 
         # Map each action to its execute function
         self.ACTION_TO_FUNCTION = {
@@ -59,7 +59,8 @@ class NeoMonitorSdk(NeoSdk):
             self.GET_ALL_MONITORING_DATA:
                 (self.PARAM_ARG_NOT_NEEDED, self.PAYLOAD_ARG_NOT_NEEDED)}
 
-        super(NeoMonitorSdk, self).__init__(URL.MONITOR_URL)
+        super(NeoMonitorSdk, self).__init__(URL.MONITOR_URL, connection,
+                                            **arguments)
 
     def _validateParamExistence(self, parameters, expected_params):
         """
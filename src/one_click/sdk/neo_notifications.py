@@ -50,7 +50,7 @@ class NeoNotificationsSdk(NeoSdk):
         UPDATE_NOTIFICATION: [ParamNames.NOTIFICATION_ID],
         DELETE_NOTIFICATION: [ParamNames.NOTIFICATION_ID]}
 
-    def __init__(self):
+    def __init__(self, connection=None, **arguments):
 
         # Map each action to its execute function
         self.ACTION_TO_FUNCTION = {
@@ -70,7 +70,8 @@ class NeoNotificationsSdk(NeoSdk):
             self.DELETE_NOTIFICATION:
                 (self.PARAM_ARG_NEEDED, self.PAYLOAD_ARG_NOT_NEEDED)}
 
-        super(NeoNotificationsSdk, self).__init__(URL.NOTIFICATIONS_URL)
+        super(NeoNotificationsSdk, self).__init__(
+            URL.NOTIFICATIONS_URL, connection, **arguments)
 
     def _getActionToDescription(self):
         return self.ACTION_TO_DESCRIPTION
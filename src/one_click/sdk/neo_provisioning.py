@@ -56,7 +56,7 @@ class NeoProvisioningSdk(NeoSdk):
         ADD_TEMPLATE: []
     }
 
-    def __init__(self):
+    def __init__(self, connection=None, **arguments):
 
         # Map each action to its execute function
         self.ACTION_TO_FUNCTION = {
@@ -78,7 +78,8 @@ class NeoProvisioningSdk(NeoSdk):
                 (self.PARAM_ARG_NOT_NEEDED, self.PAYLOAD_ARG_NOT_NEEDED)    
         }
 
-        super(NeoProvisioningSdk, self).__init__(URL.PROVISIONING_URL)
+        super(NeoProvisioningSdk, self).__init__(
+            URL.PROVISIONING_URL, connection, **arguments)
 
     def _getActionToDescription(self):
         return self.ACTION_TO_DESCRIPTION
@@ -102,12 +103,12 @@ class NeoProvisioningSdk(NeoSdk):
 
     def _executeProvisioning(self, parameters, payload):
         template_name = parameters[ParamNames.TEMPLATE_NAME]
-        url = self._getRequestURL(template_name)
-        json_data = self._convertInputFileToJSON()
-        response = self._neo_session.post(
-            url,
-            data=json.dumps(json_data),
-            headers=self.REQ_HEADER_CONTENT_JSON)
+        # The payload is given in library mode, instead of the input file
+        if payload is not None:
+            json_data = json.loads(payload)
+        else:
+            json_data = self._convertInputFileToJSON()
+        response = self.__postProvisioning(template_name, json_data)
 
         # If the task is blocking and the job was created successfully,
         # block until the job finish
@@ -117,6 +118,20 @@ class NeoProvisioningSdk(NeoSdk):
 
         return response, self.SHOULD_PRINT_RESPONSE
 
+    def __postProvisioning(self, template_name, json_data):
+        return self._neo_session.post(
+            self._getRequestURL(template_name),
+            data=json.dumps(json_data),
+            headers=self.REQ_HEADER_CONTENT_JSON)
+
+    def executeProvisioning(self, template_name, json_data):
+        """
+        Execute a provisioning template without blocking, and return a
+        JobFuture of the job it created.
+        """
+        return self._submitJob(self.__postProvisioning(template_name,
+                                                       json_data))
+
     def _getTemplateList(self, parameters, payload):
         url = "".join((self._base_url, URL.TEMPLATES_URL))
         response = self._neo_session.get(url)
@@ -150,9 +165,9 @@ class NeoProvisioningSdk(NeoSdk):
             "local_args": dict(local_args)}
 
     def _printData(self, title, data):
-        print "=" * 70
-        print "[*] %s:" % title
-        print data
+        self._print("=" * 70)
+        self._print("[*] %s:" % title)
+        self._print(data)
 
     def _getTemplateDetails(self, parameters, payload):
         template_name = parameters[ParamNames.TEMPLATE_NAME]
@@ -39,7 +39,7 @@ class NeoSWUpgradeSDK(NeoSdk):
     ACTION_TO_EXPECTED_PARAMS = {
         UPGRADE_SOFTWARE: []}
 
-    def __init__(self):
+    def __init__(self, connection=None, **arguments):
         """
         Constructor
         """
@@ -53,7 +53,8 @@ class NeoSWUpgradeSDK(NeoSdk):
             self.UPGRADE_SOFTWARE:
                 (self.PARAM_ARG_NOT_NEEDED, self.PAYLOAD_ARG_NOT_NEEDED)}
 
-        super(NeoSWUpgradeSDK, self).__init__(URL.SW_UPGRADE_URL)
+        super(NeoSWUpgradeSDK, self).__init__(URL.SW_UPGRADE_URL, connection,
+                                              **arguments)
 
     def _getActionToDescription(self):
         return self.ACTION_TO_DESCRIPTION
@@ -0,0 +1,772 @@
+#! /usr/bin/python -u
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+
+@summary:
+    A Local Stand-In For a NEO Server, Used to Benchmark And Test The SDK,
+    cmd_app.py And ActionMngr Without a Live NEO.
+
+    It Implements /neo/login And The REST APIs Used by The SDK (infra/url.py
+    And neo_get_data.RestAPI) Over In-Memory Data, Including a Job Lifecycle
+    With Sub Jobs For Tasks, Provisioning And Software Upgrade Actions.
+    Collections Are Paged by The 'offset' And 'limit' Query Parameters.
+    Latency, Errors, Dropped Connections, Session Expiry And Dataset Size
+    Are Configurable.
+
+    Usage:
+        ./neo_standin_server.py --port <PORT> [--systems <NUM>]
+        [--latency <SECONDS>] [--error-rate <RATE>] [--drop-rate <RATE>]
+
+    Example:
+        ./neo_standin_server.py --port 8080 --systems 200 --latency 0.02
+        ./neo_get_data.py -s 127.0.0.1:8080 -u admin -p 123456 -o systems
+
+@date:   Oct 18, 2026
+"""
+import argparse
+import BaseHTTPServer
+import Queue
+import SocketServer
+import gzip
+import httplib
+import itertools
+import json
+import random
+import threading
+import time
+import urllib
+import urlparse
+import uuid
+from StringIO import StringIO
+from infra.url import URL
+from neo_get_data import RestAPI
+
+
+# ===================== CLASSES SECTION =========================
+
+
+class StandinData(object):
+    """
+    The In-Memory Objects Served by The Stand-In Server
+    """
+
+    TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+    def __init__(self, arguments):
+        self.lock = threading.RLock()
+        self._ids = itertools.count(1)
+        self._job_duration = arguments.job_duration
+        self._job_failure_rate = arguments.job_failure_rate
+
+        self.systems = []
+        self.ports = []
+        for index in xrange(arguments.systems):
+            ip = "10.%d.%d.%d" % (index / 62500, index / 250 % 250,
+                                  index % 250 + 1)
+            self.systems.append({
+                "ip_address": ip,
+                "hostname": "switch-%d" % index,
+                "system_type": "switch",
+                "model": "SN2700",
+                "sw_version": "3.6.1002",
+                "status": "OK" if random.random() > 0.05 else "Error"})
+            for port in xrange(1, arguments.ports_per_system + 1):
+                self.ports.append({
+                    "id": "%s:Eth1/%d" % (ip, port),
+                    "name": "Eth1/%d" % port,
+                    "system": ip,
+                    "state": "Up" if random.random() > 0.1 else "Down",
+                    "speed": "100G"})
+
+        system_ips = [system["ip_address"] for system in self.systems]
+        self.groups = {}
+        for index in xrange(arguments.groups):
+            name = "group-%d" % index
+            self.groups[name] = {
+                "elementName": name,
+                "description": "Stand-in group %d" % index,
+                "members": system_ips[index::arguments.groups]}
+
+        self.users = {"admin": {"username": "admin", "role": "admin"}}
+        self.events = [self._newEvent("System", random.choice(system_ips),
+                                      "Port state changed")
+                       for _ in xrange(arguments.events)] if system_ips \
+            else []
+        self.logs = [self._newLog("INFO", "Stand-in log %d" % index)
+                     for index in xrange(arguments.logs)]
+        self.tasks = {}
+        self.jobs = {}
+        self.event_policies = {}
+        for index in xrange(5):
+            policy_id = str(self._nextId())
+            self.event_policies[policy_id] = {
+                "ID": policy_id, "Type": "Port state changed",
+                "Severity": "Warning", "Enabled": True}
+        self.notifications = {}
+        self.pushed_events = Queue.Queue()
+        self.templates = {
+            "set-vlan": {
+                "title": "set-vlan",
+                "content": ["#<vlan_number>|desc:VLAN number",
+                            "#<<port_name>>|desc:Port name",
+                            "vlan <vlan_number>",
+                            "interface ethernet <<port_name>>"]}}
+
+    def _nextId(self):
+        return next(self._ids)
+
+    def _now(self):
+        return time.strftime(self.TIME_FORMAT)
+
+    def _newEvent(self, object_type, object_id, description):
+        return {"ID": self._nextId(), "Timestamp": self._now(),
+                "Severity": "Info", "Category": object_type,
+                "Object Type": object_type, "Object ID": str(object_id),
+                "Description": description}
+
+    def _newLog(self, level, message):
+        return {"ID": self._nextId(), "Timestamp": self._now(),
+                "Level": level, "Message": message}
+
+    def _addEvent(self, event):
+        self.events.append(event)
+        self.pushed_events.put(event)
+
+    def pushTargets(self):
+        '''
+        Returns the urls of the webhook notification targets
+        '''
+        with self.lock:
+            return [notification["URL"]
+                    for notification in self.notifications.values()
+                    if notification.get("Type") == "Webhook" and
+                    notification.get("URL")]
+
+    # =====================================================================
+    #                    Jobs
+    # =====================================================================
+
+    def createJob(self, description, object_ids):
+        '''
+        Creates a parent job with a sub job per object. Sub jobs finish
+        after a random duration around the configured job duration.
+        '''
+        with self.lock:
+            now = time.time()
+            parent = self._newJob(description, None, object_ids, now)
+            for object_id in object_ids:
+                duration = self._job_duration * random.uniform(0.5, 1.5)
+                self._newJob("%s on %s" % (description, object_id),
+                             parent["ID"], [object_id], now + duration)
+            parent["_end"] = max([job["_end"] for job in
+                                  self.subJobs(parent["ID"])] or [now])
+            return parent
+
+    def _newJob(self, description, parent_id, object_ids, end):
+        job = {"ID": self._nextId(), "Parent ID": parent_id,
+               "Description": description, "Status": "Running",
+               "Progress": 0, "Summary": "",
+               "Creation Time": self._now(), "Completed Time": None,
+               "Related Objects": list(object_ids),
+               "_start": time.time(), "_end": end,
+               "_modified": time.time()}
+        self.jobs[job["ID"]] = job
+        return job
+
+    def subJobs(self, parent_id):
+        return [job for job in self.jobs.itervalues()
+                if job["Parent ID"] == parent_id]
+
+    def tick(self):
+        '''
+        Advances the running jobs according to the current time, and emits
+        an event and a log for every job that finished.
+        '''
+        now = time.time()
+        with self.lock:
+            for job in sorted(self.jobs.itervalues(),
+                              key=lambda job: job["Parent ID"] is None):
+                if job["Status"] != "Running":
+                    continue
+                duration = max(job["_end"] - job["_start"], 0.001)
+                progress = min(
+                    100, int(100 * (now - job["_start"]) / duration))
+                if progress != job["Progress"]:
+                    job["Progress"] = progress
+                    job["_modified"] = now
+                if now < job["_end"]:
+                    continue
+                if job["Parent ID"] is None:
+                    sub_jobs = self.subJobs(job["ID"])
+                    if any(sub_job["Status"] == "Running"
+                           for sub_job in sub_jobs):
+                        continue
+                    failed = any(sub_job["Status"] != "Completed"
+                                 for sub_job in sub_jobs)
+                else:
+                    failed = random.random() < self._job_failure_rate
+                job["Status"] = "Completed With Errors" if failed \
+                    else "Completed"
+                job["Summary"] = "%s: %s" % (job["Description"],
+                                             job["Status"].lower())
+                job["Progress"] = 100
+                job["Completed Time"] = self._now()
+                job["_modified"] = now
+                self._addEvent(self._newEvent(
+                    "Job", job["ID"], "Job %s %s" % (
+                        job["ID"], job["Status"].lower())))
+                self.logs.append(self._newLog(
+                    "WARNING" if failed else "INFO", job["Summary"]))
+
+    @classmethod
+    def public(cls, item):
+        '''
+        Returns an object without its internal ('_' prefixed) attributes
+        '''
+        return dict((key, value) for key, value in item.iteritems()
+                    if not key.startswith("_"))
+
+
+class StandinRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """
+    Handles The REST Requests Sent to The Stand-In Server
+    """
+
+    # Keep-alive connections, like NEO
+    protocol_version = "HTTP/1.1"
+
+    # The status line and the headers are written one by one. Without
+    # TCP_NODELAY, the writes that follow the first one wait for the
+    # delayed ACK of the client (~40ms) on a reused connection.
+    disable_nagle_algorithm = True
+
+    # Set by StandinServer
+    data = None
+    arguments = None
+    sessions = None
+
+    # The query parameters of the current request
+    query = {}
+
+    # The query parameters that are non negative numbers, and their types
+    NUMBER_PARAMETERS = {"since_id": int, "offset": int, "limit": int,
+                         "modified_since": float, "parent_id": int}
+
+    # =====================================================================
+    #                    Request Plumbing
+    # =====================================================================
+
+    def log_message(self, format, *args):
+        if self.arguments.verbose:
+            BaseHTTPServer.BaseHTTPRequestHandler.log_message(
+                self, format, *args)
+
+    def _readBody(self):
+        length = int(self.headers.getheader("Content-Length") or 0)
+        return self.rfile.read(length) if length else ""
+
+    def _readJson(self):
+        body = self._readBody()
+        try:
+            return json.loads(body) if body else {}
+        except ValueError:
+            return None
+
+    def _page(self, items):
+        '''
+        Returns the page of a collection selected by the 'offset' and
+        'limit' query parameters of the request
+        '''
+        offset = int(self.query.get("offset") or 0)
+        limit = self.query.get("limit")
+        if limit:
+            return items[offset:offset + int(limit)]
+        return items[offset:]
+
+    def _checkQuery(self, query):
+        '''
+        Returns an error message if a number parameter of the query isn't
+        a valid number, like NEO answers with a 400 (Bad Request)
+        '''
+        for name, number_type in self.NUMBER_PARAMETERS.iteritems():
+            value = query.get(name)
+            if value is None or (name == "parent_id" and value == "null"):
+                continue
+            try:
+                if number_type(value) < 0:
+                    raise ValueError()
+            except ValueError:
+                return "Invalid value of '%s': %r" % (name, value)
+        return None
+
+    def _send(self, status, body=None, headers={}):
+        if isinstance(body, list) and status == 200:
+            body = self._page(body)
+        if body is None:
+            body = ""
+        elif not isinstance(body, basestring):
+            body = json.dumps(body)
+        headers = dict(headers)
+        accept_encoding = self.headers.getheader("Accept-Encoding") or ""
+        if body and "gzip" in accept_encoding:
+            buf = StringIO()
+            gzip_file = gzip.GzipFile(fileobj=buf, mode="wb")
+            gzip_file.write(body)
+            gzip_file.close()
+            body = buf.getvalue()
+            headers["Content-Encoding"] = "gzip"
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.iteritems():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _injectFaults(self):
+        '''
+        Applies the configured latency and failures. Returns True if the
+        request was already answered (or dropped).
+        '''
+        latency = self.arguments.latency + \
+            random.uniform(0, self.arguments.jitter)
+        if latency:
+            time.sleep(latency)
+        if random.random() < self.arguments.drop_rate:
+            self.close_connection = 1
+            return True
+        if random.random() < self.arguments.error_rate:
+            self._send(503, {"error": "Injected error"})
+            return True
+        return False
+
+    def _isAuthenticated(self):
+        cookies = self.headers.getheader("Cookie") or ""
+        for cookie in cookies.split(";"):
+            name, _, value = cookie.strip().partition("=")
+            if name == "session":
+                expires = self.sessions.get(value)
+                return expires is not None and \
+                    (expires == 0 or expires > time.time())
+        return False
+
+    def _handle(self, method):
+        body = self._readBody() if method in ("POST", "PUT") else ""
+        if self._injectFaults():
+            return
+        parsed_url = urlparse.urlparse(self.path)
+        path = parsed_url.path
+        query = dict((key, values[-1]) for key, values in
+                     urlparse.parse_qs(parsed_url.query,
+                                       keep_blank_values=True).iteritems())
+        self.query = query
+        if not path.startswith(RestAPI.NEO_BASE_URL):
+            return self._send(404, {"error": "Not found"})
+        path = path[len(RestAPI.NEO_BASE_URL):]
+
+        if path == URL.LOGIN_URL and method == "POST":
+            return self._login(body)
+        if not self._isAuthenticated():
+            return self._send(401, {"error": "Not authenticated"})
+        error = self._checkQuery(query)
+        if error is not None:
+            return self._send(400, {"error": error})
+
+        self.data.tick()
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            payload = None
+        with self.data.lock:
+            for prefix, handler in self._routes():
+                if path == prefix or path.startswith(prefix + "/"):
+                    rest = [urllib.unquote(part) for part in
+                            path[len(prefix):].split("/") if part]
+                    return handler(method, rest, query, payload)
+        self._send(404, {"error": "Not found"})
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    def _routes(self):
+        return ((URL.PROVISIONING_URL, self._provisioning),
+                (URL.SW_UPGRADE_URL, self._softwareUpgrade),
+                (RestAPI.SYSTEMS, self._systems),
+                (RestAPI.PORTS, self._ports),
+                (URL.GROUPS_URL, self._groups),
+                (URL.USERS_URL, self._users),
+                (URL.EVENTS_URL, self._events),
+                (RestAPI.LOGS, self._logs),
+                (URL.TASKS_URL, self._tasks),
+                (URL.JOBS_URL, self._jobs),
+                (URL.EVENT_POLICY_URL, self._eventPolicies),
+                (URL.NOTIFICATIONS_URL, self._notifications),
+                (URL.MONITOR_URL, self._monitoring),
+                (URL.TEMPLATES_URL, self._templates))
+
+    # =====================================================================
+    #                    Handlers
+    # =====================================================================
+
+    def _login(self, body):
+        form = urlparse.parse_qs(body)
+        username = form.get("username", [None])[0]
+        password = form.get("password", [None])[0]
+        if (self.arguments.username and
+                username != self.arguments.username) or \
+                (self.arguments.password and
+                 password != self.arguments.password):
+            return self._send(401, {"error": "Wrong user name or password"})
+        session = uuid.uuid4().hex
+        ttl = self.arguments.session_ttl
+        self.sessions[session] = time.time() + ttl if ttl else 0
+        cookie = "session=%s; Path=/" % session
+        if ttl:
+            cookie += "; Max-Age=%d" % ttl
+        self._send(200, "", {"Set-Cookie": cookie})
+
+    def _collection(self, method, rest, payload, items, key):
+        '''
+        Generic handling of a collection of objects stored in a dictionary
+        '''
+        if method == "GET":
+            if not rest:
+                return self._send(200, [StandinData.public(item)
+                                        for item in items.itervalues()])
+            found = [StandinData.public(items[item_id])
+                     for item_id in rest[0].split(",") if item_id in items]
+            if not found:
+                return self._send(404, {"error": "Not found"})
+            return self._send(200, found if "," in rest[0] else found[0])
+        if method == "POST" and not rest:
+            if not isinstance(payload, dict) or \
+                    (key != "ID" and key not in payload):
+                return self._send(400, {"error": "Bad payload"})
+            item = dict(payload)
+            if key == "ID":
+                item["ID"] = str(self.data._nextId())
+            items[str(item[key])] = item
+            return self._send(200, StandinData.public(item))
+        if rest and rest[0] in items:
+            if method == "PUT":
+                if not isinstance(payload, dict):
+                    return self._send(400, {"error": "Bad payload"})
+                items[rest[0]].update(payload)
+                return self._send(200, StandinData.public(items[rest[0]]))
+            if method == "DELETE":
+                del items[rest[0]]
+                return self._send(200, "")
+        self._send(404, {"error": "Not found"})
+
+    def _jobCreated(self, job):
+        job_url = "%s%s/%s" % (RestAPI.NEO_BASE_URL, URL.JOBS_URL, job["ID"])
+        self._send(202, {"JobID": job["ID"], "JobURL": job_url},
+                   {"Location": job_url})
+
+    def _systems(self, method, rest, query, payload):
+        if method != "GET":
+            return self._send(405, {"error": "Method not allowed"})
+        self._send(200, self.data.systems)
+
+    def _ports(self, method, rest, query, payload):
+        if method != "GET":
+            return self._send(405, {"error": "Method not allowed"})
+        self._send(200, self.data.ports)
+
+    def _groups(self, method, rest, query, payload):
+        groups = self.data.groups
+        if len(rest) >= 2 and rest[1] == "members":
+            group = groups.get(rest[0])
+            if group is None:
+                return self._send(404, {"error": "Not found"})
+            if method == "GET":
+                return self._send(200, [{"ip_address": ip}
+                                        for ip in group["members"]])
+            if method == "POST":
+                new_members = payload.values()[0] \
+                    if isinstance(payload, dict) else payload or []
+                group["members"].extend(ip for ip in new_members
+                                        if ip not in group["members"])
+                return self._send(200, "")
+            if method == "DELETE":
+                removed = rest[2].split(",") if len(rest) > 2 \
+                    else list(group["members"])
+                group["members"] = [ip for ip in group["members"]
+                                    if ip not in removed]
+                return self._send(200, "")
+        if method == "GET" and not rest and "system_member" in query:
+            return self._send(200, [
+                StandinData.public(item) for item in groups.itervalues()
+                if query["system_member"] in item["members"]])
+        if method == "POST" and isinstance(payload, dict):
+            payload.setdefault("members", [])
+        self._collection(method, rest, payload, groups, "elementName")
+
+    def _users(self, method, rest, query, payload):
+        self._collection(method, rest, payload, self.data.users, "username")
+
+    def _filterByObjects(self, items, query, attribute):
+        if "object_ids" not in query:
+            return items
+        object_ids = set(query["object_ids"].split(","))
+        return [item for item in items if item[attribute] in object_ids]
+
+    def _events(self, method, rest, query, payload):
+        if method != "GET":
+            return self._send(405, {"error": "Method not allowed"})
+        events = self.data.events
+        if rest:
+            found = [event for event in events
+                     if str(event["ID"]) in rest[0].split(",")]
+            if not found:
+                return self._send(404, {"error": "Not found"})
+            return self._send(200, found[0] if len(found) == 1 else found)
+        if "since_id" in query:
+            since_id = int(query["since_id"])
+            events = [event for event in events if event["ID"] > since_id]
+        self._send(200, self._filterByObjects(events, query, "Object ID"))
+
+    def _logs(self, method, rest, query, payload):
+        if method != "GET":
+            return self._send(405, {"error": "Method not allowed"})
+        logs = self.data.logs
+        if "since_id" in query:
+            since_id = int(query["since_id"])
+            logs = [log for log in logs if log["ID"] > since_id]
+        self._send(200, logs)
+
+    def _tasks(self, method, rest, query, payload):
+        tasks = self.data.tasks
+        if len(rest) == 2 and rest[1] == "run" and method == "POST":
+            task = tasks.get(rest[0])
+            if task is None:
+                return self._send(404, {"error": "Not found"})
+            object_ids = (payload or {}).get("object_ids") or \
+                task.get("object_ids", [])
+            return self._jobCreated(self.data.createJob(
+                task.get("description") or "Task %s" % rest[0],
+                object_ids))
+        self._collection(method, rest, payload, tasks, "ID")
+
+    def _jobs(self, method, rest, query, payload):
+        if method != "GET":
+            return self._send(405, {"error": "Method not allowed"})
+        jobs = self.data.jobs
+        if rest:
+            found = [StandinData.public(jobs[int(job_id)])
+                     for job_id in rest[0].split(",")
+                     if job_id.isdigit() and int(job_id) in jobs]
+            if not found:
+                return self._send(404, {"error": "Not found"})
+            return self._send(200, found if "," in rest[0] else found[0])
+        result = sorted(jobs.itervalues(), key=lambda job: job["ID"])
+        if "parent_id" in query:
+            parent_id = query["parent_id"]
+            parent_id = None if parent_id == "null" else int(parent_id)
+            result = [job for job in result if job["Parent ID"] == parent_id]
+        if "modified_since" in query:
+            modified_since = float(query["modified_since"])
+            result = [job for job in result
+                      if job["_modified"] >= modified_since]
+        if "object_ids" in query:
+            object_ids = set(query["object_ids"].split(","))
+            result = [job for job in result
+                      if object_ids.intersection(job["Related Objects"])]
+        self._send(200, [StandinData.public(job) for job in result])
+
+    def _eventPolicies(self, method, rest, query, payload):
+        self._collection(method, rest, payload, self.data.event_policies,
+                         "ID")
+
+    def _notifications(self, method, rest, query, payload):
+        self._collection(method, rest, payload, self.data.notifications,
+                         "ID")
+
+    def _monitoring(self, method, rest, query, payload):
+        if method != "GET":
+            return self._send(405, {"error": "Method not allowed"})
+        device_ids = query.get("device_ids")
+        systems = device_ids.split(",") if device_ids else \
+            [system["ip_address"] for system in self.data.systems]
+        counters = (query.get("counters") or
+                    "InUcastPkts,OutUcastPkts").split(",")
+        self._send(200, [{"device_id": system, "timestamp": time.time(),
+                          "counters": dict((counter, random.randint(0, 10**9))
+                                           for counter in counters)}
+                         for system in systems])
+
+    def _templates(self, method, rest, query, payload):
+        self._collection(method, rest, payload, self.data.templates, "title")
+
+    def _provisioning(self, method, rest, query, payload):
+        if method != "POST" or len(rest) != 1:
+            return self._send(405, {"error": "Method not allowed"})
+        if rest[0] not in self.data.templates:
+            return self._send(404, {"error": "Template not found"})
+        if not isinstance(payload, dict) or not payload.get("object_ids"):
+            return self._send(400, {"error": "Bad payload"})
+        self._jobCreated(self.data.createJob(
+            "Provisioning %s" % rest[0], payload["object_ids"]))
+
+    def _softwareUpgrade(self, method, rest, query, payload):
+        if method != "POST" or rest:
+            return self._send(405, {"error": "Method not allowed"})
+        if not isinstance(payload, dict) or not payload.get("object_ids"):
+            return self._send(400, {"error": "Bad payload"})
+        self._jobCreated(self.data.createJob("Software upgrade",
+                                             payload["object_ids"]))
+
+
+class StandinServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    """
+    Multi-Threaded Stand-In Server. Jobs Advance In The Background, So
+    Their Completion Events Are Emitted Even If Nobody Polls Them. New
+    Events Are Pushed to The Webhook Notification Targets.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    TICK_INTERVAL = 0.05
+
+    def __init__(self, arguments):
+        self.data = StandinData(arguments)
+
+        class Handler(StandinRequestHandler):
+            data = self.data
+            sessions = {}
+        Handler.arguments = arguments
+
+        BaseHTTPServer.HTTPServer.__init__(
+            self, (arguments.host, arguments.port), Handler)
+        ticker = threading.Thread(target=self._tick)
+        ticker.daemon = True
+        ticker.start()
+        pusher = threading.Thread(target=self._push)
+        pusher.daemon = True
+        pusher.start()
+
+    def _tick(self):
+        while True:
+            self.data.tick()
+            time.sleep(self.TICK_INTERVAL)
+
+    def _push(self):
+        '''
+        Pushes the new events to the webhook notification targets
+        '''
+        while True:
+            event = self.data.pushed_events.get()
+            for target in self.data.pushTargets():
+                url = urlparse.urlsplit(target)
+                try:
+                    connection = httplib.HTTPConnection(url.netloc,
+                                                        timeout=5)
+                    connection.request("POST", url.path or "/",
+                                       json.dumps([event]),
+                                       {"Content-Type": "application/json"})
+                    connection.getresponse().read()
+                    connection.close()
+                except (IOError, httplib.HTTPException):
+                    pass
+
+# ==================== END OF CLASSES SECTION ===================
+
+
+# ====================== FUNCTIONS SECTION ======================
+
+def parseArgs(args=None):
+    '''
+    @summary:
+        this method parses the stand-in server command line
+        arguments
+    '''
+    parser = argparse.ArgumentParser()
+
+    server = parser.add_argument_group('server')
+    server.add_argument("--host", action="store", default="127.0.0.1",
+                        help="Address to listen on")
+    server.add_argument("--port", action="store", type=int, default=8080,
+                        help="Port to listen on")
+    server.add_argument("--username", action="store", default=None,
+                        help="Accepted user name (default: any)")
+    server.add_argument("--password", action="store", default=None,
+                        help="Accepted password (default: any)")
+    server.add_argument("--session-ttl", action="store", type=int,
+                        default=0,
+                        help="Session lifetime in seconds (default: never "
+                             "expires)")
+    server.add_argument("-v", "--verbose", action="store_true",
+                        default=False, help="Log every request")
+
+    dataset = parser.add_argument_group('dataset')
+    dataset.add_argument("--systems", action="store", type=int, default=50,
+                         help="Number of systems")
+    dataset.add_argument("--ports-per-system", action="store", type=int,
+                         default=32, help="Number of ports of each system")
+    dataset.add_argument("--groups", action="store", type=int, default=5,
+                         help="Number of groups")
+    dataset.add_argument("--events", action="store", type=int, default=1000,
+                         help="Number of initial events")
+    dataset.add_argument("--logs", action="store", type=int, default=1000,
+                         help="Number of logs")
+    dataset.add_argument("--job-duration", action="store", type=float,
+                         default=2.0,
+                         help="Average duration of a sub job in seconds")
+    dataset.add_argument("--job-failure-rate", action="store", type=float,
+                         default=0.0,
+                         help="Probability of a sub job to fail")
+
+    faults = parser.add_argument_group('fault injection')
+    faults.add_argument("--latency", action="store", type=float, default=0,
+                        help="Latency added to every response in seconds")
+    faults.add_argument("--jitter", action="store", type=float, default=0,
+                        help="Maximum random latency added on top of "
+                             "--latency in seconds")
+    faults.add_argument("--error-rate", action="store", type=float,
+                        default=0,
+                        help="Probability of answering 503 to a request")
+    faults.add_argument("--drop-rate", action="store", type=float,
+                        default=0,
+                        help="Probability of closing the connection "
+                             "without answering")
+
+    return parser.parse_args(args)
+
+
+def execute(arguments):
+    '''
+    @summary: Main Execution Method
+    '''
+    server = StandinServer(arguments)
+    print("[*] NEO stand-in server listening on %s:%d" %
+          (arguments.host, server.server_address[1]))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+# =================== END OF FUNCTIONS SECTION ==================
+
+
+if __name__ == "__main__":
+    args = parseArgs()
+    execute(args)
@@ -0,0 +1,146 @@
+#! /usr/bin/python -u
+"""
+@copyright:
+    Copyright (C) Mellanox Technologies Ltd. 2014-2015. ALL RIGHTS RESERVED.
+
+    This software product is a proprietary product of Mellanox Technologies
+    Ltd. (the "Company") and all right, title, and interest in and to the
+    software product, including all associated intellectual property rights,
+    are and shall remain exclusively with the Company.
+
+    This software product is governed by the End User License Agreement
+    provided with the software product.
+
+@summary:
+    Incremental Sync of NEO Events, Jobs And Logs. Every Run Fetches Only
+    The Records That Are New Since The Previous Run, And Appends Them as
+    JSON Lines to a Local Store File (or Writes Them to The Standard
+    Output), So a Run Costs O(New Records) Instead of O(History).
+
+    Where The Previous Run Stopped Is Kept in a Cursor File Per NEO Server,
+    User And Collection, Under ~/.neo_sdk/cursors. The First Run Fetches
+    The Whole Collection. Jobs Are Fetched Again When Their Status or
+    Progress Change, So The Store Holds The Successive Versions of a Job.
+
+    Usage:
+        ./neo_sync.py --server <NEO SERVER> --username <USER NAME>
+        --password <USER PASSWORD> --option <events | jobs | logs>
+        [--store <FILE>] [--reset]
+
+    Example (e.g. from cron):
+        ./neo_sync.py -s 10.0.0.1 -u admin -p 123456 -o events
+            --store /var/lib/neo/events.jsonl
+
+@date:   Oct 18, 2026
+"""
+import os
+import sys
+import json
+import argparse
+from infra.neo_connection import NeoConnection
+from infra.sync_cursor import SyncCursor
+from infra.incremental_sync import SYNC_COLLECTIONS
+
+NEO_BASE_URL = "/neo"
+
+
+def parseArgs():
+    '''
+    @summary:
+        this method parses SDK command line
+        arguments
+    '''
+    parser = argparse.ArgumentParser()
+
+    connection = parser.add_argument_group('connection')
+    connection.add_argument("-s", "--server", action="store",
+                            required=True, default=None,
+                            help="NEO server IP address")
+    connection.add_argument("-u", "--username", action="store",
+                            required=True, default=None,
+                            help="NEO user name")
+    connection.add_argument("-p", "--password", action="store",
+                            required=True, default=None,
+                            help="NEO user password")
+    connection.add_argument("-r", "--protocol", action="store", required=False,
+                            default="http", choices=['http', 'https'],
+                            help="Protocol (http or https)")
+    connection.add_argument("-z", "--compress", action="store_true",
+                            required=False, default=False,
+                            help="Request gzip/deflate compressed responses")
+
+    sync = parser.add_argument_group('sync')
+    sync.add_argument("-o", "--option", action="store", required=True,
+                      choices=sorted(SYNC_COLLECTIONS), default=None,
+                      help="Specify which records to sync")
+    sync.add_argument("--store", action="store", required=False,
+                      default=None, metavar="FILE",
+                      help="JSON lines file to append the new records to "
+                           "(default: the standard output)")
+    sync.add_argument("--cursor-dir", action="store", required=False,
+                      default=SyncCursor.CURSOR_DIR,
+                      help="Directory of the cursor files (default: "
+                           "%(default)s)")
+    sync.add_argument("--reset", action="store_true", required=False,
+                      default=False,
+                      help="Forget the previous runs, and fetch all the "
+                           "records")
+
+    return parser.parse_args()
+
+
+def sync(neo_session, option, cursor, store):
+    '''
+    @summary:
+        Appends the records that are new since the cursor to the store (a
+        file object), and moves the cursor once they're on disk. Returns
+        the number of new records.
+    '''
+    url, sync_class = SYNC_COLLECTIONS[option]
+    collection_sync = sync_class(neo_session, NEO_BASE_URL + url, cursor)
+
+    def storeRecord(record):
+        store.write(json.dumps(record) + "\n")
+
+    count = collection_sync.run(storeRecord)
+    store.flush()
+    if store is not sys.stdout:
+        os.fsync(store.fileno())
+    collection_sync.commit()
+    return count
+
+
+def execute(arguments):
+    '''
+    @summary: Main Execution Method
+    '''
+    cursor = SyncCursor(arguments.username, arguments.server,
+                        arguments.option, protocol=arguments.protocol,
+                        cursor_dir=arguments.cursor_dir)
+    if arguments.reset:
+        cursor.reset()
+
+    store = sys.stdout
+    try:
+        if arguments.store:
+            store = open(arguments.store, "a")
+        neo_session = NeoConnection(arguments.username,
+                                    arguments.password,
+                                    arguments.server,
+                                    port=80,
+                                    protocol=arguments.protocol,
+                                    compress=arguments.compress)
+        count = sync(neo_session, arguments.option, cursor, store)
+    except Exception as exc:
+        sys.stderr.write("-E- Got an error while syncing %s: %s\n" %
+                         (arguments.option, exc))
+        sys.exit(1)
+    finally:
+        if store is not sys.stdout:
+            store.close()
+    sys.stderr.write("[*] %d new %s\n" % (count, arguments.option))
+
+
+if __name__ == "__main__":
+    args = parseArgs()
+    execute(args)
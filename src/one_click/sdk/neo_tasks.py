@@ -57,7 +57,7 @@ class NeoTasksSdk(NeoSdk):
         DELETE_TASK: [ParamNames.TASK_ID],
         RUN_TASK: [ParamNames.TASK_ID]}
 
-    def __init__(self):
+    def __init__(self, connection=None, **arguments):
         """
         Constructor
         """
@@ -83,7 +83,8 @@ class NeoTasksSdk(NeoSdk):
             self.RUN_TASK:
                 (self.PARAM_ARG_NEEDED, self.PAYLOAD_ARG_NOT_NEEDED)}
 
-        super(NeoTasksSdk, self).__init__(URL.TASKS_URL)
+        super(NeoTasksSdk, self).__init__(URL.TASKS_URL, connection,
+                                          **arguments)
 
     def _getActionToDescription(self):
         return self.ACTION_TO_DESCRIPTION
@@ -130,7 +131,7 @@ class NeoTasksSdk(NeoSdk):
         """
         Get all tasks.
         """
-        response = self._neo_session.get(self._action_url)
+        response = self._getCollection(self._action_url)
         return response, self.SHOULD_PRINT_RESPONSE
 
     def __deleteTask(self, parameters, payload):
@@ -150,18 +151,16 @@ class NeoTasksSdk(NeoSdk):
         Otherwise, it's the user's responsibility to check the job status.
         """
         task = parameters[ParamNames.TASK_ID]
-        url = self._getRequestURL(task)
 
         # In case no file was given, run the task without payload,
         # Otherwise, add the payload (file content) to the request.
-        if self._arguments.file is None:
-            response = self._neo_session.post("/".join([url, "run"]))
-        else:
+        json_data = None
+        if payload is not None:
+            # Library mode
+            json_data = json.loads(payload)
+        elif self._arguments.file is not None:
             json_data = self._convertInputFileToJSON()
-            response = self._neo_session.post(
-                "/".join([url, "run"]),
-                data=json.dumps(json_data),
-                headers=self.REQ_HEADER_CONTENT_JSON)
+        response = self.__postRunTask(task, json_data)
 
         # If the task is blocking and the job was created successfully,
         # block until the job finish
@@ -171,6 +170,22 @@ class NeoTasksSdk(NeoSdk):
 
         return response, self.SHOULD_PRINT_RESPONSE
 
+    def __postRunTask(self, task, json_data=None):
+        url = "/".join([self._getRequestURL(task), "run"])
+        if json_data is None:
+            return self._neo_session.post(url)
+        return self._neo_session.post(
+            url,
+            data=json.dumps(json_data),
+            headers=self.REQ_HEADER_CONTENT_JSON)
+
+    def runTask(self, task, json_data=None):
+        """
+        Run a specific task without blocking, and return a JobFuture of
+        the job it created.
+        """
+        return self._submitJob(self.__postRunTask(task, json_data))
+
     def _addSessionArgs(self, parser):
         option_help = """
             Actions:
@@ -227,6 +242,7 @@ class NeoTasksSdk(NeoSdk):
         self._addOptionArg(parser, option_help, self._getActionOptions())
         self._addParamAndPayloadArgs(parser)
         self._addFileArg(parser, file_help)
+        self._addPagingArgs(parser)
         self._addBlockingArg(parser)
 
     def _validateArgs(self, action):
@@ -55,7 +55,7 @@ class NeoUsersSdk(NeoSdk):
         UPDATE_USER: [ParamNames.USERNAME],
         DELETE_USER: [ParamNames.USERNAME]}
 
-    def __init__(self):
+    def __init__(self, connection=None, **arguments):
 
         # Map each action to its execute function
         self.ACTION_TO_FUNCTION = {
@@ -78,7 +78,8 @@ class NeoUsersSdk(NeoSdk):
             self.DELETE_USER:
                 (self.PARAM_ARG_NEEDED, self.PAYLOAD_ARG_NOT_NEEDED)}
 
-        super(NeoUsersSdk, self).__init__(URL.USERS_URL)
+        super(NeoUsersSdk, self).__init__(URL.USERS_URL, connection,
+                                          **arguments)
 
     def _getActionToDescription(self):
         return self.ACTION_TO_DESCRIPTION